@@ -0,0 +1,274 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+from time import sleep, time
+from os import PathLike
+import threading
+import types
+import sys
+import os
+
+import orjson
+
+#==========================================================================================#
+# >>>>> ИМИТАЦИЯ NEUROHUB <<<<< #
+#==========================================================================================#
+
+class FakeNeuroHubResponse:
+	"""Ответ имитации NeuroHub."""
+
+	def __init__(self, text: str):
+		"""
+		Ответ имитации NeuroHub.
+
+		:param text: Сгенерированный текст.
+		:type text: str
+		"""
+
+		self.status_code = 200
+		self.json = {"text": text}
+
+class FakeNeuroHubOptions:
+	"""Опции имитации клиента NeuroHub. Все настройки игнорируются."""
+
+	def select_source(self, source: str): pass
+
+	def set_model(self, model: str): pass
+
+	def set_force_proxy(self, status: bool): pass
+
+class FakeNeuroHubRequestor:
+	"""Имитация клиента NeuroHub: отвечает на запрос через заданное время, возвращая переданный текст в верхнем регистре."""
+
+	LATENCY = 0.5
+
+	def __init__(self, options: FakeNeuroHubOptions, port: int):
+		"""
+		Имитация клиента NeuroHub.
+
+		:param options: Опции клиента.
+		:type options: FakeNeuroHubOptions
+		:param port: Порт общения.
+		:type port: int
+		"""
+
+		pass
+
+	def generate(self, prompt: str) -> FakeNeuroHubResponse:
+		"""
+		Имитирует генерацию текста.
+
+		:param prompt: Полный текст запроса.
+		:type prompt: str
+		:return: Ответ.
+		:rtype: FakeNeuroHubResponse
+		"""
+
+		sleep(FakeNeuroHubRequestor.LATENCY)
+
+		return FakeNeuroHubResponse(prompt.split("\n", 1)[-1].upper())
+
+def InstallFakeNeuroHub(latency: float):
+	"""
+	Подменяет клиент NeuroHub имитацией до импорта переводчика, чтобы переводы не обращались к нейросетям.
+
+	:param latency: Время ответа на один запрос в секундах.
+	:type latency: float
+	"""
+
+	FakeNeuroHubRequestor.LATENCY = latency
+	Module = types.ModuleType("Source.NeuroHub.Connection.API")
+	Module.Options = FakeNeuroHubOptions
+	Module.Requestor = FakeNeuroHubRequestor
+
+	for Name in ("Source.NeuroHub", "Source.NeuroHub.Connection"): sys.modules[Name] = types.ModuleType(Name)
+	sys.modules["Source.NeuroHub.Connection.API"] = Module
+
+#==========================================================================================#
+# >>>>> ИМИТАЦИЯ TELEGRAM BOT API <<<<< #
+#==========================================================================================#
+
+class FakeTelegramRequestHandler(BaseHTTPRequestHandler):
+	"""Обработчик запросов имитации Telegram Bot API."""
+
+	protocol_version = "HTTP/1.1"
+	disable_nagle_algorithm = True
+
+	def do_GET(self):
+		"""Обрабатывает запрос метода или скачивание файла."""
+
+		self.__Handle()
+
+	def do_POST(self):
+		"""Обрабатывает запрос метода."""
+
+		self.__Handle()
+
+	def log_message(self, format: str, *args):
+		"""Отключает вывод журнала запросов."""
+
+		pass
+
+	def __Handle(self):
+		"""Отвечает на запрос с задержкой имитации."""
+
+		Telegram: "FakeTelegram" = self.server.telegram
+		URL = urlsplit(self.path)
+		Length = int(self.headers.get("Content-Length", 0))
+		if Length: self.rfile.read(Length)
+		sleep(Telegram.latency)
+
+		if URL.path.startswith("/file/"):
+			Data = Telegram.get_file(os.path.basename(URL.path))
+			self.__Respond(Data, "audio/ogg")
+			return
+
+		Method = URL.path.rsplit("/", 1)[-1]
+		Parameters = {Key: Values[0] for Key, Values in parse_qs(URL.query).items()}
+		self.__Respond(orjson.dumps({"ok": True, "result": Telegram.call(Method, Parameters)}), "application/json")
+
+	def __Respond(self, body: bytes | None, content_type: str):
+		"""
+		Отправляет ответ.
+
+		:param body: Тело ответа. При `None` отправляется ответ с кодом 404.
+		:type body: bytes | None
+		:param content_type: Тип содержимого.
+		:type content_type: str
+		"""
+
+		self.send_response(200 if body is not None else 404)
+		self.send_header("Content-Type", content_type)
+		self.send_header("Content-Length", str(len(body or b"")))
+		self.end_headers()
+		if body: self.wfile.write(body)
+
+class FakeTelegram:
+	"""Локальная имитация Telegram Bot API: принимает запросы бота с заданной задержкой и отдаёт аудиосообщения из каталога образцов."""
+
+	#==========================================================================================#
+	# >>>>> СВОЙСТВА <<<<< #
+	#==========================================================================================#
+
+	@property
+	def api_url(self) -> str:
+		"""Шаблон адреса методов для `telebot.apihelper.API_URL`."""
+
+		return f"http://{self.__Host}:{self.__Port}/bot{{0}}/{{1}}"
+
+	@property
+	def file_url(self) -> str:
+		"""Шаблон адреса файлов для `telebot.apihelper.FILE_URL`."""
+
+		return f"http://{self.__Host}:{self.__Port}/file/bot{{0}}/{{1}}"
+
+	@property
+	def latency(self) -> float:
+		"""Задержка ответа в секундах."""
+
+		return self.__Latency
+
+	@property
+	def requests(self) -> dict[str, int]:
+		"""Количество запросов каждого метода."""
+
+		with self.__Lock: return self.__Requests.copy()
+
+	@property
+	def samples(self) -> tuple[str]:
+		"""ID доступных аудиосообщений в порядке возрастания."""
+
+		return tuple(sorted(self.__Samples.keys()))
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __init__(self, samples: PathLike, latency: float = 0.05, host: str = "127.0.0.1", port: int = 0):
+		"""
+		Локальная имитация Telegram Bot API. Запускается в фоновом потоке.
+
+		:param samples: Каталог аудиосообщений *.ogg. ID файла совпадает с именем файла без расширения.
+		:type samples: PathLike
+		:param latency: Задержка ответа в секундах.
+		:type latency: float
+		:param host: Адрес для прослушивания.
+		:type host: str
+		:param port: Порт для прослушивания. При `0` выбирается свободный порт.
+		:type port: int
+		"""
+
+		self.__Samples = {os.path.splitext(File)[0]: os.path.join(samples, File) for File in os.listdir(samples) if File.endswith(".ogg")}
+		self.__Files: dict[str, bytes] = dict()
+		self.__Latency = latency
+
+		self.__Lock = threading.Lock()
+		self.__Requests: dict[str, int] = dict()
+		self.__MessageID = 0
+
+		self.__Server = ThreadingHTTPServer((host, port), FakeTelegramRequestHandler)
+		self.__Server.daemon_threads = True
+		self.__Server.telegram = self
+		self.__Host, self.__Port = self.__Server.server_address[:2]
+
+		self.__Thread = threading.Thread(target = self.__Server.serve_forever, name = "FakeTelegram", daemon = True)
+		self.__Thread.start()
+
+	def call(self, method: str, parameters: dict[str, str]) -> dict | bool:
+		"""
+		Возвращает результат метода Bot API.
+
+		:param method: Название метода.
+		:type method: str
+		:param parameters: Параметры запроса.
+		:type parameters: dict[str, str]
+		:return: Результат метода.
+		:rtype: dict | bool
+		"""
+
+		with self.__Lock:
+			self.__Requests[method] = self.__Requests.get(method, 0) + 1
+			self.__MessageID += 1
+			MessageID = self.__MessageID
+
+		match method:
+
+			case "getMe": return {"id": 1, "is_bot": True, "first_name": "Benchmark", "username": "benchmark_bot"}
+
+			case "getFile":
+				FileID = parameters.get("file_id", "")
+				return {"file_id": FileID, "file_unique_id": FileID, "file_size": len(self.get_file(f"{FileID}.ogg") or b""), "file_path": f"voice/{FileID}.ogg"}
+
+			case "sendMessage" | "editMessageText":
+				return {
+					"message_id": MessageID,
+					"date": int(time()),
+					"chat": {"id": int(parameters.get("chat_id", 0)), "type": "private"},
+					"text": parameters.get("text", "")
+				}
+
+		return True
+
+	def close(self):
+		"""Останавливает сервер."""
+
+		self.__Server.shutdown()
+		self.__Server.server_close()
+
+	def get_file(self, name: str) -> bytes | None:
+		"""
+		Возвращает содержимое аудиосообщения.
+
+		:param name: Имя файла.
+		:type name: str
+		:return: Содержимое файла или `None`, если он не найден.
+		:rtype: bytes | None
+		"""
+
+		FileID = os.path.splitext(name)[0]
+		if FileID not in self.__Samples: return None
+
+		with self.__Lock:
+			if FileID not in self.__Files:
+				with open(self.__Samples[FileID], "rb") as FileReader: self.__Files[FileID] = FileReader.read()
+
+			return self.__Files[FileID]
@@ -0,0 +1,198 @@
+from Source.Core.Moderator import ModerationVerdicts, Moderator
+from Source.Core.Translator import Translator
+from Source.Core.Dispatcher import Dispatcher
+from Source.Core.Decoder import DecoderBackends
+from Source.Core.Users import CachedUsersManager
+from Source.Core.Segmenter import Segmenter
+from Source.Core.Speecher import Speecher
+from Source import Functions
+
+from Benchmarks.Fakes import FakeTelegram
+
+from typing import Any
+import tempfile
+import shutil
+import re
+import os
+
+from badwords import ProfanityFilter
+from telebot import TeleBot, apihelper, types
+
+PHRASES = (
+	"Привет! Как прошёл твой день?",
+	"Завтра мы идём в кино, присоединяйся.",
+	"Этот фильм оказался гораздо лучше, чем я ожидал.",
+	"Напомни, пожалуйста, во сколько начинается встреча.",
+	"Я купил новый телефон, и он работает очень быстро.",
+	"Погода сегодня отличная, давай прогуляемся по парку.\nА вечером можно заказать пиццу."
+)
+
+class Pipelines:
+	"""Обработка текста и аудиосообщений теми же функциями и объектами, что и в обработчиках бота, но с имитациями Telegram и NeuroHub."""
+
+	#==========================================================================================#
+	# >>>>> СВОЙСТВА <<<<< #
+	#==========================================================================================#
+
+	@property
+	def is_voice_supported(self) -> bool:
+		"""Состояние: доступна ли модель распознавания речи."""
+
+		return self.__Speecher is not None
+
+	#==========================================================================================#
+	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __Auth(self, index: int) -> "UserData":
+		"""
+		Авторизует пользователя запроса.
+
+		:param index: Номер запроса.
+		:type index: int
+		:return: Данные пользователя.
+		:rtype: UserData
+		"""
+
+		UserID = 1 + index % self.__UsersCount
+		User = self.__Users.auth(types.User(UserID, False, "Benchmark", username = f"user{UserID}", language_code = "ru"))
+		User.set_property("mode", "to", force = False)
+
+		return User
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __init__(self, settings: dict[str, Any], telegram: FakeTelegram, users: int = 1000, voice_share: float = 0.2, workers: int = 16):
+		"""
+		Обработка текста и аудиосообщений для тестирования производительности.
+
+		Переводчик, модератор и преобразователь голоса в речь настраиваются по _Settings.json_, однако кэши результатов отключаются, а лимиты частоты отправки сообщений снимаются, чтобы измерялась сама обработка.
+
+		:param settings: Настройки бота.
+		:type settings: dict[str, Any]
+		:param telegram: Имитация Telegram Bot API.
+		:type telegram: FakeTelegram
+		:param users: Количество различных пользователей, от имени которых отправляются запросы.
+		:type users: int
+		:param voice_share: Доля аудиосообщений в смешанной нагрузке.
+		:type voice_share: float
+		:param workers: Количество потоков отправки сообщений.
+		:type workers: int
+		"""
+
+		apihelper.API_URL = telegram.api_url
+		apihelper.FILE_URL = telegram.file_url
+
+		self.__UsersCount = max(users, 1)
+		self.__VoiceShare = min(max(voice_share, 0.0), 1.0)
+		self.__Directory = tempfile.mkdtemp(prefix = "benchmark-")
+		self.__Samples = telegram.samples
+
+		NeuroHubOptions: dict = settings["neurohub"]
+		self.__Translator = Translator()
+		self.__Translator.set_neurohub_options(
+			port = NeuroHubOptions["port"],
+			source = NeuroHubOptions["source"],
+			model = NeuroHubOptions["model"],
+			force_proxy = NeuroHubOptions["force_proxy"],
+			timeout = NeuroHubOptions["timeout"],
+			workers = settings["threads"],
+			max_in_flight = NeuroHubOptions["max_in_flight"]
+		)
+
+		self.__Translator.set_chunking(
+			size = NeuroHubOptions["chunking"]["size"],
+			parallelism = NeuroHubOptions["chunking"]["parallelism"],
+			retries = NeuroHubOptions["chunking"]["retries"]
+		)
+
+		if NeuroHubOptions["batching"]["enabled"]: self.__Translator.set_batching(
+			window = NeuroHubOptions["batching"]["window"],
+			size = NeuroHubOptions["batching"]["size"],
+			characters = NeuroHubOptions["batching"]["characters"]
+		)
+
+		ProfanityFilterObject = ProfanityFilter()
+		ProfanityFilterObject.init(["ru", "en"])
+		self.__Moderator = Moderator("Data/Materials/Text/blacklist_strings.txt", ProfanityFilterObject)
+		self.__Outbound = Dispatcher(TeleBot("0:benchmark", threaded = False), rate = 1000000, chat_rate = 1000000, chat_burst = 1000000, workers = workers)
+		self.__Users = CachedUsersManager(self.__Directory, settings["users"]["flush_interval"])
+		self.__Speecher = None
+
+		RecognitionOptions: dict = settings["recognition"]
+		SegmentationOptions: dict = RecognitionOptions["segmentation"]
+		DecoderOptions: dict = settings["decoder"]
+
+		if os.path.exists(f"Data/VOSK/{settings['vosk_model']}"): self.__Speecher = Speecher(
+			settings["vosk_model"],
+			use_ffmpeg = settings["use_ffmpeg"],
+			workers = RecognitionOptions["workers"],
+			queue_size = RecognitionOptions["queue_size"],
+			timeout = RecognitionOptions["timeout"],
+			segmenter = Segmenter(SegmentationOptions["segment"], SegmentationOptions["overlap"]) if SegmentationOptions["segment"] else None,
+			parallelism = SegmentationOptions["parallelism"],
+			recognizers = RecognitionOptions["recognizers"],
+			warmup = RecognitionOptions["warmup"],
+			decoder = DecoderBackends(DecoderOptions["backend"]) if DecoderOptions["backend"] else None,
+			tempo = DecoderOptions["tempo"]
+		)
+
+	def close(self):
+		"""Останавливает используемые объекты и удаляет временные данные пользователей."""
+
+		self.__Users.close()
+		self.__Outbound.close()
+		self.__Translator.close()
+		if self.__Speecher: self.__Speecher.close()
+		shutil.rmtree(self.__Directory, ignore_errors = True)
+
+	def mixed(self, index: int):
+		"""
+		Обрабатывает запрос смешанной нагрузки: аудиосообщения равномерно чередуются с текстом в заданной доле.
+
+		:param index: Номер запроса.
+		:type index: int
+		"""
+
+		if int((index + 1) * self.__VoiceShare) > int(index * self.__VoiceShare): self.voice(index)
+		else: self.text(index)
+
+	def text(self, index: int):
+		"""
+		Обрабатывает текстовое сообщение: авторизация, модерация, перевод и отправка ответа.
+
+		:param index: Номер запроса.
+		:type index: int
+		"""
+
+		User = self.__Auth(index)
+		Text = f"{PHRASES[index % len(PHRASES)]} ({index})"
+		Moderation = Functions.CheckBlacklist(Text, self.__Outbound, None, User, self.__Moderator, autosend = False)
+		if Moderation["verdict"] != ModerationVerdicts.Clean: return
+
+		self.__Outbound.send_chat_action(User.id, "typing")
+		Functions.TranslateText(self.__Outbound, User, self.__Translator, Text)
+
+	def voice(self, index: int):
+		"""
+		Обрабатывает аудиосообщение: авторизация, скачивание, распознавание и отправка ответа.
+
+		:param index: Номер запроса.
+		:type index: int
+		"""
+
+		User = self.__Auth(index)
+		Name = self.__Samples[index % len(self.__Samples)]
+		Duration = re.search(r"(\d+)s$", Name)
+		Message = types.Message.de_json({
+			"message_id": index + 1,
+			"date": 0,
+			"chat": {"id": User.id, "type": "private"},
+			"from": {"id": User.id, "is_bot": False, "first_name": "Benchmark"},
+			"voice": {"file_id": Name, "file_unique_id": f"{Name}-{index}", "duration": int(Duration[1]) if Duration else 0}
+		})
+
+		Text = Functions.RecognizeVoice(self.__Outbound, self.__Speecher, Message.voice)
+		Functions.SendRecognizedText(self.__Outbound, User, Message, Text)
@@ -0,0 +1,94 @@
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from typing import Callable
+import statistics
+import itertools
+import traceback
+
+class Runner:
+	"""Измеряет пропускную способность и задержки сценария при заданном количестве одновременных запросов."""
+
+	#==========================================================================================#
+	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __Call(self, function: Callable[[int], None]) -> tuple[float, bool]:
+		"""
+		Выполняет один запрос сценария.
+
+		:param function: Сценарий, принимающий номер запроса.
+		:type function: Callable[[int], None]
+		:return: Длительность запроса в секундах и состояние: завершился ли он без исключения.
+		:rtype: tuple[float, bool]
+		"""
+
+		Index = next(self.__Counter)
+		Started = perf_counter()
+
+		try:
+			function(Index)
+			IsSuccessful = True
+
+		except Exception:
+			if self.__Verbose: traceback.print_exc()
+			IsSuccessful = False
+
+		return perf_counter() - Started, IsSuccessful
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __init__(self, verbose: bool = False):
+		"""
+		Измеряет пропускную способность и задержки сценария.
+
+		Номера запросов сквозные для всех замеров, поэтому тексты и ID аудиосообщений не повторяются между уровнями нагрузки.
+
+		:param verbose: Указывает, нужно ли выводить трассировку исключений запросов.
+		:type verbose: bool
+		"""
+
+		self.__Verbose = verbose
+		self.__Counter = itertools.count()
+
+	def measure(self, function: Callable[[int], None], concurrency: int, requests: int, warmup: int = 0) -> dict:
+		"""
+		Выполняет запросы сценария в заданном количестве потоков и возвращает результаты замера.
+
+		:param function: Сценарий, принимающий номер запроса.
+		:type function: Callable[[int], None]
+		:param concurrency: Количество одновременных запросов.
+		:type concurrency: int
+		:param requests: Количество измеряемых запросов.
+		:type requests: int
+		:param warmup: Количество предварительных запросов, не учитываемых в результатах.
+		:type warmup: int
+		:return: Количество запросов и ошибок, длительность замера в секундах, пропускная способность в запросах в секунду и задержки в миллисекундах.
+		:rtype: dict
+		"""
+
+		with ThreadPoolExecutor(max_workers = max(concurrency, 1), thread_name_prefix = "Benchmark") as Executor:
+			list(Executor.map(lambda _: self.__Call(function), range(warmup)))
+
+			Started = perf_counter()
+			Results = list(Executor.map(lambda _: self.__Call(function), range(requests)))
+			Duration = perf_counter() - Started
+
+		Latencies = sorted(Latency * 1000 for Latency, _ in Results)
+		Quantiles = statistics.quantiles(Latencies, n = 100, method = "inclusive") if len(Latencies) > 1 else Latencies * 99
+
+		return {
+			"concurrency": concurrency,
+			"requests": requests,
+			"errors": sum(1 for _, IsSuccessful in Results if not IsSuccessful),
+			"duration": round(Duration, 3),
+			"throughput": round(requests / Duration, 3) if Duration else 0.0,
+			"latency": {
+				"mean": round(statistics.fmean(Latencies), 3),
+				"p50": round(Quantiles[49], 3),
+				"p95": round(Quantiles[94], 3),
+				"p99": round(Quantiles[98], 3),
+				"max": round(Latencies[-1], 3)
+			}
+		}
@@ -0,0 +1,199 @@
+from Benchmarks.Fakes import FakeTelegram, InstallFakeNeuroHub
+from Benchmarks.Runner import Runner
+
+from dublib.CLI.Terminalyzer import Command, ParametersTypes, Terminalyzer
+from dublib.Engine.Configurator import Config
+
+from datetime import datetime
+import subprocess
+import platform
+import sys
+import os
+
+import orjson
+
+#==========================================================================================#
+# >>>>> ОПИСАНИЕ КОМАНД <<<<< #
+#==========================================================================================#
+
+COMMANDS: list[Command] = list()
+
+Com = Command("run", "Измеряет пропускную способность и задержки обработки сообщений с имитациями Telegram и NeuroHub.")
+Com.base.add_key("scenarios", description = "Сценарии через запятую: text, voice, mixed (по умолчанию все).")
+Com.base.add_key("concurrency", description = "Уровни одновременных запросов через запятую (по умолчанию 1,4,16).")
+Com.base.add_key("requests", ParametersTypes.Number, "Количество измеряемых запросов на каждый уровень (по умолчанию 100).")
+Com.base.add_key("users", ParametersTypes.Number, "Количество различных пользователей (по умолчанию 1000).")
+Com.base.add_key("latency", description = "Время ответа NeuroHub в секундах (по умолчанию 0.2).")
+Com.base.add_key("api-latency", description = "Время ответа Telegram Bot API в секундах (по умолчанию 0.02).")
+Com.base.add_key("voice-share", description = "Доля аудиосообщений в смешанной нагрузке (по умолчанию 0.2).")
+Com.base.add_key("output", description = "Путь к файлу результатов (по умолчанию Benchmarks/Results/<время>.json).")
+Com.base.add_key("compare", description = "Путь к файлу результатов предыдущего запуска для сравнения.")
+Com.base.add_flag("verbose", "Выводит трассировку исключений запросов.")
+COMMANDS.append(Com)
+
+Com = Command("compare", "Сравнивает результаты двух запусков.")
+ComPos = Com.create_position("BASELINE", "Файл результатов предыдущего запуска.", important = True)
+ComPos.add_argument()
+ComPos = Com.create_position("RESULTS", "Файл результатов нового запуска.", important = True)
+ComPos.add_argument()
+COMMANDS.append(Com)
+
+SCENARIOS = ("text", "voice", "mixed")
+
+#==========================================================================================#
+# >>>>> ВСПОМОГАТЕЛЬНЫЕ ФУНКЦИИ <<<<< #
+#==========================================================================================#
+
+def GetCommit() -> str | None:
+	"""
+	Возвращает сокращённый хэш текущего коммита.
+
+	:return: Хэш коммита или `None`, если он недоступен.
+	:rtype: str | None
+	"""
+
+	try: return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output = True, text = True, check = True).stdout.strip()
+	except (OSError, subprocess.CalledProcessError): return None
+
+def PrintComparison(baseline: dict, results: dict):
+	"""
+	Выводит изменение пропускной способности и задержек относительно предыдущего запуска.
+
+	:param baseline: Результаты предыдущего запуска.
+	:type baseline: dict
+	:param results: Результаты нового запуска.
+	:type results: dict
+	"""
+
+	Previous = {(Result["scenario"], Result["concurrency"]): Result for Result in baseline["results"]}
+	Delta = lambda old, new: f"{(new - old) / old * 100:+.1f}%" if old else "—"
+
+	print(f"Сравнение с {baseline.get('commit') or '—'} ({baseline['created']}):")
+	print(f"{'Сценарий':<10}{'Потоков':>8}{'Запр./с':>12}{'p50':>10}{'p95':>10}{'p99':>10}")
+
+	for Result in results["results"]:
+		Old = Previous.get((Result["scenario"], Result["concurrency"]))
+		if not Old: continue
+		Latency, OldLatency = Result["latency"], Old["latency"]
+		print(f"{Result['scenario']:<10}{Result['concurrency']:>8}{Delta(Old['throughput'], Result['throughput']):>12}" + "".join(f"{Delta(OldLatency[Key], Latency[Key]):>10}" for Key in ("p50", "p95", "p99")))
+
+def PrintResults(results: dict):
+	"""
+	Выводит таблицу результатов запуска.
+
+	:param results: Результаты запуска.
+	:type results: dict
+	"""
+
+	print(f"{'Сценарий':<10}{'Потоков':>8}{'Запр./с':>12}{'Сред., мс':>12}{'p50':>10}{'p95':>10}{'p99':>10}{'Макс.':>10}{'Ошибок':>8}")
+
+	for Result in results["results"]:
+		Latency = Result["latency"]
+		print(f"{Result['scenario']:<10}{Result['concurrency']:>8}{Result['throughput']:>12.2f}{Latency['mean']:>12.1f}{Latency['p50']:>10.1f}{Latency['p95']:>10.1f}{Latency['p99']:>10.1f}{Latency['max']:>10.1f}{Result['errors']:>8}")
+
+def ReadResults(path: str) -> dict:
+	"""
+	Читает файл результатов.
+
+	:param path: Путь к файлу.
+	:type path: str
+	:return: Результаты запуска.
+	:rtype: dict
+	"""
+
+	with open(path, "rb") as FileReader: return orjson.loads(FileReader.read())
+
+#==========================================================================================#
+# >>>>> ОБРАБОТКА АРГУМЕНТОВ ЗАПУСКА <<<<< #
+#==========================================================================================#
+
+Analyzer = Terminalyzer()
+Analyzer.helper.enable(True)
+CommandData = Analyzer.check_commands(COMMANDS)
+if not CommandData or not CommandData.name: sys.exit(0)
+
+if CommandData.name == "compare":
+	Baseline, Results = (ReadResults(Path) for Path in CommandData.arguments)
+	PrintResults(Results)
+	print()
+	PrintComparison(Baseline, Results)
+	sys.exit(0)
+
+Scenarios = [Name.strip() for Name in (CommandData.get_key_value("scenarios") or ",".join(SCENARIOS)).split(",") if Name.strip()]
+Levels = [max(int(Level), 1) for Level in (CommandData.get_key_value("concurrency") or "1,4,16").split(",") if Level.strip()]
+Requests = max(int(CommandData.get_key_value("requests") or 100), 1)
+Parameters = {
+	"scenarios": [Name for Name in Scenarios if Name in SCENARIOS],
+	"concurrency": Levels,
+	"requests": Requests,
+	"users": max(int(CommandData.get_key_value("users") or 1000), 1),
+	"neurohub_latency": float(CommandData.get_key_value("latency") or 0.2),
+	"telegram_latency": float(CommandData.get_key_value("api-latency") or 0.02),
+	"voice_share": float(CommandData.get_key_value("voice-share") or 0.2)
+}
+
+for Name in Scenarios:
+	if Name not in SCENARIOS: print(f"Неизвестный сценарий: {Name}.")
+
+#==========================================================================================#
+# >>>>> ИНИЦИАЛИЗАЦИЯ ОБЪЕКТОВ <<<<< #
+#==========================================================================================#
+
+Settings = Config("Settings.json")
+Settings.load()
+
+InstallFakeNeuroHub(Parameters["neurohub_latency"])
+from Benchmarks.Pipelines import Pipelines
+
+Telegram = FakeTelegram("Benchmarks/Samples", Parameters["telegram_latency"])
+PipelinesObject = Pipelines(Settings, Telegram, Parameters["users"], Parameters["voice_share"], max(Levels))
+RunnerObject = Runner(CommandData.check_flag("verbose"))
+
+if not PipelinesObject.is_voice_supported and {"voice", "mixed"} & set(Parameters["scenarios"]):
+	print(f"Модель распознавания речи Data/VOSK/{Settings['vosk_model']} не найдена. Сценарии с аудиосообщениями пропущены.")
+	Parameters["scenarios"] = [Name for Name in Parameters["scenarios"] if Name == "text"]
+
+#==========================================================================================#
+# >>>>> ЗАМЕРЫ <<<<< #
+#==========================================================================================#
+
+Results = {
+	"created": datetime.now().isoformat(timespec = "seconds"),
+	"commit": GetCommit(),
+	"python": platform.python_version(),
+	"platform": platform.platform(),
+	"cpus": os.cpu_count(),
+	"parameters": Parameters,
+	"results": list()
+}
+
+try:
+
+	for Scenario in Parameters["scenarios"]:
+
+		for Level in Levels:
+			print(f"Сценарий {Scenario}, потоков {Level}…", flush = True)
+			Result = RunnerObject.measure(getattr(PipelinesObject, Scenario), Level, Requests, warmup = min(Level, Requests))
+			Results["results"].append({"scenario": Scenario, **Result})
+
+finally:
+	PipelinesObject.close()
+	Telegram.close()
+
+Results["telegram_requests"] = Telegram.requests
+
+#==========================================================================================#
+# >>>>> ВЫВОД РЕЗУЛЬТАТОВ <<<<< #
+#==========================================================================================#
+
+Path = CommandData.get_key_value("output") or f"Benchmarks/Results/{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.json"
+if os.path.dirname(Path): os.makedirs(os.path.dirname(Path), exist_ok = True)
+with open(Path, "wb") as FileWriter: FileWriter.write(orjson.dumps(Results, option = orjson.OPT_INDENT_2))
+
+print()
+PrintResults(Results)
+print(f"\nРезультаты сохранены: {Path}")
+
+if CommandData.get_key_value("compare"):
+	print()
+	PrintComparison(ReadResults(CommandData.get_key_value("compare")), Results)
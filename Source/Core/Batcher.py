@@ -0,0 +1,172 @@
+from dublib.Engine.Bus import ExecutionStatus
+
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Callable, Hashable
+import threading
+
+#==========================================================================================#
+# >>>>> ДОПОЛНИТЕЛЬНЫЕ СТРУКТУРЫ ДАННЫХ <<<<< #
+#==========================================================================================#
+
+@dataclass
+class Batch:
+	"""Накапливаемый пакет запросов одной группы."""
+
+	texts: list[str] = field(default_factory = list)
+	futures: list[Future] = field(default_factory = list)
+	characters: int = 0
+	closed: bool = False
+	timer: threading.Timer | None = None
+
+#==========================================================================================#
+# >>>>> ОСНОВНОЙ КЛАСС <<<<< #
+#==========================================================================================#
+
+class Batcher:
+	"""Накопитель запросов: объединяет тексты одной группы, поступившие в течение короткого окна, в один пакетный запрос."""
+
+	#==========================================================================================#
+	# >>>>> СВОЙСТВА <<<<< #
+	#==========================================================================================#
+
+	@property
+	def batches(self) -> int:
+		"""Количество отправленных пакетов."""
+
+		return self.__Batches
+
+	@property
+	def fallbacks(self) -> int:
+		"""Количество текстов, переданных на одиночную обработку из-за невозможности разобрать пакетный ответ."""
+
+		return self.__Fallbacks
+
+	#==========================================================================================#
+	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __Detach(self, group: Hashable, batch: Batch) -> bool:
+		"""
+		Закрывает пакет для новых запросов. Вызывается под блокировкой.
+
+		:param group: Группа запросов.
+		:type group: Hashable
+		:param batch: Пакет запросов.
+		:type batch: Batch
+		:return: Возвращает `True`, если пакет ещё не был закрыт.
+		:rtype: bool
+		"""
+
+		if batch.closed: return False
+		batch.closed = True
+		if self.__Groups.get(group) is batch: del self.__Groups[group]
+		if batch.timer: batch.timer.cancel()
+		self.__Batches += 1
+
+		return True
+
+	def __OnTimer(self, group: Hashable, batch: Batch):
+		"""
+		Отправляет пакет по истечении окна накопления.
+
+		:param group: Группа запросов.
+		:type group: Hashable
+		:param batch: Пакет запросов.
+		:type batch: Batch
+		"""
+
+		with self.__Lock:
+			if not self.__Detach(group, batch): return
+
+		self.__Run(group, batch)
+
+	def __Run(self, group: Hashable, batch: Batch):
+		"""
+		Обрабатывает закрытый пакет и передаёт результаты ожидающим.
+
+		:param group: Группа запросов.
+		:type group: Hashable
+		:param batch: Пакет запросов.
+		:type batch: Batch
+		"""
+
+		try:
+			Results = self.__Executor(group, batch.texts)
+			if Results is None: Results = (None,) * len(batch.texts)
+
+			with self.__Lock: self.__Fallbacks += sum(1 for Result in Results if Result is None)
+			for Index in range(len(batch.futures)): batch.futures[Index].set_result(Results[Index])
+
+		except Exception as ExceptionData:
+			for Pending in batch.futures: Pending.set_exception(ExceptionData)
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __init__(self, executor: Callable[[Any, list[str]], list[ExecutionStatus | None] | None], window: float = 0.1, size: int = 8, characters: int = 4000):
+		"""
+		Накопитель запросов.
+
+		:param executor: Обработчик пакета. Принимает группу и список текстов, возвращает результаты в том же порядке. `None` на месте результата (или вместо всего списка) означает необходимость одиночной обработки.
+		:type executor: Callable[[Any, list[str]], list[ExecutionStatus | None] | None]
+		:param window: Время накопления пакета в секундах.
+		:type window: float
+		:param size: Максимальное количество текстов в пакете.
+		:type size: int
+		:param characters: Максимальная суммарная длина текстов пакета.
+		:type characters: int
+		"""
+
+		self.__Executor = executor
+		self.__Window = window
+		self.__Size = max(size, 1)
+		self.__Characters = characters
+
+		self.__Groups: dict[Hashable, Batch] = dict()
+		self.__Lock = threading.Lock()
+		self.__Batches = 0
+		self.__Fallbacks = 0
+
+	def submit(self, group: Hashable, text: str) -> ExecutionStatus | None:
+		"""
+		Помещает текст в пакет своей группы и ожидает результата.
+
+		:param group: Группа запросов. В один пакет попадают только тексты одной группы.
+		:type group: Hashable
+		:param text: Текст запроса.
+		:type text: str
+		:return: Результат обработки или `None`, если текст необходимо обработать одиночным запросом.
+		:rtype: ExecutionStatus | None
+		"""
+
+		if len(text) > self.__Characters: return None
+
+		Pending = Future()
+		Ready = None
+
+		with self.__Lock:
+			CurrentBatch = self.__Groups.get(group)
+
+			if CurrentBatch and CurrentBatch.characters + len(text) > self.__Characters:
+				self.__Detach(group, CurrentBatch)
+				Ready = CurrentBatch
+				CurrentBatch = None
+
+			if not CurrentBatch:
+				CurrentBatch = Batch()
+				self.__Groups[group] = CurrentBatch
+				CurrentBatch.timer = threading.Timer(self.__Window, self.__OnTimer, (group, CurrentBatch))
+				CurrentBatch.timer.daemon = True
+				CurrentBatch.timer.start()
+
+			CurrentBatch.texts.append(text)
+			CurrentBatch.futures.append(Pending)
+			CurrentBatch.characters += len(text)
+			Full = CurrentBatch if len(CurrentBatch.texts) >= self.__Size and self.__Detach(group, CurrentBatch) else None
+
+		if Ready: threading.Thread(target = self.__Run, args = (group, Ready), daemon = True).start()
+		if Full: self.__Run(group, Full)
+
+		return Pending.result()
@@ -0,0 +1,209 @@
+from collections import OrderedDict
+from typing import Iterable
+from os import PathLike
+from time import time
+import threading
+import hashlib
+import sqlite3
+import os
+
+class ResultsCache:
+	"""Двухуровневый кэш результатов: ограниченный LRU в памяти и опциональное постоянное хранилище SQLite."""
+
+	#==========================================================================================#
+	# >>>>> СВОЙСТВА <<<<< #
+	#==========================================================================================#
+
+	@property
+	def hits(self) -> int:
+		"""Количество попаданий в кэш."""
+
+		return self.__Hits
+
+	@property
+	def misses(self) -> int:
+		"""Количество промахов кэша."""
+
+		return self.__Misses
+
+	@property
+	def size(self) -> int:
+		"""Количество записей в памяти."""
+
+		return len(self.__Memory)
+
+	#==========================================================================================#
+	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __GetHash(self, key: Iterable[str]) -> str:
+		"""
+		Возвращает хэш ключа записи.
+
+		:param key: Последовательность составляющих ключа.
+		:type key: Iterable[str]
+		:return: Хэш ключа.
+		:rtype: str
+		"""
+
+		return hashlib.sha1("\x00".join(key).encode("utf-8")).hexdigest()
+
+	def __IsExpired(self, stamp: float) -> bool:
+		"""
+		Проверяет, истёк ли срок жизни записи.
+
+		:param stamp: Время создания записи.
+		:type stamp: float
+		:return: Возвращает `True`, если запись устарела.
+		:rtype: bool
+		"""
+
+		return bool(self.__TTL) and time() - stamp > self.__TTL
+
+	def __PutToMemory(self, hash: str, value: str, stamp: float):
+		"""
+		Помещает запись в LRU-уровень, вытесняя наиболее давно использованные записи.
+
+		:param hash: Хэш ключа.
+		:type hash: str
+		:param value: Значение.
+		:type value: str
+		:param stamp: Время создания записи.
+		:type stamp: float
+		"""
+
+		self.__Memory[hash] = (value, stamp)
+		self.__Memory.move_to_end(hash)
+		while len(self.__Memory) > self.__MemorySize: self.__Memory.popitem(last = False)
+
+	def __TrimStorage(self):
+		"""Удаляет из постоянного хранилища устаревшие записи и записи сверх лимита."""
+
+		if self.__TTL: self.__Connection.execute("DELETE FROM cache WHERE stamp < ?", (time() - self.__TTL,))
+		self.__Connection.execute(
+			"DELETE FROM cache WHERE hash IN (SELECT hash FROM cache ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+			(self.__StorageSize,)
+		)
+		self.__Connection.commit()
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __init__(self, memory_size: int = 2048, ttl: int | None = None, path: PathLike | None = None, storage_size: int = 100000, namespace: str | None = None):
+		"""
+		Двухуровневый кэш результатов.
+
+		:param memory_size: Максимальное количество записей в памяти.
+		:type memory_size: int
+		:param ttl: Время жизни записи в секундах. `None` или `0` отключают устаревание.
+		:type ttl: int | None
+		:param path: Путь к файлу постоянного хранилища. При `None` кэш существует только в памяти.
+		:type path: PathLike | None
+		:param storage_size: Максимальное количество записей в постоянном хранилище.
+		:type storage_size: int
+		:param namespace: Пространство имён постоянного хранилища. Если оно отличается от сохранённого ранее, хранилище очищается.
+		:type namespace: str | None
+		"""
+
+		self.__MemorySize = max(memory_size, 1)
+		self.__TTL = ttl
+		self.__StorageSize = storage_size
+
+		self.__Memory: OrderedDict[str, tuple[str, float]] = OrderedDict()
+		self.__Lock = threading.Lock()
+		self.__Connection = None
+		self.__Writes = 0
+		self.__Hits = 0
+		self.__Misses = 0
+
+		if path:
+			Directory = os.path.dirname(path)
+			if Directory and not os.path.exists(Directory): os.makedirs(Directory)
+			self.__Connection = sqlite3.connect(path, check_same_thread = False)
+			self.__Connection.execute("CREATE TABLE IF NOT EXISTS cache (hash TEXT PRIMARY KEY, value TEXT, stamp REAL, accessed REAL)")
+			self.__Connection.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+			Row = self.__Connection.execute("SELECT value FROM meta WHERE key = 'namespace'").fetchone()
+
+			if (Row[0] if Row else None) != namespace:
+				self.__Connection.execute("DELETE FROM cache")
+				self.__Connection.execute("INSERT OR REPLACE INTO meta VALUES ('namespace', ?)", (namespace,))
+
+			self.__TrimStorage()
+
+	def clear(self):
+		"""Очищает оба уровня кэша."""
+
+		with self.__Lock:
+			self.__Memory.clear()
+
+			if self.__Connection:
+				self.__Connection.execute("DELETE FROM cache")
+				self.__Connection.commit()
+
+	def close(self):
+		"""Закрывает постоянное хранилище."""
+
+		with self.__Lock:
+
+			if self.__Connection:
+				self.__Connection.commit()
+				self.__Connection.close()
+				self.__Connection = None
+
+	def get(self, key: Iterable[str]) -> str | None:
+		"""
+		Возвращает значение из кэша.
+
+		:param key: Последовательность составляющих ключа.
+		:type key: Iterable[str]
+		:return: Значение или `None` при его отсутствии.
+		:rtype: str | None
+		"""
+
+		Hash = self.__GetHash(key)
+
+		with self.__Lock:
+			Record = self.__Memory.get(Hash)
+
+			if Record and self.__IsExpired(Record[1]):
+				del self.__Memory[Hash]
+				Record = None
+
+			if Record:
+				self.__Memory.move_to_end(Hash)
+
+			elif self.__Connection:
+				Row = self.__Connection.execute("SELECT value, stamp FROM cache WHERE hash = ?", (Hash,)).fetchone()
+
+				if Row and not self.__IsExpired(Row[1]):
+					Record = Row
+					self.__Connection.execute("UPDATE cache SET accessed = ? WHERE hash = ?", (time(), Hash))
+					self.__PutToMemory(Hash, *Record)
+
+			if Record: self.__Hits += 1
+			else: self.__Misses += 1
+
+		return Record[0] if Record else None
+
+	def put(self, key: Iterable[str], value: str):
+		"""
+		Помещает значение в кэш.
+
+		:param key: Последовательность составляющих ключа.
+		:type key: Iterable[str]
+		:param value: Значение.
+		:type value: str
+		"""
+
+		Hash = self.__GetHash(key)
+		Stamp = time()
+
+		with self.__Lock:
+			self.__PutToMemory(Hash, value, Stamp)
+
+			if self.__Connection:
+				self.__Connection.execute("INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?)", (Hash, value, Stamp, Stamp))
+				self.__Writes += 1
+				if self.__Writes % 256 == 0: self.__TrimStorage()
+				else: self.__Connection.commit()
@@ -0,0 +1,244 @@
+from Source.Core.Metrics import METRICS
+
+from dublib.CLI.TextStyler import FastStyler
+
+from time import perf_counter
+import subprocess
+import threading
+import shutil
+import enum
+import io
+
+from pydub import AudioSegment
+
+#==========================================================================================#
+# >>>>> ДОПОЛНИТЕЛЬНЫЕ СТРУКТУРЫ ДАННЫХ <<<<< #
+#==========================================================================================#
+
+class DecoderBackends(enum.Enum):
+	"""Способы декодирования аудиосообщений."""
+
+	FFmpeg = "ffmpeg"
+	Pydub = "pydub"
+
+#==========================================================================================#
+# >>>>> ОСНОВНОЙ КЛАСС <<<<< #
+#==========================================================================================#
+
+class Decoder:
+	"""Декодер аудиосообщений *.ogg в PCM (16 кГц, моно, 16 бит) с однократным определением доступных способов декодирования."""
+
+	#==========================================================================================#
+	# >>>>> СВОЙСТВА <<<<< #
+	#==========================================================================================#
+
+	@property
+	def available(self) -> tuple[DecoderBackends]:
+		"""Способы декодирования, доступные на данном устройстве."""
+
+		return self.__Available
+
+	@property
+	def backend(self) -> DecoderBackends:
+		"""Используемый способ декодирования."""
+
+		return self.__Backend
+
+	@property
+	def is_streaming_supported(self) -> bool:
+		"""Указывает, поддерживает ли используемый способ декодирование во время скачивания."""
+
+		return self.__Backend == DecoderBackends.FFmpeg
+
+	@property
+	def metrics(self) -> dict[str, dict[str, int | float]]:
+		"""Метрики по способам декодирования: _decodes_ – успешно декодировано, _failures_ – ошибок, _decode_time_ – суммарная длительность декодирования в секундах, _audio_time_ – суммарная длительность исходного аудио в секундах, _rtf_ – коэффициент реального времени (отношение времени декодирования к длительности аудио)."""
+
+		with self.__Lock:
+			Metrics = dict()
+
+			for Backend, Values in self.__Metrics.items():
+				Metrics[Backend.value] = Values.copy()
+				Metrics[Backend.value]["rtf"] = Values["decode_time"] / Values["audio_time"] if Values["audio_time"] else 0.0
+
+			return Metrics
+
+	@property
+	def tempo(self) -> float | None:
+		"""Коэффициент изменения темпа аудио."""
+
+		return self.__Tempo
+
+	#==========================================================================================#
+	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __Probe(self) -> tuple[DecoderBackends]:
+		"""
+		Определяет доступные способы декодирования.
+
+		:return: Доступные способы декодирования.
+		:rtype: tuple[DecoderBackends]
+		"""
+
+		Available = list()
+
+		try:
+			subprocess.run(("ffmpeg", "-version"), stdout = subprocess.DEVNULL, stderr = subprocess.DEVNULL, check = True)
+			Available.append(DecoderBackends.FFmpeg)
+
+		except (OSError, subprocess.CalledProcessError): pass
+
+		if shutil.which(AudioSegment.converter): Available.append(DecoderBackends.Pydub)
+
+		return tuple(Available)
+
+	def __DecodeFFmpeg(self, data: bytes) -> bytes:
+		"""
+		Декодирует аудио через стандартные потоки **ffmpeg**.
+
+		:param data: Содержимое *.ogg файла.
+		:type data: bytes
+		:return: Данные PCM.
+		:rtype: bytes
+		"""
+
+		return subprocess.run(self.get_command(), input = data, stdout = subprocess.PIPE, stderr = subprocess.PIPE, check = True).stdout
+
+	def __DecodePydub(self, data: bytes) -> bytes:
+		"""
+		Декодирует аудио средствами **pydub**.
+
+		:param data: Содержимое *.ogg файла.
+		:type data: bytes
+		:return: Данные PCM.
+		:rtype: bytes
+		"""
+
+		Audio = AudioSegment.from_file(io.BytesIO(data), format = "ogg")
+
+		return Audio.set_frame_rate(16000).set_channels(1).set_sample_width(2).raw_data
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __init__(self, backend: DecoderBackends | None = None, tempo: float | None = None):
+		"""
+		Декодер аудиосообщений. Доступные способы декодирования определяются один раз при создании.
+
+		:param backend: Способ декодирования. При `None` выбирается **ffmpeg**, если он доступен, иначе **pydub**. Недоступный способ заменяется доступным.
+		:type backend: DecoderBackends | None
+		:param tempo: Коэффициент изменения темпа аудио перед распознаванием (например, `0.5` замедляет речь вдвое, но удваивает объём распознаваемых данных). Применяется только при декодировании через **ffmpeg**. При `None` темп не изменяется.
+		:type tempo: float | None
+		"""
+
+		self.__Tempo = tempo if tempo and tempo != 1 else None
+		self.__Available = self.__Probe()
+		self.__Backend = backend or (self.__Available[0] if self.__Available else DecoderBackends.Pydub)
+
+		if self.__Backend not in self.__Available and self.__Available:
+			print(FastStyler(f"Decoder \"{self.__Backend.value}\" is unavailable. Using \"{self.__Available[0].value}\".").colorize.yellow)
+			self.__Backend = self.__Available[0]
+
+		self.__Lock = threading.Lock()
+		self.__Metrics = {Backend: {"decodes": 0, "failures": 0, "decode_time": 0.0, "audio_time": 0.0} for Backend in DecoderBackends}
+
+	def collect(self) -> dict[str, dict[str, int | float]]:
+		"""
+		Возвращает накопленные метрики способов декодирования, обнуляя их. Используется рабочими процессами распознавания для передачи метрик основному процессу.
+
+		:return: Метрики по названиям способов декодирования без вычисляемого коэффициента реального времени.
+		:rtype: dict[str, dict[str, int | float]]
+		"""
+
+		with self.__Lock:
+			Collected = {Backend.value: Values for Backend, Values in self.__Metrics.items()}
+			self.__Metrics = {Backend: {"decodes": 0, "failures": 0, "decode_time": 0.0, "audio_time": 0.0} for Backend in DecoderBackends}
+
+		return Collected
+
+	def decode(self, data: bytes) -> bytes | None:
+		"""
+		Декодирует аудио *.ogg из памяти в PCM (16 кГц, моно, 16 бит) и учитывает затраченное время.
+
+		:param data: Содержимое *.ogg файла.
+		:type data: bytes
+		:return: Данные PCM или `None` в случае ошибки.
+		:rtype: bytes | None
+		"""
+
+		StartTime = perf_counter()
+
+		try:
+			PCM = self.__DecodeFFmpeg(data) if self.__Backend == DecoderBackends.FFmpeg else self.__DecodePydub(data)
+
+		except Exception as ExceptionData:
+			self.record(perf_counter() - StartTime, None)
+			print(ExceptionData)
+			return None
+
+		self.record(perf_counter() - StartTime, len(PCM))
+
+		return PCM
+
+	def get_command(self) -> tuple[str]:
+		"""
+		Возвращает команду **ffmpeg** для декодирования *.ogg из стандартного ввода в PCM (16 кГц, моно, 16 бит) в стандартный вывод.
+
+		:return: Команда **ffmpeg**.
+		:rtype: tuple[str]
+		"""
+
+		Filters = ("-filter:a", f"atempo={self.__Tempo}") if self.__Tempo else tuple()
+
+		return (
+			"ffmpeg",
+			"-loglevel", "error",
+			"-i", "pipe:0",
+			"-ar", "16000",
+			"-ac", "1",
+			*Filters,
+			"-f", "s16le",
+			"pipe:1"
+		)
+
+	def merge(self, collected: dict[str, dict[str, int | float]]):
+		"""
+		Добавляет метрики, собранные методом `collect()` в другом процессе.
+
+		:param collected: Собранные метрики.
+		:type collected: dict[str, dict[str, int | float]]
+		"""
+
+		with self.__Lock:
+
+			for Backend, Values in collected.items():
+				Metrics = self.__Metrics[DecoderBackends(Backend)]
+				for Key, Value in Values.items(): Metrics[Key] += Value
+
+	def record(self, elapsed: float, size: int | None):
+		"""
+		Учитывает декодирование используемым способом в метриках. Вызывается также при потоковом декодировании через **ffmpeg**, выполняемом вне декодера.
+
+		:param elapsed: Длительность декодирования в секундах. При потоковом декодировании – время от запуска **ffmpeg** до получения последнего блока PCM.
+		:type elapsed: float
+		:param size: Размер полученных данных PCM в байтах или `None` в случае ошибки.
+		:type size: int | None
+		"""
+
+		if size is None:
+			with self.__Lock: self.__Metrics[self.__Backend]["failures"] += 1
+			METRICS.increment("stage_errors", stage = "decode")
+			return
+
+		AudioTime = size / 32000
+		if self.__Backend == DecoderBackends.FFmpeg and self.__Tempo: AudioTime *= self.__Tempo
+
+		with self.__Lock:
+			Metrics = self.__Metrics[self.__Backend]
+			Metrics["decodes"] += 1
+			Metrics["decode_time"] += elapsed
+			Metrics["audio_time"] += AudioTime
+
+		METRICS.observe("decode", elapsed)
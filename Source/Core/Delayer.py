@@ -0,0 +1,159 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from time import monotonic
+from typing import Callable, Iterable
+import threading
+import heapq
+
+class Delayer:
+	"""Планировщик отложенных вызовов: один фоновый поток ожидает ближайший срок по куче, а сами вызовы выполняются небольшим пулом потоков, не занимая обработчики бота."""
+
+	#==========================================================================================#
+	# >>>>> СВОЙСТВА <<<<< #
+	#==========================================================================================#
+
+	@property
+	def pending(self) -> int:
+		"""Количество ожидающих вызовов."""
+
+		with self.__Condition: return len(self.__Heap)
+
+	#==========================================================================================#
+	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __Continue(self, interval: float, calls: list[Callable], result: Future, previous: Future):
+		"""
+		Планирует следующий вызов последовательности после завершения предыдущего.
+
+		:param interval: Интервал между вызовами в секундах.
+		:type interval: float
+		:param calls: Оставшиеся вызовы.
+		:type calls: list[Callable]
+		:param result: Задача всей последовательности.
+		:type result: Future
+		:param previous: Завершённый вызов.
+		:type previous: Future
+		"""
+
+		if previous.cancelled():
+			result.cancel()
+			return
+
+		if previous.exception():
+			result.set_exception(previous.exception())
+			return
+
+		if not calls:
+			result.set_result(previous.result())
+			return
+
+		Next = self.schedule(interval, calls[0])
+		Next.add_done_callback(partial(self.__Continue, interval, calls[1:], result))
+
+	def __Run(self):
+		"""Передаёт наступившие вызовы пулу потоков до остановки планировщика."""
+
+		while True:
+
+			with self.__Condition:
+
+				while True:
+					if self.__IsClosed: return
+					Wait = self.__Heap[0][0] - monotonic() if self.__Heap else None
+					if Wait is not None and Wait <= 0: break
+					self.__Condition.wait(Wait)
+
+				_, _, Function, Result = heapq.heappop(self.__Heap)
+
+			if Result.set_running_or_notify_cancel(): self.__Executor.submit(self.__Execute, Function, Result)
+
+	def __Execute(self, function: Callable, result: Future):
+		"""
+		Выполняет вызов и передаёт его результат задаче.
+
+		:param function: Вызываемый объект.
+		:type function: Callable
+		:param result: Задача вызова.
+		:type result: Future
+		"""
+
+		try: result.set_result(function())
+
+		except Exception as ExceptionData:
+			print(ExceptionData)
+			result.set_exception(ExceptionData)
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __init__(self, workers: int = 2):
+		"""
+		Планировщик отложенных вызовов.
+
+		:param workers: Количество потоков, выполняющих наступившие вызовы.
+		:type workers: int
+		"""
+
+		self.__Executor = ThreadPoolExecutor(max_workers = max(workers, 1), thread_name_prefix = "Delayer")
+		self.__Condition = threading.Condition()
+		self.__Heap: list[tuple[float, int, Callable, Future]] = list()
+		self.__Sequence = 0
+		self.__IsClosed = False
+
+		self.__Thread = threading.Thread(target = self.__Run, name = "Delayer", daemon = True)
+		self.__Thread.start()
+
+	def chain(self, interval: float, calls: Iterable[Callable]) -> Future:
+		"""
+		Выполняет вызовы последовательно: первый сразу, а каждый следующий – через заданный интервал после завершения предыдущего. При ошибке последовательность прерывается.
+
+		:param interval: Интервал между вызовами в секундах.
+		:type interval: float
+		:param calls: Вызываемые объекты без аргументов (например, `functools.partial`).
+		:type calls: Iterable[Callable]
+		:return: Задача, результатом которой станет результат последнего вызова.
+		:rtype: Future
+		"""
+
+		Calls = list(calls)
+		Result = Future()
+
+		if not Calls: Result.set_result(None)
+		else: self.schedule(0, Calls[0]).add_done_callback(partial(self.__Continue, interval, Calls[1:], Result))
+
+		return Result
+
+	def close(self):
+		"""Останавливает планировщик. Ожидающие вызовы отменяются."""
+
+		with self.__Condition:
+			self.__IsClosed = True
+			Pending = self.__Heap
+			self.__Heap = list()
+			self.__Condition.notify()
+
+		for _, _, _, Result in Pending: Result.cancel()
+		self.__Executor.shutdown(wait = False)
+
+	def schedule(self, delay: float, function: Callable, *args, **kwargs) -> Future:
+		"""
+		Планирует вызов через заданное время.
+
+		:param delay: Задержка в секундах.
+		:type delay: float
+		:param function: Вызываемый объект.
+		:type function: Callable
+		:return: Задача, результатом которой станет результат вызова. Отмена задачи до наступления срока отменяет вызов.
+		:rtype: Future
+		"""
+
+		Result = Future()
+
+		with self.__Condition:
+			self.__Sequence += 1
+			heapq.heappush(self.__Heap, (monotonic() + max(delay, 0), self.__Sequence, partial(function, *args, **kwargs), Result))
+			self.__Condition.notify()
+
+		return Result
@@ -0,0 +1,406 @@
+from Source.Core.Metrics import METRICS
+
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import Any
+import threading
+import inspect
+import bisect
+import enum
+
+from telebot.apihelper import ApiTelegramException
+from telebot import TeleBot
+
+DECORATIONS = ("send_chat_action", "send_sticker")
+DISPATCHED = ("copy_message", "edit_message_caption", "edit_message_reply_markup", "edit_message_text", "forward_message")
+
+#==========================================================================================#
+# >>>>> ДОПОЛНИТЕЛЬНЫЕ СТРУКТУРЫ ДАННЫХ <<<<< #
+#==========================================================================================#
+
+class DispatchPriorities(enum.Enum):
+	"""Приоритеты исходящих запросов. Меньшее значение отправляется раньше."""
+
+	Reply = 0
+	Decoration = 1
+
+@dataclass(order = True)
+class Job:
+	"""Исходящий запрос к Telegram."""
+
+	priority: int
+	sequence: int
+	method: str = field(compare = False)
+	chat_id: Any = field(compare = False)
+	args: tuple = field(compare = False)
+	kwargs: dict = field(compare = False)
+	future: Future = field(compare = False)
+	enqueued: float = field(compare = False)
+	attempts: int = field(default = 0, compare = False)
+	limited: bool = field(default = False, compare = False)
+
+@dataclass
+class Bucket:
+	"""Корзина токенов чата."""
+
+	tokens: float
+	updated: float
+	blocked_until: float = 0.0
+
+#==========================================================================================#
+# >>>>> ОСНОВНОЙ КЛАСС <<<<< #
+#==========================================================================================#
+
+class Dispatcher:
+	"""Диспетчер исходящих сообщений Telegram с учётом глобального и початового ограничений частоты, приоритетами и повтором после ошибки 429."""
+
+	#==========================================================================================#
+	# >>>>> СВОЙСТВА <<<<< #
+	#==========================================================================================#
+
+	@property
+	def bot(self) -> TeleBot:
+		"""Бот Telegram."""
+
+		return self.__Bot
+
+	@property
+	def metrics(self) -> dict[str, int | float]:
+		"""Метрики диспетчера: _queued_ – запросов в очереди, _sent_ – отправлено, _failed_ – завершено ошибкой, _limited_ – ожидали освобождения лимита частоты, _throttled_ – получено ответов 429, _collapsed_ – отброшено избыточных действий чата, _latency_avg_ и _latency_max_ – среднее и максимальное время ожидания в очереди в секундах."""
+
+		with self.__Condition:
+			return {
+				"queued": len(self.__Queue),
+				"sent": self.__Sent,
+				"failed": self.__Failed,
+				"limited": self.__Limited,
+				"throttled": self.__Throttled,
+				"collapsed": self.__Collapsed,
+				"latency_avg": self.__Latency / self.__Sent if self.__Sent else 0.0,
+				"latency_max": self.__LatencyMax
+			}
+
+	#==========================================================================================#
+	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __GetActionKey(self, chat_id: Any, args: tuple, kwargs: dict) -> tuple:
+		"""
+		Возвращает ключ действия чата для объединения повторяющихся действий.
+
+		:param chat_id: ID чата.
+		:type chat_id: Any
+		:param args: Позиционные аргументы `send_chat_action()`.
+		:type args: tuple
+		:param kwargs: Именованные аргументы `send_chat_action()`.
+		:type kwargs: dict
+		:return: Ключ действия.
+		:rtype: tuple
+		"""
+
+		return (chat_id, args[1] if len(args) > 1 else kwargs.get("action"))
+
+	def __GetChatID(self, method: str, args: tuple, kwargs: dict) -> Any:
+		"""
+		Возвращает ID чата запроса независимо от того, передан ли он позиционно или по имени.
+
+		:param method: Название метода **TeleBot**.
+		:type method: str
+		:param args: Позиционные аргументы метода.
+		:type args: tuple
+		:param kwargs: Именованные аргументы метода.
+		:type kwargs: dict
+		:return: ID чата или `None`, если метод его не принимает.
+		:rtype: Any
+		"""
+
+		if "chat_id" in kwargs: return kwargs["chat_id"]
+
+		if method not in self.__Signatures:
+			try: self.__Signatures[method] = inspect.signature(getattr(self.__Bot, method))
+			except (TypeError, ValueError): self.__Signatures[method] = None
+
+		Signature = self.__Signatures[method]
+		if not Signature: return args[0] if args else None
+
+		try: return Signature.bind_partial(*args, **kwargs).arguments.get("chat_id")
+		except TypeError: return None
+
+	def __GetBucket(self, chat_id: Any, now: float) -> Bucket:
+		"""
+		Возвращает пополненную корзину токенов чата. Вызывается под блокировкой.
+
+		:param chat_id: ID чата.
+		:type chat_id: Any
+		:param now: Текущее время.
+		:type now: float
+		:return: Корзина токенов.
+		:rtype: Bucket
+		"""
+
+		ChatBucket = self.__Buckets.get(chat_id)
+
+		if not ChatBucket:
+			if len(self.__Buckets) >= 10000: self.__PruneBuckets(now)
+			ChatBucket = Bucket(self.__ChatBurst, now)
+			self.__Buckets[chat_id] = ChatBucket
+
+		ChatBucket.tokens = min(self.__ChatBurst, ChatBucket.tokens + (now - ChatBucket.updated) * self.__ChatRate)
+		ChatBucket.updated = now
+
+		return ChatBucket
+
+	def __Pick(self, now: float) -> tuple[Job | None, float | None]:
+		"""
+		Выбирает запрос с наивысшим приоритетом, для которого доступны токены. Вызывается под блокировкой.
+
+		:param now: Текущее время.
+		:type now: float
+		:return: Запрос и время ожидания в секундах до появления следующего доступного запроса (`None` при пустой очереди).
+		:rtype: tuple[Job | None, float | None]
+		"""
+
+		if not self.__Queue: return None, None
+
+		self.__Tokens = min(self.__Burst, self.__Tokens + (now - self.__Updated) * self.__Rate)
+		self.__Updated = now
+		Wait = None
+
+		if self.__Tokens < 1:
+			for Candidate in self.__Queue: self.__MarkLimited(Candidate)
+			return None, (1 - self.__Tokens) / self.__Rate
+
+		for Index, Candidate in enumerate(self.__Queue):
+			ChatBucket = self.__GetBucket(Candidate.chat_id, now)
+			ReadyTime = max(ChatBucket.blocked_until, now + (1 - ChatBucket.tokens) / self.__ChatRate if ChatBucket.tokens < 1 else now)
+
+			if ReadyTime > now:
+				self.__MarkLimited(Candidate)
+				Wait = min(Wait, ReadyTime - now) if Wait is not None else ReadyTime - now
+				continue
+
+			ChatBucket.tokens -= 1
+			self.__Tokens -= 1
+			del self.__Queue[Index]
+
+			return Candidate, None
+
+		return None, Wait
+
+	def __MarkLimited(self, job: Job):
+		"""
+		Учитывает запрос, ожидающий освобождения лимита. Вызывается под блокировкой.
+
+		:param job: Запрос.
+		:type job: Job
+		"""
+
+		if not job.limited:
+			job.limited = True
+			self.__Limited += 1
+
+	def __PruneBuckets(self, now: float):
+		"""
+		Удаляет корзины чатов, которые успели полностью пополниться. Вызывается под блокировкой.
+
+		:param now: Текущее время.
+		:type now: float
+		"""
+
+		Full = (self.__ChatBurst - 1) / self.__ChatRate
+		self.__Buckets = {ChatID: Value for ChatID, Value in self.__Buckets.items() if Value.blocked_until > now or now - Value.updated < Full}
+
+	def __Execute(self, job: Job):
+		"""
+		Выполняет запрос и повторяет его после ответа 429 с учётом переданного Telegram времени ожидания.
+
+		:param job: Запрос.
+		:type job: Job
+		"""
+
+		if job.method == "send_chat_action":
+			with self.__Condition: self.__Actions[self.__GetActionKey(job.chat_id, job.args, job.kwargs)] = monotonic()
+
+		try: Result = getattr(self.__Bot, job.method)(*job.args, **job.kwargs)
+
+		except ApiTelegramException as ExceptionData:
+
+			if ExceptionData.error_code == 429 and job.attempts < self.__Retries:
+				RetryAfter = (ExceptionData.result_json.get("parameters") or dict()).get("retry_after", 1)
+
+				with self.__Condition:
+					self.__Throttled += 1
+					self.__GetBucket(job.chat_id, monotonic()).blocked_until = monotonic() + RetryAfter
+					job.attempts += 1
+					bisect.insort(self.__Queue, job)
+					self.__Condition.notify()
+
+				return
+
+			self.__Finish(job, ExceptionData)
+
+		except Exception as ExceptionData: self.__Finish(job, ExceptionData)
+		else: self.__Finish(job, None, Result)
+
+	def __Finish(self, job: Job, exception: Exception | None, result: Any = None):
+		"""
+		Завершает запрос и обновляет метрики.
+
+		:param job: Запрос.
+		:type job: Job
+		:param exception: Исключение, если запрос завершился ошибкой.
+		:type exception: Exception | None
+		:param result: Результат запроса.
+		:type result: Any
+		"""
+
+		Latency = monotonic() - job.enqueued
+		METRICS.observe("send", Latency)
+		METRICS.increment("telegram_requests", method = job.method, outcome = "error" if exception else "ok")
+
+		with self.__Condition:
+			if job.method == "send_chat_action": self.__PendingActions.discard(self.__GetActionKey(job.chat_id, job.args, job.kwargs))
+
+			if exception:
+				self.__Failed += 1
+
+			else:
+				self.__Sent += 1
+				self.__Latency += Latency
+				self.__LatencyMax = max(self.__LatencyMax, Latency)
+
+		if exception: job.future.set_exception(exception)
+		else: job.future.set_result(result)
+
+	def __Work(self):
+		"""Отправляет запросы из очереди до остановки диспетчера."""
+
+		while True:
+
+			with self.__Condition:
+
+				while True:
+					if self.__IsClosed: return
+					Selected, Wait = self.__Pick(monotonic())
+					if Selected: break
+					self.__Condition.wait(Wait)
+
+			self.__Execute(Selected)
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __init__(self, bot: TeleBot, rate: float = 30, chat_rate: float = 1, chat_burst: int = 3, workers: int = 4, retries: int = 3, action_interval: float = 4):
+		"""
+		Диспетчер исходящих сообщений Telegram.
+
+		Методы отправки (`send_*`, `edit_message_*`, `copy_message`, `forward_message`) выполняются через очередь и возвращают результат после фактической отправки, а остальные атрибуты передаются боту напрямую, поэтому диспетчер можно передавать вместо бота.
+
+		:param bot: Бот Telegram.
+		:type bot: TeleBot
+		:param rate: Максимальное количество запросов в секунду для всего бота.
+		:type rate: float
+		:param chat_rate: Максимальное количество запросов в секунду для одного чата.
+		:type chat_rate: float
+		:param chat_burst: Количество запросов, которые можно отправить в один чат подряд без ожидания.
+		:type chat_burst: int
+		:param workers: Количество потоков отправки.
+		:type workers: int
+		:param retries: Количество повторных попыток после ответа 429.
+		:type retries: int
+		:param action_interval: Интервал в секундах, в течение которого повторные одинаковые действия чата (`send_chat_action`) отбрасываются.
+		:type action_interval: float
+		"""
+
+		self.__Bot = bot
+		self.__Rate = max(rate, 0.1)
+		self.__Burst = max(rate, 1)
+		self.__ChatRate = max(chat_rate, 0.01)
+		self.__ChatBurst = max(chat_burst, 1)
+		self.__Retries = max(retries, 0)
+		self.__ActionInterval = action_interval
+
+		self.__Condition = threading.Condition()
+		self.__Queue: list[Job] = list()
+		self.__Buckets: dict[Any, Bucket] = dict()
+		self.__Actions: dict[tuple, float] = dict()
+		self.__PendingActions: set[tuple] = set()
+		self.__Signatures: dict[str, inspect.Signature | None] = dict()
+		self.__Tokens = self.__Burst
+		self.__Updated = monotonic()
+		self.__Sequence = 0
+		self.__IsClosed = False
+
+		self.__Sent = 0
+		self.__Failed = 0
+		self.__Limited = 0
+		self.__Throttled = 0
+		self.__Collapsed = 0
+		self.__Latency = 0.0
+		self.__LatencyMax = 0.0
+
+		self.__Workers = [threading.Thread(target = self.__Work, name = f"Dispatcher{Index}", daemon = True) for Index in range(max(workers, 1))]
+		for Worker in self.__Workers: Worker.start()
+
+	def __getattr__(self, name: str) -> Any:
+		"""
+		Возвращает метод отправки через очередь для методов отправки и атрибут бота для остальных.
+
+		:param name: Название атрибута.
+		:type name: str
+		:return: Метод или атрибут.
+		:rtype: Any
+		"""
+
+		if name.startswith("_"): raise AttributeError(name)
+		if name.startswith("send_") or name in DISPATCHED: return lambda *args, **kwargs: self.send(name, *args, **kwargs)
+
+		return getattr(self.__Bot, name)
+
+	def close(self):
+		"""Останавливает потоки отправки. Неотправленные запросы завершаются ошибкой."""
+
+		with self.__Condition:
+			self.__IsClosed = True
+			Pending = self.__Queue
+			self.__Queue = list()
+			self.__Condition.notify_all()
+
+		for Selected in Pending: Selected.future.set_exception(RuntimeError("Dispatcher closed."))
+
+	def send(self, method: str, *args, priority: DispatchPriorities | None = None, **kwargs) -> Any:
+		"""
+		Ставит запрос в очередь и ожидает его выполнения. Действия чата не ожидаются, а повторяющиеся отбрасываются.
+
+		:param method: Название метода **TeleBot**.
+		:type method: str
+		:param priority: Приоритет запроса. По умолчанию стикеры и действия чата отправляются с приоритетом оформления, остальные – как ответы.
+		:type priority: DispatchPriorities | None
+		:return: Результат метода **TeleBot**.
+		:rtype: Any
+		"""
+
+		if not priority: priority = DispatchPriorities.Decoration if method in DECORATIONS else DispatchPriorities.Reply
+		ChatID = self.__GetChatID(method, args, kwargs)
+		IsAction = method == "send_chat_action"
+
+		with self.__Condition:
+
+			if IsAction:
+				Key = self.__GetActionKey(ChatID, args, kwargs)
+
+				if Key in self.__PendingActions or monotonic() - self.__Actions.get(Key, float("-inf")) < self.__ActionInterval:
+					self.__Collapsed += 1
+					return True
+
+				self.__PendingActions.add(Key)
+				if len(self.__Actions) >= 10000: self.__Actions = {ActionKey: Time for ActionKey, Time in self.__Actions.items() if monotonic() - Time < self.__ActionInterval}
+
+			self.__Sequence += 1
+			Created = Job(priority.value, self.__Sequence, method, ChatID, args, kwargs, Future(), monotonic())
+			bisect.insort(self.__Queue, Created)
+			self.__Condition.notify()
+
+		return True if IsAction else Created.future.result()
@@ -0,0 +1,459 @@
+from Source.Core.Profiler import SamplingProfiler
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+from time import perf_counter
+from typing import Callable
+import threading
+import bisect
+
+#==========================================================================================#
+# >>>>> ДОПОЛНИТЕЛЬНЫЕ СТРУКТУРЫ ДАННЫХ <<<<< #
+#==========================================================================================#
+
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+class Histogram:
+	"""Гистограмма длительностей с фиксированными границами корзин."""
+
+	__slots__ = ("buckets", "counts", "count", "sum")
+
+	def __init__(self, buckets: tuple[float]):
+		"""
+		Гистограмма длительностей.
+
+		:param buckets: Верхние границы корзин в секундах по возрастанию.
+		:type buckets: tuple[float]
+		"""
+
+		self.buckets = buckets
+		self.counts = [0] * (len(buckets) + 1)
+		self.count = 0
+		self.sum = 0.0
+
+	def observe(self, value: float):
+		"""
+		Учитывает значение.
+
+		:param value: Длительность в секундах.
+		:type value: float
+		"""
+
+		self.counts[bisect.bisect_left(self.buckets, value)] += 1
+		self.count += 1
+		self.sum += value
+
+	def merge(self, counts: list[int], count: int, sum: float):
+		"""
+		Добавляет значения другой гистограммы с теми же границами корзин.
+
+		:param counts: Количество значений в каждой корзине.
+		:type counts: list[int]
+		:param count: Общее количество значений.
+		:type count: int
+		:param sum: Сумма значений в секундах.
+		:type sum: float
+		"""
+
+		self.counts = [Current + Added for Current, Added in zip(self.counts, counts)]
+		self.count += count
+		self.sum += sum
+
+	def quantile(self, q: float) -> float:
+		"""
+		Оценивает квантиль линейной интерполяцией внутри корзины.
+
+		:param q: Уровень квантиля от 0 до 1.
+		:type q: float
+		:return: Оценка квантиля в секундах.
+		:rtype: float
+		"""
+
+		if not self.count: return 0.0
+		Rank = q * self.count
+		Accumulated = 0
+
+		for Index, Count in enumerate(self.counts):
+			if Accumulated + Count >= Rank and Count:
+				if Index == len(self.buckets): return self.buckets[-1]
+				Lower = self.buckets[Index - 1] if Index else 0.0
+				return Lower + (self.buckets[Index] - Lower) * (Rank - Accumulated) / Count
+
+			Accumulated += Count
+
+		return self.buckets[-1]
+
+class NullTimer:
+	"""Пустой таймер, используемый при отключённых метриках."""
+
+	__slots__ = ()
+
+	def __enter__(self): return self
+
+	def __exit__(self, exception_type, exception, traceback): return False
+
+class Timer:
+	"""Таймер этапа обработки: по выходе из блока `with` учитывает длительность, а при исключении – ошибку этапа."""
+
+	__slots__ = ("__Registry", "__Stage", "__StartTime")
+
+	def __init__(self, registry: "MetricsRegistry", stage: str):
+		"""
+		Таймер этапа обработки.
+
+		:param registry: Реестр метрик.
+		:type registry: MetricsRegistry
+		:param stage: Название этапа.
+		:type stage: str
+		"""
+
+		self.__Registry = registry
+		self.__Stage = stage
+
+	def __enter__(self):
+		self.__StartTime = perf_counter()
+		return self
+
+	def __exit__(self, exception_type, exception, traceback):
+		self.__Registry.observe(self.__Stage, perf_counter() - self.__StartTime)
+		if exception_type: self.__Registry.increment("stage_errors", stage = self.__Stage)
+
+		return False
+
+NULL_TIMER = NullTimer()
+
+class MetricsRequestHandler(BaseHTTPRequestHandler):
+	"""Обработчик HTTP-запросов метрик."""
+
+	def do_GET(self):
+		"""Отдаёт метрики в текстовом формате Prometheus или их текстовую сводку."""
+
+		Registry: "MetricsRegistry" = self.server.registry
+
+		match self.path:
+			case "/metrics": self.__Respond(Registry.render(), "text/plain; version=0.0.4; charset=utf-8")
+			case "/summary": self.__Respond(Registry.summary() + "\n", "text/plain; charset=utf-8")
+			case _: self.__Respond(None)
+
+	def do_POST(self):
+		"""Запускает профилирование на указанное в параметре _duration_ количество секунд."""
+
+		Profiler: SamplingProfiler | None = self.server.profiler
+		URL = urlsplit(self.path)
+
+		if URL.path != "/profile" or not Profiler:
+			self.__Respond(None)
+			return
+
+		try: Duration = float(parse_qs(URL.query).get("duration", ["30"])[0])
+
+		except ValueError:
+			self.__Respond("Некорректная длительность.\n", code = 400)
+			return
+
+		if Profiler.start(Duration): self.__Respond(f"Профилирование запущено на {Duration:g} с.\n", code = 202)
+		else: self.__Respond("Профилирование уже выполняется.\n", code = 409)
+
+	def log_message(self, format: str, *args):
+		"""Отключает вывод журнала запросов."""
+
+		pass
+
+	def __Respond(self, text: str | None, content_type: str = "text/plain; charset=utf-8", code: int = 200):
+		"""
+		Отправляет ответ.
+
+		:param text: Тело ответа. При `None` отправляется пустой ответ с кодом 404.
+		:type text: str | None
+		:param content_type: Тип содержимого.
+		:type content_type: str
+		:param code: Код ответа.
+		:type code: int
+		"""
+
+		Body = text.encode("utf-8") if text is not None else b""
+		self.send_response(code if text is not None else 404)
+		if text is not None: self.send_header("Content-Type", content_type)
+		self.send_header("Content-Length", str(len(Body)))
+		self.end_headers()
+		self.wfile.write(Body)
+
+#==========================================================================================#
+# >>>>> ОСНОВНЫЕ КЛАССЫ <<<<< #
+#==========================================================================================#
+
+class MetricsRegistry:
+	"""Реестр метрик: гистограммы длительностей этапов обработки, счётчики исходов и ошибок, а также датчики глубины очередей. В отключённом состоянии таймеры не выполняют никаких измерений."""
+
+	#==========================================================================================#
+	# >>>>> СВОЙСТВА <<<<< #
+	#==========================================================================================#
+
+	@property
+	def enabled(self) -> bool:
+		"""Состояние: включён ли сбор метрик."""
+
+		return self.__IsEnabled
+
+	#==========================================================================================#
+	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __FormatLabels(self, labels: tuple[tuple[str, str]]) -> str:
+		"""
+		Форматирует метки метрики.
+
+		:param labels: Пары названий и значений меток.
+		:type labels: tuple[tuple[str, str]]
+		:return: Метки в формате Prometheus.
+		:rtype: str
+		"""
+
+		if not labels: return ""
+		Values = list()
+
+		for Name, Value in labels:
+			Value = str(Value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+			Values.append(f"{Name}=\"{Value}\"")
+
+		return "{" + ",".join(Values) + "}"
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __init__(self, prefix: str = "buzzer", buckets: tuple[float] = BUCKETS):
+		"""
+		Реестр метрик. По умолчанию сбор метрик отключён.
+
+		:param prefix: Префикс названий метрик.
+		:type prefix: str
+		:param buckets: Верхние границы корзин гистограмм в секундах.
+		:type buckets: tuple[float]
+		"""
+
+		self.__Prefix = prefix
+		self.__Buckets = tuple(sorted(buckets))
+		self.__IsEnabled = False
+
+		self.__Lock = threading.Lock()
+		self.__Histograms: dict[str, Histogram] = dict()
+		self.__Counters: dict[tuple[str, tuple], int] = dict()
+		self.__Gauges: dict[str, Callable[[], float]] = dict()
+
+	def collect(self) -> dict:
+		"""
+		Возвращает накопленные длительности этапов и счётчики, обнуляя их. Используется рабочими процессами для передачи метрик основному процессу.
+
+		:return: Гистограммы этапов под ключом _histograms_ и счётчики под ключом _counters_.
+		:rtype: dict
+		"""
+
+		with self.__Lock:
+			Collected = {
+				"histograms": {Stage: (Value.counts, Value.count, Value.sum) for Stage, Value in self.__Histograms.items()},
+				"counters": self.__Counters
+			}
+			self.__Histograms = dict()
+			self.__Counters = dict()
+
+		return Collected
+
+	def enable(self, status: bool = True):
+		"""
+		Включает или отключает сбор метрик.
+
+		:param status: Состояние.
+		:type status: bool
+		"""
+
+		self.__IsEnabled = status
+
+	def gauge(self, name: str, function: Callable[[], float]):
+		"""
+		Регистрирует датчик, значение которого вычисляется при выгрузке метрик.
+
+		:param name: Название датчика.
+		:type name: str
+		:param function: Функция, возвращающая текущее значение.
+		:type function: Callable[[], float]
+		"""
+
+		with self.__Lock: self.__Gauges[name] = function
+
+	def increment(self, name: str, value: int = 1, **labels: str):
+		"""
+		Увеличивает значение счётчика.
+
+		:param name: Название счётчика без суффикса _\\_total_.
+		:type name: str
+		:param value: Прирост.
+		:type value: int
+		:param labels: Метки счётчика.
+		:type labels: str
+		"""
+
+		if not self.__IsEnabled: return
+		Key = (name, tuple(sorted(labels.items())))
+
+		with self.__Lock: self.__Counters[Key] = self.__Counters.get(Key, 0) + value
+
+	def merge(self, collected: dict):
+		"""
+		Добавляет метрики, собранные методом `collect()` в другом процессе.
+
+		:param collected: Собранные метрики.
+		:type collected: dict
+		"""
+
+		if not self.__IsEnabled: return
+
+		with self.__Lock:
+
+			for Stage, Values in collected["histograms"].items():
+				if Stage not in self.__Histograms: self.__Histograms[Stage] = Histogram(self.__Buckets)
+				self.__Histograms[Stage].merge(*Values)
+
+			for Key, Value in collected["counters"].items(): self.__Counters[Key] = self.__Counters.get(Key, 0) + Value
+
+	def observe(self, stage: str, seconds: float):
+		"""
+		Учитывает длительность этапа обработки.
+
+		:param stage: Название этапа.
+		:type stage: str
+		:param seconds: Длительность в секундах.
+		:type seconds: float
+		"""
+
+		if not self.__IsEnabled: return
+
+		with self.__Lock:
+			if stage not in self.__Histograms: self.__Histograms[stage] = Histogram(self.__Buckets)
+			self.__Histograms[stage].observe(seconds)
+
+	def render(self) -> str:
+		"""
+		Выгружает метрики в текстовом формате Prometheus.
+
+		:return: Метрики.
+		:rtype: str
+		"""
+
+		Prefix = self.__Prefix
+		Lines = list()
+
+		with self.__Lock:
+			Histograms = {Stage: (Value.counts.copy(), Value.count, Value.sum) for Stage, Value in self.__Histograms.items()}
+			Counters = self.__Counters.copy()
+			Gauges = self.__Gauges.copy()
+
+		if Histograms:
+			Lines.append(f"# TYPE {Prefix}_stage_seconds histogram")
+
+			for Stage, (Counts, Count, Sum) in sorted(Histograms.items()):
+				Accumulated = 0
+
+				for Bound, BucketCount in zip(self.__Buckets + (float("inf"),), Counts):
+					Accumulated += BucketCount
+					Bound = "+Inf" if Bound == float("inf") else repr(Bound)
+					Lines.append(f"{Prefix}_stage_seconds_bucket{self.__FormatLabels((('stage', Stage), ('le', Bound)))} {Accumulated}")
+
+				Lines.append(f"{Prefix}_stage_seconds_sum{self.__FormatLabels((('stage', Stage),))} {Sum}")
+				Lines.append(f"{Prefix}_stage_seconds_count{self.__FormatLabels((('stage', Stage),))} {Count}")
+
+		for Name in sorted({Name for Name, _ in Counters.keys()}):
+			Lines.append(f"# TYPE {Prefix}_{Name}_total counter")
+
+			for (CounterName, Labels), Value in sorted(Counters.items()):
+				if CounterName == Name: Lines.append(f"{Prefix}_{Name}_total{self.__FormatLabels(Labels)} {Value}")
+
+		for Name, Function in sorted(Gauges.items()):
+
+			try: Value = float(Function())
+			except Exception: continue
+
+			Lines.append(f"# TYPE {Prefix}_{Name} gauge")
+			Lines.append(f"{Prefix}_{Name} {Value}")
+
+		return "\n".join(Lines) + "\n"
+
+	def summary(self) -> str:
+		"""
+		Возвращает текстовую сводку длительностей этапов обработки и ошибок.
+
+		:return: Сводка.
+		:rtype: str
+		"""
+
+		Lines = list()
+
+		with self.__Lock:
+
+			for Stage, Value in sorted(self.__Histograms.items()):
+				Errors = self.__Counters.get(("stage_errors", (("stage", Stage),)), 0)
+				Average = Value.sum / Value.count * 1000
+				Lines.append(f"{Stage}: {Value.count} шт., среднее {Average:.1f} мс, p50 {Value.quantile(0.5) * 1000:.1f} мс, p95 {Value.quantile(0.95) * 1000:.1f} мс, ошибок {Errors}")
+
+		return "\n".join(Lines) if Lines else "Метрики отсутствуют."
+
+	def timer(self, stage: str) -> Timer | NullTimer:
+		"""
+		Возвращает таймер этапа обработки для использования в блоке `with`.
+
+		:param stage: Название этапа.
+		:type stage: str
+		:return: Таймер или пустой таймер, если сбор метрик отключён.
+		:rtype: Timer | NullTimer
+		"""
+
+		if not self.__IsEnabled: return NULL_TIMER
+
+		return Timer(self, stage)
+
+class MetricsServer:
+	"""Локальный HTTP-сервер, отдающий метрики по пути _/metrics_ и их текстовую сводку по пути _/summary_, а также запускающий профилирование запросом `POST /profile?duration=N`."""
+
+	#==========================================================================================#
+	# >>>>> СВОЙСТВА <<<<< #
+	#==========================================================================================#
+
+	@property
+	def address(self) -> tuple[str, int]:
+		"""Адрес и порт сервера."""
+
+		return self.__Server.server_address[:2]
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __init__(self, registry: MetricsRegistry, host: str = "127.0.0.1", port: int = 9100, profiler: SamplingProfiler | None = None):
+		"""
+		Локальный HTTP-сервер метрик. Запускается в фоновом потоке.
+
+		:param registry: Реестр метрик.
+		:type registry: MetricsRegistry
+		:param host: Адрес для прослушивания.
+		:type host: str
+		:param port: Порт для прослушивания.
+		:type port: int
+		:param profiler: Профилировщик, запускаемый по запросу. При `None` профилирование недоступно.
+		:type profiler: SamplingProfiler | None
+		"""
+
+		self.__Server = ThreadingHTTPServer((host, port), MetricsRequestHandler)
+		self.__Server.daemon_threads = True
+		self.__Server.registry = registry
+		self.__Server.profiler = profiler
+
+		self.__Thread = threading.Thread(target = self.__Server.serve_forever, name = "Metrics", daemon = True)
+		self.__Thread.start()
+
+	def close(self):
+		"""Останавливает сервер."""
+
+		self.__Server.shutdown()
+		self.__Server.server_close()
+
+METRICS = MetricsRegistry()
@@ -0,0 +1,157 @@
+from Source.Core.Metrics import METRICS
+
+from dublib.Methods.Filesystem import ReadTextFile
+
+from collections import OrderedDict
+from os import PathLike
+from time import monotonic
+import threading
+import enum
+import os
+
+from badwords import ProfanityFilter
+
+#==========================================================================================#
+# >>>>> ДОПОЛНИТЕЛЬНЫЕ СТРУКТУРЫ ДАННЫХ <<<<< #
+#==========================================================================================#
+
+class ModerationVerdicts(enum.Enum):
+	"""Вердикты модерации текста."""
+
+	Clean = "clean"
+	Blacklisted = "blacklisted"
+	Obscene = "obscene"
+
+#==========================================================================================#
+# >>>>> ОСНОВНОЙ КЛАСС <<<<< #
+#==========================================================================================#
+
+class Moderator:
+	"""Модератор текста: проверка по чёрному списку и фильтру нецензурной лексики за один проход."""
+
+	#==========================================================================================#
+	# >>>>> СВОЙСТВА <<<<< #
+	#==========================================================================================#
+
+	@property
+	def blacklist_size(self) -> int:
+		"""Количество строк в чёрном списке."""
+
+		return len(self.__Blacklist)
+
+	@property
+	def memo_hits(self) -> int:
+		"""Количество проверок, вердикт для которых взят из памяти без повторного сканирования."""
+
+		return self.__MemoHits
+
+	@property
+	def verdicts(self) -> dict[ModerationVerdicts, int]:
+		"""Количество вынесенных вердиктов каждого типа."""
+
+		return self.__Verdicts.copy()
+
+	#==========================================================================================#
+	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __RefreshBlacklist(self):
+		"""Перечитывает чёрный список, если файл был изменён. Время изменения проверяется не чаще раза в секунду."""
+
+		if monotonic() - self.__LastCheck < 1.0: return
+		self.__LastCheck = monotonic()
+
+		try: ModificationTime = os.stat(self.__BlacklistPath).st_mtime_ns
+		except FileNotFoundError: ModificationTime = None
+
+		if ModificationTime == self.__ModificationTime: return
+		Lines = ReadTextFile(self.__BlacklistPath, split = True, strip = True) if ModificationTime else tuple()
+		self.__Blacklist = frozenset(Line for Line in Lines if Line)
+		self.__ModificationTime = ModificationTime
+		self.__Memo.clear()
+
+	def __Scan(self, text: str) -> ModerationVerdicts:
+		"""
+		Сканирует текст.
+
+		:param text: Текст сообщения.
+		:type text: str
+		:return: Вердикт модерации.
+		:rtype: ModerationVerdicts
+		"""
+
+		Blacklist = self.__Blacklist
+
+		with METRICS.timer("blacklist"):
+			if any(Line in Blacklist for Line in text.split("\n")): return ModerationVerdicts.Blacklisted
+
+		with METRICS.timer("profanity"):
+			if self.__ProfanityFilter and self.__ProfanityFilter.filter_text(text): return ModerationVerdicts.Obscene
+
+		return ModerationVerdicts.Clean
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __init__(self, blacklist_path: PathLike, profanity_filter: ProfanityFilter | None = None, memo_size: int = 4096, memo_limit: int = 512):
+		"""
+		Модератор текста.
+
+		:param blacklist_path: Путь к файлу чёрного списка, где каждая строка – запрещённая строка сообщения.
+		:type blacklist_path: PathLike
+		:param profanity_filter: Фильтр нецензурной лексики.
+		:type profanity_filter: ProfanityFilter | None
+		:param memo_size: Количество запоминаемых вердиктов.
+		:type memo_size: int
+		:param memo_limit: Максимальная длина текста, вердикт для которого запоминается.
+		:type memo_limit: int
+		"""
+
+		self.__BlacklistPath = blacklist_path
+		self.__ProfanityFilter = profanity_filter
+		self.__MemoSize = memo_size
+		self.__MemoLimit = memo_limit
+
+		self.__Blacklist: frozenset[str] = frozenset()
+		self.__Memo: OrderedDict[str, ModerationVerdicts] = OrderedDict()
+		self.__Verdicts = {Verdict: 0 for Verdict in ModerationVerdicts}
+		self.__Lock = threading.Lock()
+		self.__ModificationTime = None
+		self.__LastCheck = -1.0
+		self.__MemoHits = 0
+
+		self.__RefreshBlacklist()
+
+	def check(self, text: str) -> ModerationVerdicts:
+		"""
+		Проверяет текст сообщения.
+
+		:param text: Текст сообщения.
+		:type text: str
+		:return: Вердикт модерации.
+		:rtype: ModerationVerdicts
+		"""
+
+		IsMemorable = self.__MemoSize > 0 and len(text) <= self.__MemoLimit
+
+		with self.__Lock:
+			self.__RefreshBlacklist()
+			Verdict = self.__Memo.get(text) if IsMemorable else None
+
+			if Verdict:
+				self.__Memo.move_to_end(text)
+				self.__MemoHits += 1
+
+		if not Verdict:
+			Verdict = self.__Scan(text)
+
+			if IsMemorable:
+
+				with self.__Lock:
+					self.__Memo[text] = Verdict
+					while len(self.__Memo) > self.__MemoSize: self.__Memo.popitem(last = False)
+
+		with self.__Lock: self.__Verdicts[Verdict] += 1
+
+		return Verdict
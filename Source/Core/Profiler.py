@@ -0,0 +1,198 @@
+from multiprocessing.synchronize import Event
+from collections import Counter
+from datetime import datetime
+from typing import Callable
+from os import PathLike
+from time import monotonic
+from types import FrameType
+import threading
+import sys
+import os
+
+class SamplingProfiler:
+	"""Выборочный профилировщик: с заданным интервалом снимает стеки всех потоков процесса и сохраняет их в свёрнутом формате (collapsed stacks), совместимом с FlameGraph и speedscope."""
+
+	#==========================================================================================#
+	# >>>>> СВОЙСТВА <<<<< #
+	#==========================================================================================#
+
+	@property
+	def is_running(self) -> bool:
+		"""Состояние: выполняется ли профилирование."""
+
+		return self.__IsRunning
+
+	@property
+	def last_path(self) -> str | None:
+		"""Путь к последнему сохранённому профилю."""
+
+		return self.__LastPath
+
+	#==========================================================================================#
+	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __Collapse(self, frame: FrameType, thread_name: str) -> str:
+		"""
+		Сворачивает стек потока в строку.
+
+		:param frame: Текущий кадр потока.
+		:type frame: FrameType
+		:param thread_name: Название потока.
+		:type thread_name: str
+		:return: Кадры от корня к вершине, разделённые точкой с запятой.
+		:rtype: str
+		"""
+
+		Frames = list()
+
+		while frame:
+			Code = frame.f_code
+			Frames.append(f"{Code.co_name} ({os.path.basename(Code.co_filename)}:{Code.co_firstlineno})")
+			frame = frame.f_back
+
+		Frames.append(thread_name)
+
+		return ";".join(reversed(Frames))
+
+	def __Sample(self, is_active: Callable[[], bool]) -> Counter:
+		"""
+		Снимает стеки потоков, пока выполняется условие.
+
+		:param is_active: Функция, проверяющая, нужно ли продолжать профилирование.
+		:type is_active: Callable[[], bool]
+		:return: Количество выборок каждого стека.
+		:rtype: Counter
+		"""
+
+		Stacks = Counter()
+		CurrentID = threading.get_ident()
+
+		while is_active():
+			Names = {Thread.ident: Thread.name for Thread in threading.enumerate()}
+
+			for ThreadID, Frame in sys._current_frames().items():
+				if ThreadID != CurrentID: Stacks[self.__Collapse(Frame, Names.get(ThreadID, str(ThreadID)))] += 1
+
+			self.__Stop.wait(self.__Interval)
+
+		return Stacks
+
+	def __Save(self, stacks: Counter, started: datetime) -> str:
+		"""
+		Сохраняет профиль в файл.
+
+		:param stacks: Количество выборок каждого стека.
+		:type stacks: Counter
+		:param started: Время начала профилирования.
+		:type started: datetime
+		:return: Путь к файлу профиля.
+		:rtype: str
+		"""
+
+		if not os.path.exists(self.__Directory): os.makedirs(self.__Directory)
+		Path = os.path.join(self.__Directory, f"{started.strftime('%Y-%m-%d_%H-%M-%S')}_{os.getpid()}.collapsed")
+
+		with open(Path, "w", encoding = "utf-8") as FileWriter:
+			for Stack, Count in stacks.most_common(): FileWriter.write(f"{Stack} {Count}\n")
+
+		self.__LastPath = Path
+
+		return Path
+
+	def __Run(self, duration: float, callback: Callable[[str | None], None] | None):
+		"""
+		Выполняет профилирование в течение заданного времени.
+
+		:param duration: Длительность профилирования в секундах.
+		:type duration: float
+		:param callback: Функция, вызываемая по завершении с путём к файлу профиля или `None` при ошибке.
+		:type callback: Callable[[str | None], None] | None
+		"""
+
+		Started = datetime.now()
+		Deadline = monotonic() + duration
+		Path = None
+		if self.__Event: self.__Event.set()
+
+		try:
+			Stacks = self.__Sample(lambda: monotonic() < Deadline and not self.__Stop.is_set())
+			Path = self.__Save(Stacks, Started)
+
+		except Exception as ExceptionData: print(ExceptionData)
+
+		finally:
+			if self.__Event: self.__Event.clear()
+			self.__IsRunning = False
+
+		if callback: callback(Path)
+
+	def __Follow(self):
+		"""Профилирует процесс каждый раз, пока установлено общее событие."""
+
+		while not self.__Stop.is_set():
+			self.__Event.wait()
+			Started = datetime.now()
+
+			try: self.__Save(self.__Sample(self.__Event.is_set), Started)
+			except Exception as ExceptionData: print(ExceptionData)
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __init__(self, directory: PathLike = "Data/Profiles", interval: float = 0.005, max_duration: float = 300, event: Event | None = None):
+		"""
+		Выборочный профилировщик.
+
+		:param directory: Каталог для сохранения профилей.
+		:type directory: PathLike
+		:param interval: Интервал между выборками в секундах.
+		:type interval: float
+		:param max_duration: Максимальная длительность профилирования в секундах.
+		:type max_duration: float
+		:param event: Событие, разделяемое с рабочими процессами. Устанавливается на время профилирования, чтобы рабочие процессы, вызвавшие `follow()`, профилировали себя одновременно с основным.
+		:type event: Event | None
+		"""
+
+		self.__Directory = directory
+		self.__Interval = max(interval, 0.001)
+		self.__MaxDuration = max_duration
+		self.__Event = event
+
+		self.__Lock = threading.Lock()
+		self.__Stop = threading.Event()
+		self.__IsRunning = False
+		self.__LastPath = None
+
+	def close(self):
+		"""Прерывает текущее профилирование. Собранные выборки сохраняются."""
+
+		self.__Stop.set()
+
+	def follow(self):
+		"""Запускает в рабочем процессе фоновый поток, профилирующий процесс, пока установлено общее событие."""
+
+		if not self.__Event: return
+		threading.Thread(target = self.__Follow, name = "Profiler", daemon = True).start()
+
+	def start(self, duration: float, callback: Callable[[str | None], None] | None = None) -> bool:
+		"""
+		Запускает профилирование в фоновом потоке.
+
+		:param duration: Длительность профилирования в секундах. Ограничивается значением _max_duration_.
+		:type duration: float
+		:param callback: Функция, вызываемая из потока профилирования по завершении с путём к файлу профиля основного процесса или `None` при ошибке.
+		:type callback: Callable[[str | None], None] | None
+		:return: Возвращает `False`, если профилирование уже выполняется.
+		:rtype: bool
+		"""
+
+		with self.__Lock:
+			if self.__IsRunning: return False
+			self.__IsRunning = True
+
+		Duration = min(max(duration, 0), self.__MaxDuration)
+		threading.Thread(target = self.__Run, args = (Duration, callback), name = "Profiler", daemon = True).start()
+
+		return True
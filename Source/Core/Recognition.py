@@ -0,0 +1,313 @@
+from Source.Core.Profiler import SamplingProfiler
+from Source.Core.Decoder import DecoderBackends
+from Source.Core.Metrics import METRICS
+
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable
+import multiprocessing
+import threading
+import asyncio
+
+#==========================================================================================#
+# >>>>> ДОПОЛНИТЕЛЬНЫЕ СТРУКТУРЫ ДАННЫХ <<<<< #
+#==========================================================================================#
+
+class RecognitionRejected(Exception):
+	"""Задача распознавания отклонена из-за переполнения очереди пула процессов."""
+
+	pass
+
+#==========================================================================================#
+# >>>>> ФУНКЦИИ РАБОЧИХ ПРОЦЕССОВ <<<<< #
+#==========================================================================================#
+
+WORKER = None
+
+def InitializeWorker(model: str, use_ffmpeg: bool, recognizers: int, warmup: bool, decoder: DecoderBackends | None, tempo: float | None, profiler: SamplingProfiler | None):
+	"""
+	Создаёт преобразователь голоса в речь рабочего процесса, однократно загружая модель **VOSK**, и включает сбор метрик для передачи основному процессу. Метрики, унаследованные от основного процесса при порождении, отбрасываются.
+
+	:param model: Название каталога с используемой моделью **VOSK**.
+	:type model: str
+	:param use_ffmpeg: Указывает, нужно ли использовать **ffmpeg** для декодирования аудио.
+	:type use_ffmpeg: bool
+	:param recognizers: Количество переиспользуемых распознавателей **VOSK** для каждой частоты дискретизации.
+	:type recognizers: int
+	:param warmup: Указывает, нужно ли прогреть модель пробным распознаванием.
+	:type warmup: bool
+	:param decoder: Способ декодирования аудио.
+	:type decoder: DecoderBackends | None
+	:param tempo: Коэффициент изменения темпа аудио.
+	:type tempo: float | None
+	:param profiler: Профилировщик основного процесса, за профилированием которого следует рабочий процесс.
+	:type profiler: SamplingProfiler | None
+	"""
+
+	from Source.Core.Speecher import Speecher
+
+	global WORKER
+	WORKER = Speecher(model, use_ffmpeg, recognizers = recognizers, warmup = warmup, decoder = decoder, tempo = tempo)
+	METRICS.collect()
+	METRICS.enable()
+	if profiler: profiler.follow()
+
+def IsWorkerReady() -> bool:
+	"""
+	Проверяет, инициализирован ли рабочий процесс.
+
+	:return: Возвращает `True`, если модель рабочего процесса загружена.
+	:rtype: bool
+	"""
+
+	return WORKER is not None
+
+def ExecuteInWorker(method: str, *args) -> tuple[Any, dict]:
+	"""
+	Вызывает метод преобразователя голоса в речь рабочего процесса.
+
+	:param method: Название метода.
+	:type method: str
+	:return: Результат выполнения метода и метрики, накопленные рабочим процессом с момента предыдущей передачи.
+	:rtype: tuple[Any, dict]
+	"""
+
+	return getattr(WORKER, method)(*args), WORKER.collect_metrics()
+
+#==========================================================================================#
+# >>>>> ОСНОВНОЙ КЛАСС <<<<< #
+#==========================================================================================#
+
+class RecognitionPool:
+	"""Пул процессов распознавания речи, в каждом из которых модель **VOSK** загружена заранее."""
+
+	#==========================================================================================#
+	# >>>>> СВОЙСТВА <<<<< #
+	#==========================================================================================#
+
+	@property
+	def metrics(self) -> dict[str, int]:
+		"""Метрики пула: _queued_ – задач в очереди и в работе, _completed_ – выполнено, _failed_ – завершено ошибкой, _timeouts_ – превышено время ожидания, _stalled_ – задач, время ожидания которых истекло, но которые всё ещё занимают рабочий процесс и место в очереди, _rejected_ – отклонено из-за переполнения очереди, _restarts_ – пересозданий пула после аварийного завершения рабочего процесса."""
+
+		with self.__Lock:
+			return {
+				"queued": self.__Queued,
+				"completed": self.__Completed,
+				"failed": self.__Failed,
+				"timeouts": self.__Timeouts,
+				"stalled": len(self.__Stalled),
+				"rejected": self.__Rejected,
+				"restarts": self.__Restarts
+			}
+
+	@property
+	def workers(self) -> int:
+		"""Количество рабочих процессов."""
+
+		return self.__Workers
+
+	#==========================================================================================#
+	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __CreateExecutor(self) -> ProcessPoolExecutor:
+		"""
+		Создаёт пул рабочих процессов. Процессы порождаются при постановке первой задачи.
+
+		:return: Пул рабочих процессов.
+		:rtype: ProcessPoolExecutor
+		"""
+
+		return ProcessPoolExecutor(
+			max_workers = self.__Workers,
+			mp_context = multiprocessing.get_context("fork"),
+			initializer = InitializeWorker,
+			initargs = self.__InitArgs
+		)
+
+	def __CountTimeout(self, future: Future):
+		"""
+		Учитывает превышение времени ожидания задачи. Незавершённая задача продолжает выполняться и учитывается как зависшая до своего завершения.
+
+		:param future: Объект задачи.
+		:type future: Future
+		"""
+
+		with self.__Lock:
+			self.__Timeouts += 1
+			if not future.done(): self.__Stalled.add(future)
+
+	def __OnDone(self, future: Future):
+		"""
+		Обрабатывает завершение задачи.
+
+		:param future: Объект задачи.
+		:type future: Future
+		"""
+
+		self.__Slots.release()
+		IsFailed = future.cancelled() or future.exception()
+
+		with self.__Lock:
+			self.__Queued -= 1
+			self.__Stalled.discard(future)
+			if IsFailed: self.__Failed += 1
+			else: self.__Completed += 1
+
+		if not IsFailed and self.__Collector: self.__Collector(future.result()[1])
+
+	def __Restart(self, executor: ProcessPoolExecutor):
+		"""
+		Заменяет неработоспособный после аварийного завершения рабочего процесса пул новым, если его ещё не заменил другой поток.
+
+		:param executor: Неработоспособный пул.
+		:type executor: ProcessPoolExecutor
+		"""
+
+		with self.__Lock:
+			if self.__Executor is not executor: return
+			self.__Executor = self.__CreateExecutor()
+			self.__Restarts += 1
+
+		executor.shutdown(wait = False, cancel_futures = True)
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __init__(self, model: str, use_ffmpeg: bool = False, workers: int = 2, queue_size: int = 32, timeout: float = 120, recognizers: int = 2, warmup: bool = True, decoder: DecoderBackends | None = None, tempo: float | None = None, profiler: SamplingProfiler | None = None, collector: Callable[[dict], None] | None = None):
+		"""
+		Пул процессов распознавания речи.
+
+		Рабочие процессы порождаются сразу при создании пула, поэтому его следует создавать до запуска потоков бота. Если рабочий процесс завершился аварийно, пул пересоздаётся при постановке следующей задачи.
+
+		Превышение времени ожидания прекращает лишь ожидание результата: рабочий процесс продолжает выполнять задачу, а её место в очереди остаётся занятым до завершения. Такие задачи учитываются в метрике _stalled_.
+
+		:param model: Название каталога с используемой моделью **VOSK**.
+		:type model: str
+		:param use_ffmpeg: Указывает, нужно ли использовать **ffmpeg** для декодирования аудио.
+		:type use_ffmpeg: bool
+		:param workers: Количество рабочих процессов.
+		:type workers: int
+		:param queue_size: Максимальное количество задач в очереди и в работе. Задачи сверх лимита отклоняются.
+		:type queue_size: int
+		:param timeout: Время ожидания результата одной задачи в секундах. Не прерывает выполнение задачи.
+		:type timeout: float
+		:param recognizers: Количество переиспользуемых распознавателей **VOSK** в каждом рабочем процессе для каждой частоты дискретизации.
+		:type recognizers: int
+		:param warmup: Указывает, нужно ли прогреть модель в каждом рабочем процессе при запуске.
+		:type warmup: bool
+		:param decoder: Способ декодирования аудио в рабочих процессах.
+		:type decoder: DecoderBackends | None
+		:param tempo: Коэффициент изменения темпа аудио.
+		:type tempo: float | None
+		:param profiler: Профилировщик, одновременно с которым рабочие процессы профилируют себя. Передаётся в рабочие процессы при их порождении.
+		:type profiler: SamplingProfiler | None
+		:param collector: Обработчик метрик, возвращаемых рабочими процессами вместе с результатом каждой задачи (в том числе завершённой после превышения времени ожидания).
+		:type collector: Callable[[dict], None] | None
+		"""
+
+		self.__Workers = max(workers, 1)
+		self.__Timeout = timeout
+		self.__Collector = collector
+
+		self.__Slots = threading.BoundedSemaphore(max(queue_size, 1))
+		self.__Lock = threading.Lock()
+		self.__Queued = 0
+		self.__Completed = 0
+		self.__Failed = 0
+		self.__Timeouts = 0
+		self.__Stalled: set[Future] = set()
+		self.__Rejected = 0
+		self.__Restarts = 0
+
+		self.__InitArgs = (model, use_ffmpeg, recognizers, warmup, decoder, tempo, profiler)
+		self.__Executor = self.__CreateExecutor()
+		self.__Executor.submit(IsWorkerReady).result()
+
+	def close(self):
+		"""Останавливает рабочие процессы."""
+
+		self.__Executor.shutdown(wait = False, cancel_futures = True)
+
+	def execute(self, method: str, *args) -> Any:
+		"""
+		Выполняет метод преобразователя голоса в речь в рабочем процессе и ожидает результата.
+
+		:param method: Название метода **Speecher**.
+		:type method: str
+		:return: Результат выполнения метода или `None` при ошибке или превышении времени ожидания.
+		:rtype: Any
+		:raises RecognitionRejected: Выбрасывается при переполнении очереди пула.
+		"""
+
+		Submitted = self.submit(method, *args)
+		if not Submitted: return None
+
+		try: return Submitted.result(timeout = self.__Timeout)[0]
+		except TimeoutError: self.__CountTimeout(Submitted)
+
+		except Exception as ExceptionData: print(ExceptionData)
+
+		return None
+
+	async def execute_async(self, method: str, *args) -> Any:
+		"""
+		Выполняет метод преобразователя голоса в речь в рабочем процессе, не блокируя цикл событий на время ожидания результата.
+
+		:param method: Название метода **Speecher**.
+		:type method: str
+		:return: Результат выполнения метода или `None` при ошибке или превышении времени ожидания.
+		:rtype: Any
+		:raises RecognitionRejected: Выбрасывается при переполнении очереди пула.
+		"""
+
+		Submitted = self.submit(method, *args)
+		if not Submitted: return None
+
+		try: return (await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(Submitted)), self.__Timeout))[0]
+		except asyncio.TimeoutError: self.__CountTimeout(Submitted)
+
+		except Exception as ExceptionData: print(ExceptionData)
+
+		return None
+
+	def submit(self, method: str, *args) -> Future | None:
+		"""
+		Ставит вызов метода преобразователя голоса в речь в очередь рабочих процессов. Если пул неработоспособен после аварийного завершения рабочего процесса, он пересоздаётся и постановка повторяется один раз.
+
+		:param method: Название метода **Speecher**.
+		:type method: str
+		:return: Выполняемая задача, результатом которой является кортеж из результата метода и метрик рабочего процесса, или `None` при ошибке постановки.
+		:rtype: Future | None
+		:raises RecognitionRejected: Выбрасывается при переполнении очереди пула.
+		"""
+
+		if not self.__Slots.acquire(blocking = False):
+			with self.__Lock: self.__Rejected += 1
+			raise RecognitionRejected()
+
+		with self.__Lock: self.__Queued += 1
+		Executor = self.__Executor
+
+		try:
+
+			try: Submitted = Executor.submit(ExecuteInWorker, method, *args)
+
+			except BrokenProcessPool:
+				self.__Restart(Executor)
+				Submitted = self.__Executor.submit(ExecuteInWorker, method, *args)
+
+			Submitted.add_done_callback(self.__OnDone)
+
+		except Exception as ExceptionData:
+			self.__Slots.release()
+
+			with self.__Lock:
+				self.__Queued -= 1
+				self.__Failed += 1
+
+			print(ExceptionData)
+			return None
+
+		return Submitted
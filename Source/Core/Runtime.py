@@ -0,0 +1,113 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Coroutine
+import threading
+import asyncio
+
+class AsyncRuntime:
+	"""Цикл событий asyncio в отдельном потоке, в котором переводы и распознавание ожидают результатов как сопрограммы, не занимая потоки обработчиков бота."""
+
+	#==========================================================================================#
+	# >>>>> СВОЙСТВА <<<<< #
+	#==========================================================================================#
+
+	@property
+	def loop(self) -> asyncio.AbstractEventLoop:
+		"""Цикл событий."""
+
+		return self.__Loop
+
+	@property
+	def metrics(self) -> dict[str, int]:
+		"""Метрики: _in_flight_ – выполняемых сопрограмм, _completed_ – завершено, _failed_ – завершено ошибкой."""
+
+		with self.__Lock:
+			return {
+				"in_flight": self.__InFlight,
+				"completed": self.__Completed,
+				"failed": self.__Failed
+			}
+
+	#==========================================================================================#
+	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __OnDone(self, future: Future):
+		"""
+		Обрабатывает завершение сопрограммы.
+
+		:param future: Объект задачи.
+		:type future: Future
+		"""
+
+		IsFailed = future.cancelled() or future.exception() is not None
+		if IsFailed and not future.cancelled(): print(future.exception())
+
+		with self.__Lock:
+			self.__InFlight -= 1
+			if IsFailed: self.__Failed += 1
+			else: self.__Completed += 1
+
+	def __Run(self):
+		"""Выполняет цикл событий до остановки."""
+
+		asyncio.set_event_loop(self.__Loop)
+		self.__Loop.run_forever()
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __init__(self, workers: int = 16):
+		"""
+		Цикл событий asyncio в отдельном потоке.
+
+		:param workers: Количество потоков для блокирующих операций (запросов к Telegram, распознавания без пула процессов, длинных переводов), выполняемых через `asyncio.to_thread()`.
+		:type workers: int
+		"""
+
+		self.__Executor = ThreadPoolExecutor(max_workers = max(workers, 1), thread_name_prefix = "Runtime")
+		self.__Loop = asyncio.new_event_loop()
+		self.__Loop.set_default_executor(self.__Executor)
+
+		self.__Lock = threading.Lock()
+		self.__InFlight = 0
+		self.__Completed = 0
+		self.__Failed = 0
+
+		self.__Thread = threading.Thread(target = self.__Run, name = "Runtime", daemon = True)
+		self.__Thread.start()
+
+	def call(self, function: Callable[..., Coroutine], *args, **kwargs) -> Future:
+		"""
+		Создаёт сопрограмму вызовом асинхронной функции и запускает её в цикле событий. Позволяет отложить создание сопрограммы до момента запуска.
+
+		:param function: Асинхронная функция.
+		:type function: Callable[..., Coroutine]
+		:return: Задача, результатом которой станет результат сопрограммы.
+		:rtype: Future
+		"""
+
+		return self.submit(function(*args, **kwargs))
+
+	def close(self):
+		"""Останавливает цикл событий и пул потоков."""
+
+		self.__Loop.call_soon_threadsafe(self.__Loop.stop)
+		self.__Thread.join()
+		self.__Executor.shutdown(wait = False, cancel_futures = True)
+
+	def submit(self, coroutine: Coroutine) -> Future:
+		"""
+		Запускает сопрограмму в цикле событий и сразу возвращает управление. Исключения сопрограммы выводятся в консоль.
+
+		:param coroutine: Сопрограмма.
+		:type coroutine: Coroutine
+		:return: Задача, результатом которой станет результат сопрограммы.
+		:rtype: Future
+		"""
+
+		with self.__Lock: self.__InFlight += 1
+		Submitted = asyncio.run_coroutine_threadsafe(coroutine, self.__Loop)
+		Submitted.add_done_callback(self.__OnDone)
+
+		return Submitted
@@ -0,0 +1,205 @@
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+from dataclasses import dataclass
+from time import monotonic
+from typing import Callable
+import threading
+import enum
+
+#==========================================================================================#
+# >>>>> ДОПОЛНИТЕЛЬНЫЕ СТРУКТУРЫ ДАННЫХ <<<<< #
+#==========================================================================================#
+
+class JobKinds(enum.Enum):
+	"""Типы задач пользователей."""
+
+	Text = "text"
+	Voice = "voice"
+
+@dataclass
+class UserJob:
+	"""Задача пользователя."""
+
+	user_id: int
+	kind: JobKinds
+	function: Callable
+	args: tuple
+	kwargs: dict
+	enqueued: float
+
+#==========================================================================================#
+# >>>>> ОСНОВНОЙ КЛАСС <<<<< #
+#==========================================================================================#
+
+class Scheduler:
+	"""Справедливый планировщик задач пользователей: очереди пользователей обслуживаются по кругу с ограничением количества выполняемых задач каждого, а текстовые задачи выполняются раньше распознавания аудиосообщений."""
+
+	#==========================================================================================#
+	# >>>>> СВОЙСТВА <<<<< #
+	#==========================================================================================#
+
+	@property
+	def metrics(self) -> dict[str, int | float]:
+		"""Метрики планировщика: _queued_ – задач в очереди, _running_ – выполняется, _completed_ – выполнено, _rejected_ – отклонено из-за переполнения очередей, _wait_text_ и _wait_voice_ – среднее время ожидания задач в очереди в секундах."""
+
+		with self.__Condition:
+			return {
+				"queued": self.__Queued,
+				"running": sum(self.__Running.values()),
+				"completed": self.__Completed,
+				"rejected": self.__Rejected,
+				"wait_text": self.__Waits[JobKinds.Text][0] / self.__Waits[JobKinds.Text][1] if self.__Waits[JobKinds.Text][1] else 0.0,
+				"wait_voice": self.__Waits[JobKinds.Voice][0] / self.__Waits[JobKinds.Voice][1] if self.__Waits[JobKinds.Voice][1] else 0.0
+			}
+
+	#==========================================================================================#
+	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __Finish(self, job: UserJob):
+		"""
+		Завершает задачу пользователя.
+
+		:param job: Задача.
+		:type job: UserJob
+		"""
+
+		with self.__Condition:
+			self.__Running[job.user_id] -= 1
+			if not self.__Running[job.user_id]: del self.__Running[job.user_id]
+			self.__Completed += 1
+			self.__Condition.notify()
+
+	def __Pick(self) -> UserJob | None:
+		"""
+		Выбирает следующую задачу: текстовые задачи имеют приоритет, но после _text_weight_ текстовых подряд выполняется ожидающая задача распознавания. Вызывается под блокировкой.
+
+		:return: Задача или `None`, если доступных задач нет.
+		:rtype: UserJob | None
+		"""
+
+		Kinds = (JobKinds.Voice, JobKinds.Text) if self.__TextStreak >= self.__TextWeight else (JobKinds.Text, JobKinds.Voice)
+
+		for Kind in Kinds:
+			Ring = self.__Queues[Kind]
+
+			for UserID in Ring.keys():
+				if self.__Running.get(UserID, 0) >= self.__UserLimit: continue
+
+				Jobs = Ring[UserID]
+				Job = Jobs.popleft()
+				if Jobs: Ring.move_to_end(UserID)
+				else: del Ring[UserID]
+
+				self.__TextStreak = self.__TextStreak + 1 if Kind == JobKinds.Text else 0
+				self.__Queued -= 1
+				self.__UserQueued[UserID] -= 1
+				if not self.__UserQueued[UserID]: del self.__UserQueued[UserID]
+				self.__Running[UserID] = self.__Running.get(UserID, 0) + 1
+				self.__Waits[Kind][0] += monotonic() - Job.enqueued
+				self.__Waits[Kind][1] += 1
+
+				return Job
+
+		return None
+
+	def __Work(self):
+		"""Выполняет задачи до остановки планировщика."""
+
+		while True:
+
+			with self.__Condition:
+
+				while True:
+					if self.__IsClosed: return
+					Job = self.__Pick()
+					if Job: break
+					self.__Condition.wait()
+
+			try:
+				Result = Job.function(*Job.args, **Job.kwargs)
+
+				if isinstance(Result, Future):
+					Result.add_done_callback(lambda Completed, Job = Job: self.__Finish(Job))
+					continue
+
+			except Exception as ExceptionData: print(ExceptionData)
+
+			self.__Finish(Job)
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __init__(self, workers: int = 8, user_limit: int = 1, user_queue_size: int = 4, queue_size: int = 256, text_weight: int = 3):
+		"""
+		Справедливый планировщик задач пользователей.
+
+		:param workers: Количество потоков, выполняющих задачи.
+		:type workers: int
+		:param user_limit: Максимальное количество одновременно выполняемых задач одного пользователя.
+		:type user_limit: int
+		:param user_queue_size: Максимальное количество ожидающих задач одного пользователя.
+		:type user_queue_size: int
+		:param queue_size: Максимальное количество ожидающих задач всех пользователей.
+		:type queue_size: int
+		:param text_weight: Количество текстовых задач, выполняемых подряд, пока ожидают задачи распознавания.
+		:type text_weight: int
+		"""
+
+		self.__UserLimit = max(user_limit, 1)
+		self.__UserQueueSize = max(user_queue_size, 1)
+		self.__QueueSize = max(queue_size, 1)
+		self.__TextWeight = max(text_weight, 1)
+
+		self.__Condition = threading.Condition()
+		self.__Queues: dict[JobKinds, OrderedDict[int, deque[UserJob]]] = {Kind: OrderedDict() for Kind in JobKinds}
+		self.__UserQueued: dict[int, int] = dict()
+		self.__Running: dict[int, int] = dict()
+		self.__Waits = {Kind: [0.0, 0] for Kind in JobKinds}
+		self.__TextStreak = 0
+		self.__Queued = 0
+		self.__Completed = 0
+		self.__Rejected = 0
+		self.__IsClosed = False
+
+		self.__Workers = [threading.Thread(target = self.__Work, name = f"Scheduler{Index}", daemon = True) for Index in range(max(workers, 1))]
+		for Worker in self.__Workers: Worker.start()
+
+	def close(self):
+		"""Останавливает потоки планировщика. Ожидающие задачи отбрасываются."""
+
+		with self.__Condition:
+			self.__IsClosed = True
+			self.__Condition.notify_all()
+
+	def submit(self, user_id: int, kind: JobKinds, function: Callable, *args, **kwargs) -> bool:
+		"""
+		Ставит задачу пользователя в очередь.
+
+		Если функция задачи возвращает `concurrent.futures.Future`, задача считается выполняемой до завершения этого объекта, но поток планировщика освобождается сразу.
+
+		:param user_id: ID пользователя.
+		:type user_id: int
+		:param kind: Тип задачи.
+		:type kind: JobKinds
+		:param function: Функция задачи.
+		:type function: Callable
+		:return: Возвращает `False`, если очередь пользователя или общая очередь переполнена и задача отклонена.
+		:rtype: bool
+		"""
+
+		with self.__Condition:
+
+			if self.__Queued >= self.__QueueSize or self.__UserQueued.get(user_id, 0) >= self.__UserQueueSize:
+				self.__Rejected += 1
+				return False
+
+			Ring = self.__Queues[kind]
+			if user_id not in Ring: Ring[user_id] = deque()
+			Ring[user_id].append(UserJob(user_id, kind, function, args, kwargs, monotonic()))
+			self.__UserQueued[user_id] = self.__UserQueued.get(user_id, 0) + 1
+			self.__Queued += 1
+			self.__Condition.notify()
+
+		return True
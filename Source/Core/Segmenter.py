@@ -0,0 +1,141 @@
+from typing import Iterable
+from array import array
+import operator
+import math
+
+# Наибольшее количество слов, произносимых за секунду. Ограничивает длину последовательности слов, удаляемой на границе сегментов.
+WORDS_PER_SECOND = 4
+
+class Segmenter:
+	"""Разбиение длинного аудио PCM (моно, 16 бит) на сегменты по паузам с помощью энергетического детектора речи."""
+
+	#==========================================================================================#
+	# >>>>> СВОЙСТВА <<<<< #
+	#==========================================================================================#
+
+	@property
+	def segment(self) -> float:
+		"""Максимальная длина сегмента в секундах."""
+
+		return self.__Segment
+
+	#==========================================================================================#
+	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __GetEnergies(self, samples: array, frame: int) -> list[float]:
+		"""
+		Вычисляет среднюю энергию каждого кадра.
+
+		:param samples: Отсчёты аудио.
+		:type samples: array
+		:param frame: Длина кадра в отсчётах.
+		:type frame: int
+		:return: Список энергий кадров.
+		:rtype: list[float]
+		"""
+
+		Energies = list()
+
+		for Offset in range(0, len(samples), frame):
+			Frame = samples[Offset:Offset + frame]
+			Energies.append(sum(map(operator.mul, Frame, Frame)) / len(Frame))
+
+		return Energies
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __init__(self, segment: float = 30, overlap: float = 0.5, min_silence: float = 0.3, frame: float = 0.03):
+		"""
+		Разбиение длинного аудио на сегменты по паузам.
+
+		:param segment: Максимальная длина сегмента в секундах.
+		:type segment: float
+		:param overlap: Перекрытие соседних сегментов в секундах при принудительном разрезе, если подходящая пауза не найдена.
+		:type overlap: float
+		:param min_silence: Минимальная длительность паузы, по которой допускается разрез, в секундах.
+		:type min_silence: float
+		:param frame: Длина кадра анализа в секундах.
+		:type frame: float
+		"""
+
+		self.__Segment = segment
+		self.__Overlap = overlap
+		self.__MinSilence = min_silence
+		self.__Frame = frame
+
+	def join(self, texts: Iterable[str | None]) -> str:
+		"""
+		Объединяет тексты распознанных сегментов. При ненулевом перекрытии на каждой границе удаляется наибольшая общая последовательность слов в конце предыдущего текста и в начале следующего, чтобы слова из перекрытия не повторялись.
+
+		:param texts: Тексты сегментов по порядку. Пустые значения пропускаются.
+		:type texts: Iterable[str | None]
+		:return: Объединённый текст.
+		:rtype: str
+		"""
+
+		Limit = math.ceil(self.__Overlap * WORDS_PER_SECOND)
+		Words: list[str] = list()
+
+		for Text in texts:
+			if not Text: continue
+			Next = Text.split()
+			Shared = next((Length for Length in range(min(Limit, len(Words), len(Next)), 0, -1) if Words[-Length:] == Next[:Length]), 0)
+			Words.extend(Next[Shared:])
+
+		return " ".join(Words)
+
+	def split(self, data: bytes, framerate: int = 16000) -> list[bytes]:
+		"""
+		Разбивает аудио на сегменты не длиннее заданного. Разрезы выполняются в середине пауз, найденных во второй половине сегмента; при их отсутствии сегмент режется принудительно с перекрытием.
+
+		:param data: Данные PCM (моно, 16 бит).
+		:type data: bytes
+		:param framerate: Частота дискретизации.
+		:type framerate: int
+		:return: Список сегментов PCM.
+		:rtype: list[bytes]
+		"""
+
+		FrameSize = max(int(framerate * self.__Frame), 1)
+		SegmentFrames = max(int(self.__Segment / self.__Frame), 1)
+		SilenceFrames = max(int(self.__MinSilence / self.__Frame), 1)
+		OverlapFrames = int(self.__Overlap / self.__Frame)
+
+		Samples = array("h")
+		Samples.frombytes(data[:len(data) - len(data) % 2])
+		if len(Samples) <= FrameSize * SegmentFrames: return [data]
+
+		Energies = self.__GetEnergies(Samples, FrameSize)
+		Sorted = sorted(Energies)
+		Floor = Sorted[len(Sorted) // 20]
+		Threshold = max(Floor + (Sorted[len(Sorted) // 2] - Floor) * 0.1, 1e4)
+		Ranges: list[tuple[int, int]] = list()
+		Start = 0
+
+		while len(Energies) - Start > SegmentFrames:
+			End = Start + SegmentFrames
+			Cut = None
+			Run = 0
+
+			for Index in range(End - 1, Start + SegmentFrames // 2, -1):
+				Run = Run + 1 if Energies[Index] < Threshold else 0
+
+				if Run >= SilenceFrames:
+					Cut = Index + Run // 2
+					break
+
+			if Cut:
+				Ranges.append((Start, Cut))
+				Start = Cut
+
+			else:
+				Ranges.append((Start, End))
+				Start = max(End - OverlapFrames, Start + 1)
+
+		Ranges.append((Start, len(Energies)))
+		ByteFrame = FrameSize * 2
+
+		return [data[RangeStart * ByteFrame:RangeEnd * ByteFrame] for RangeStart, RangeEnd in Ranges]
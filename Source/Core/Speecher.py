@@ -1,44 +1,186 @@
-from Source.Functions import DownloadFile
+from Source.Core.Decoder import Decoder, DecoderBackends
+from Source.Core.Recognition import RecognitionPool
+from Source.Core.Segmenter import Segmenter
+from Source.Core.Profiler import SamplingProfiler
+from Source.Core.Metrics import METRICS
+from Source.Functions import SESSION, DownloadBytes, DownloadFile
 
 from dublib.CLI.TextStyler import FastStyler
 from dublib.Methods.Data import Zerotify
 
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from typing import Iterable
 from os import PathLike
+from array import array
 import subprocess
+import threading
+import asyncio
 import zipfile
 import shutil
+import random
 import wave
 import os
 
 from vosk import Model, KaldiRecognizer
-from pydub import AudioSegment
 import orjson
 
 class Speecher:
 	"""Преобразователь голоса в речь."""
 
+	#==========================================================================================#
+	# >>>>> СВОЙСТВА <<<<< #
+	#==========================================================================================#
+
+	@property
+	def decoder(self) -> Decoder:
+		"""Декодер аудиосообщений."""
+
+		return self.__Decoder
+
+	@property
+	def pool(self) -> RecognitionPool | None:
+		"""Пул процессов распознавания речи."""
+
+		return self.__Pool
+
+	@property
+	def recognizer_metrics(self) -> dict[str, int | float]:
+		"""Метрики распознавателей: _allocated_ – создано, _reused_ – взято из пула, _warmup_time_ – длительность прогрева модели в секундах, _recognitions_ – выполнено распознаваний, _recognition_time_ – их суммарная длительность в секундах. При использовании пула процессов метрики ведутся в рабочих процессах."""
+
+		with self.__RecognizersLock: return self.__Metrics.copy()
+
 	#==========================================================================================#
 	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
 	#==========================================================================================#
 
-	def __IsFFmpegInstalled(self) -> bool:
+	def __RecognizeBlocks(self, blocks: Iterable[bytes], framerate: int = 16000, record: bool = True) -> str | None:
+		"""
+		Распознаёт речь, передавая распознавателю блоки PCM (моно, 16 бит) по мере их поступления.
+
+		:param blocks: Последовательность блоков PCM.
+		:type blocks: Iterable[bytes]
+		:param framerate: Частота дискретизации.
+		:type framerate: int
+		:param record: Указывает, нужно ли учитывать распознавание в метриках.
+		:type record: bool
+		:return: Распознанный текст или `None` в случае отсутствия такового.
+		:rtype: str | None
 		"""
-		Проверяет, установлен и доступен ли **ffmpeg**.
 
-		:return: Возвращает `True`, если **ffmpeg** доступен.
-		:rtype: bool
+		Text = str()
+		StartTime = perf_counter()
+		Recognizer = self.__AcquireRecognizer(framerate)
+
+		try:
+			for Block in blocks:
+
+				if Recognizer.AcceptWaveform(Block):
+					Result: dict = orjson.loads(Recognizer.Result())
+					Text += Result.get("text", "") + " "
+
+			Result: dict = orjson.loads(Recognizer.FinalResult())
+			Text += Result.get("text", "")
+			self.__ReleaseRecognizer(framerate, Recognizer)
+
+		finally:
+
+			if record:
+				Elapsed = perf_counter() - StartTime
+				METRICS.observe("recognize", Elapsed)
+
+				with self.__RecognizersLock:
+					self.__Metrics["recognitions"] += 1
+					self.__Metrics["recognition_time"] += Elapsed
+
+		return Zerotify(Text.strip())
+
+	def __AcquireRecognizer(self, framerate: int) -> KaldiRecognizer:
+		"""
+		Возвращает свободный распознаватель для указанной частоты дискретизации из пула или создаёт новый.
+
+		:param framerate: Частота дискретизации.
+		:type framerate: int
+		:return: Распознаватель.
+		:rtype: KaldiRecognizer
+		"""
+
+		with self.__RecognizersLock:
+			Free = self.__Recognizers.get(framerate)
+
+			if Free:
+				self.__Metrics["reused"] += 1
+				return Free.pop()
+
+			self.__Metrics["allocated"] += 1
+
+		return KaldiRecognizer(self.__Model, framerate)
+
+	def __ReleaseRecognizer(self, framerate: int, recognizer: KaldiRecognizer):
 		"""
+		Сбрасывает состояние распознавателя и возвращает его в пул, если в пуле есть место.
 
-		try: 
-			subprocess.run(
-				("ffmpeg", "-version"),
-				stdout = subprocess.PIPE,
-				stderr = subprocess.PIPE,
-				check = True
-			)
-			return True
-		
-		except FileNotFoundError: return False
+		:param framerate: Частота дискретизации.
+		:type framerate: int
+		:param recognizer: Распознаватель.
+		:type recognizer: KaldiRecognizer
+		"""
+
+		recognizer.Reset()
+
+		with self.__RecognizersLock:
+			Free = self.__Recognizers.setdefault(framerate, list())
+			if len(Free) < self.__RecognizersPoolSize: Free.append(recognizer)
+
+	def __WarmUp(self):
+		"""Выполняет пробное распознавание синтетического аудио, чтобы загрузить модель в память до первого аудиосообщения."""
+
+		StartTime = perf_counter()
+		Generator = random.Random(0)
+		Samples = array("h", (Generator.randint(-2000, 2000) for _ in range(16000)))
+		self.__RecognizeBlocks((Samples.tobytes(),), record = False)
+		self.__Metrics["warmup_time"] = perf_counter() - StartTime
+
+	def __MergeMetrics(self, metrics: dict):
+		"""
+		Добавляет метрики, переданные рабочим процессом распознавания.
+
+		:param metrics: Метрики, собранные методом `collect_metrics()` рабочего процесса.
+		:type metrics: dict
+		"""
+
+		METRICS.merge(metrics["stages"])
+		self.__Decoder.merge(metrics["decoder"])
+
+	def __RecognizeSegment(self, data: bytes) -> str | None:
+		"""
+		Распознаёт речь в сегменте PCM в пуле процессов или в текущем потоке.
+
+		:param data: Сегмент PCM.
+		:type data: bytes
+		:return: Распознанный текст или `None` в случае ошибки или отсутствия таковой.
+		:rtype: str | None
+		"""
+
+		return self.__Pool.execute("recognize_pcm", data) if self.__Pool else self.recognize_pcm(data)
+
+	def __RecognizeLong(self, url: str) -> str | None:
+		"""
+		Распознаёт длинное аудиосообщение: разбивает его на сегменты по паузам, распознаёт их параллельно и объединяет тексты без повторов слов из перекрытий.
+
+		:param url: Ссылка на *.ogg файл.
+		:type url: str
+		:return: Распознанный текст или `None` в случае ошибки или отсутствия таковой.
+		:rtype: str | None
+		"""
+
+		Data = DownloadBytes(url)
+		if not Data: return None
+		Segments = self.__Pool.execute("split_voice", Data, self.__Segmenter) if self.__Pool else self.split_voice(Data, self.__Segmenter)
+		if not Segments: return None
+		Texts = self.__SegmentsExecutor.map(self.__RecognizeSegment, Segments)
+
+		return Zerotify(self.__Segmenter.join(Texts))
 
 	def __CheckModel(self, model: str) -> bool:
 		"""
@@ -75,20 +217,66 @@ class Speecher:
 	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
 	#==========================================================================================#
 
-	def __init__(self, model: str, use_ffmpeg: bool = False):
+	def __init__(self, model: str, use_ffmpeg: bool = False, workers: int = 0, queue_size: int = 32, timeout: float = 120, segmenter: Segmenter | None = None, parallelism: int = 4, recognizers: int = 2, warmup: bool = True, decoder: DecoderBackends | None = None, tempo: float | None = None, profiler: SamplingProfiler | None = None):
 		"""
 		Преобразователь голоса в речь.
 
 		:param model: Название каталога с используемой моделью **VOSK**.
 		:type model: PathLike
-		:param use_ffmpeg: Указывает, нужно ли использовать **ffmpeg** для преобразования **\*.ogg** в **\*.wav**.
+		:param use_ffmpeg: Указывает, разрешено ли автоматически выбирать **ffmpeg** для декодирования аудио. При `False` используется **pydub**, если способ декодирования не указан явно.
 		:type use_ffmpeg: bool
+		:param workers: Количество процессов распознавания аудиосообщений. При `0` распознавание выполняется в вызывающем потоке.
+		:type workers: int
+		:param queue_size: Максимальное количество аудиосообщений в очереди пула процессов.
+		:type queue_size: int
+		:param timeout: Время ожидания распознавания одного аудиосообщения пулом процессов в секундах.
+		:type timeout: float
+		:param segmenter: Разбиение длинных аудиосообщений на сегменты для параллельного распознавания. При `None` аудиосообщения распознаются целиком.
+		:type segmenter: Segmenter | None
+		:param parallelism: Количество одновременно распознаваемых сегментов одного аудиосообщения.
+		:type parallelism: int
+		:param recognizers: Количество переиспользуемых распознавателей **VOSK** для каждой частоты дискретизации.
+		:type recognizers: int
+		:param warmup: Указывает, нужно ли прогреть модель пробным распознаванием при запуске.
+		:type warmup: bool
+		:param decoder: Способ декодирования аудио. При `None` выбирается автоматически.
+		:type decoder: DecoderBackends | None
+		:param tempo: Коэффициент изменения темпа аудио перед распознаванием. При `None` темп не изменяется.
+		:type tempo: float | None
+		:param profiler: Профилировщик, за профилированием которого следуют процессы распознавания.
+		:type profiler: SamplingProfiler | None
 		"""
 
 		if not self.__CheckModel(model): self.__InstallModel(model)
 
-		self.__Model = Model(f"Data/VOSK/{model}")
-		self.__UseFfmpeg = use_ffmpeg
+		self.__Decoder = Decoder(decoder or (None if use_ffmpeg else DecoderBackends.Pydub), tempo)
+		self.__Recognizers: dict[int, list[KaldiRecognizer]] = dict()
+		self.__RecognizersPoolSize = max(recognizers, 0)
+		self.__RecognizersLock = threading.Lock()
+		self.__Metrics = {"allocated": 0, "reused": 0, "warmup_time": 0.0, "recognitions": 0, "recognition_time": 0.0}
+
+		self.__Pool = RecognitionPool(model, use_ffmpeg, workers, queue_size, timeout, recognizers, warmup, decoder, tempo, profiler, self.__MergeMetrics) if workers > 0 else None
+		self.__Model = Model(f"Data/VOSK/{model}") if not self.__Pool else None
+		self.__Segmenter = segmenter
+		self.__SegmentsExecutor = ThreadPoolExecutor(max_workers = max(parallelism, 1), thread_name_prefix = "Segments") if segmenter else None
+
+		if self.__Model and warmup: self.__WarmUp()
+
+	def close(self):
+		"""Останавливает пул процессов распознавания."""
+
+		if self.__Pool: self.__Pool.close()
+		if self.__SegmentsExecutor: self.__SegmentsExecutor.shutdown(wait = False, cancel_futures = True)
+
+	def collect_metrics(self) -> dict:
+		"""
+		Возвращает метрики этапов обработки и декодирования, накопленные с момента предыдущего вызова, и обнуляет их. Используется рабочими процессами распознавания для передачи метрик основному процессу.
+
+		:return: Метрики этапов под ключом _stages_ и метрики способов декодирования под ключом _decoder_.
+		:rtype: dict
+		"""
+
+		return {"stages": METRICS.collect(), "decoder": self.__Decoder.collect()}
 
 	def ogg_to_wav(self, path: PathLike) -> bool:
 		"""
@@ -100,34 +288,52 @@ class Speecher:
 		:rtype: bool
 		"""
 
-		if self.__UseFfmpeg and self.__IsFFmpegInstalled():
-			Command = (
-				"ffmpeg",
-				"-i", path,
-				"-ar", "16000",
-				"-ac", "1",
-				"-c:a", "pcm_s16le",
-				"-filter:a", "atempo=0.5",
-				path[:-3] + "wav",
-			)
+		try:
+			with open(path, "rb") as FileReader: PCM = self.__Decoder.decode(FileReader.read())
+			if not PCM: return False
 
-			subprocess.run(Command, check = True)
-			return True
+			with wave.open(path[:-4] + ".wav", "wb") as WaveWriter:
+				WaveWriter.setnchannels(1)
+				WaveWriter.setsampwidth(2)
+				WaveWriter.setframerate(16000)
+				WaveWriter.writeframes(PCM)
 
-		else:
-			
-			try:
-				Audio = AudioSegment.from_file(path, format = "ogg")
-				Audio = Audio.set_frame_rate(16000).set_channels(1).set_sample_width(2)
-				Audio.export(path[:-4] + ".wav", format = "wav")
-				os.remove(path)
+			os.remove(path)
+
+		except Exception as ExceptionData:
+			print(ExceptionData)
+			return False
+
+		return True
+
+	def ogg_to_pcm(self, data: bytes) -> bytes | None:
+		"""
+		Декодирует аудио *.ogg из памяти в PCM (16 кГц, моно, 16 бит) без использования временных файлов.
+
+		:param data: Содержимое *.ogg файла.
+		:type data: bytes
+		:return: Данные PCM или `None` в случае ошибки.
+		:rtype: bytes | None
+		"""
+
+		return self.__Decoder.decode(data)
+
+	def recognize_pcm(self, data: bytes, framerate: int = 16000) -> str | None:
+		"""
+		Распознаёт речь в данных PCM (моно, 16 бит), передавая их распознавателю блоками.
+
+		:param data: Данные PCM.
+		:type data: bytes
+		:param framerate: Частота дискретизации.
+		:type framerate: int
+		:return: Распознанный текст или `None` в случае ошибки или отсутствия таковой.
+		:rtype: str | None
+		"""
 
-			except Exception as ExceptionData:
-				print(ExceptionData)
-				return False
+		BlockSize = 8000
+
+		return self.__RecognizeBlocks((data[Offset:Offset + BlockSize] for Offset in range(0, len(data), BlockSize)), framerate)
 
-			return True
-	
 	def recognize_speech(self, path: PathLike) -> str | None:
 		"""
 		Распознаёт речь в аудиофайле.
@@ -138,17 +344,123 @@ class Speecher:
 		:rtype: str | None
 		"""
 
-		Text = str()
-		
-		with wave.open(path, "rb") as WaveReader:
-			Recognizer = KaldiRecognizer(self.__Model, WaveReader.getframerate())
+		with wave.open(path, "rb") as WaveReader: return self.recognize_pcm(WaveReader.readframes(WaveReader.getnframes()), WaveReader.getframerate())
 
-			while True:
-				Data = WaveReader.readframes(4000)
-				if len(Data) == 0: break
+	def recognize_url(self, url: str, duration: float | None = None) -> str | None:
+		"""
+		Распознаёт речь в аудиосообщении *.ogg по ссылке, начиная декодирование и распознавание во время скачивания.
 
-				if Recognizer.AcceptWaveform(Data):
-					Result: dict = orjson.loads(Recognizer.Result())
-					Text += Result.get("text", "") + " "
+		Потоковая обработка выполняется через **ffmpeg**. Если он недоступен, файл скачивается в память целиком и распознаётся обычным образом. Аудиосообщения длиннее сегмента разбиваются по паузам и распознаются параллельно.
+
+		:param url: Ссылка на *.ogg файл.
+		:type url: str
+		:param duration: Длительность аудиосообщения в секундах, если известна.
+		:type duration: float | None
+		:return: Распознанный текст или `None` в случае ошибки или отсутствия таковой.
+		:rtype: str | None
+		:raises RecognitionRejected: Выбрасывается при переполнении очереди пула процессов.
+		"""
+
+		if self.__Segmenter and duration and duration > self.__Segmenter.segment: return self.__RecognizeLong(url)
+		if self.__Pool: return self.__Pool.execute("recognize_url", url)
+
+		if not self.__Decoder.is_streaming_supported:
+			Data = DownloadBytes(url)
+			return self.recognize_voice(Data) if Data else None
+
+		StartTime = perf_counter()
+		Process = subprocess.Popen(self.__Decoder.get_command(), stdin = subprocess.PIPE, stdout = subprocess.PIPE, stderr = subprocess.DEVNULL)
+		Errors = list()
+		Decoded = {"size": 0, "time": 0.0}
+
+		def Feed():
+
+			try:
+				with SESSION.get(url, stream = True, timeout = 30) as Response:
+					Response.raise_for_status()
+					for Chunk in Response.iter_content(16384): Process.stdin.write(Chunk)
+
+			except Exception as ExceptionData: Errors.append(ExceptionData)
+
+			finally:
+				try: Process.stdin.close()
+				except OSError: pass
+
+		def Read() -> bytes:
+			Block = Process.stdout.read(8000)
+			Decoded["size"] += len(Block)
+			if not Block: Decoded["time"] = perf_counter() - StartTime
+
+			return Block
+
+		Feeder = threading.Thread(target = Feed, daemon = True)
+		Feeder.start()
+
+		try: Text = self.__RecognizeBlocks(iter(Read, b""))
+
+		except Exception:
+			Process.kill()
+			raise
+
+		finally:
+			Process.stdout.close()
+			Feeder.join(5)
+			Process.wait()
+
+		if not Errors: self.__Decoder.record(Decoded["time"], None if Process.returncode else Decoded["size"])
+
+		if Errors or Process.returncode:
+			print(Errors[0] if Errors else f"ffmpeg exited with code {Process.returncode}.")
+			return None
+
+		return Text
+
+	async def recognize_url_async(self, url: str, duration: float | None = None) -> str | None:
+		"""
+		Распознаёт речь в аудиосообщении *.ogg по ссылке, не блокируя цикл событий. Скачивание и распознавание выполняются пулом процессов, а при его отсутствии – в пуле потоков цикла событий.
+
+		:param url: Ссылка на *.ogg файл.
+		:type url: str
+		:param duration: Длительность аудиосообщения в секундах, если известна.
+		:type duration: float | None
+		:return: Распознанный текст или `None` в случае ошибки или отсутствия таковой.
+		:rtype: str | None
+		:raises RecognitionRejected: Выбрасывается при переполнении очереди пула процессов.
+		"""
+
+		IsLong = self.__Segmenter and duration and duration > self.__Segmenter.segment
+		if self.__Pool and not IsLong: return await self.__Pool.execute_async("recognize_url", url)
+
+		return await asyncio.to_thread(self.recognize_url, url, duration)
+
+	def split_voice(self, data: bytes, segmenter: Segmenter) -> list[bytes] | None:
+		"""
+		Декодирует аудиосообщение *.ogg в PCM и разбивает его на сегменты по паузам.
+
+		:param data: Содержимое *.ogg файла.
+		:type data: bytes
+		:param segmenter: Разбиение аудио на сегменты.
+		:type segmenter: Segmenter
+		:return: Список сегментов PCM или `None` в случае ошибки декодирования.
+		:rtype: list[bytes] | None
+		"""
+
+		PCM = self.ogg_to_pcm(data)
+
+		return segmenter.split(PCM) if PCM else None
+
+	def recognize_voice(self, data: bytes) -> str | None:
+		"""
+		Распознаёт речь в аудиосообщении *.ogg, полностью обрабатывая его в памяти.
+
+		:param data: Содержимое *.ogg файла.
+		:type data: bytes
+		:return: Распознанный текст или `None` в случае ошибки или отсутствия таковой.
+		:rtype: str | None
+		:raises RecognitionRejected: Выбрасывается при переполнении очереди пула процессов.
+		"""
+
+		if self.__Pool: return self.__Pool.execute("recognize_voice", data)
+		PCM = self.ogg_to_pcm(data)
 
-		return Zerotify(Text)
\ No newline at end of file
+		return self.recognize_pcm(PCM) if PCM else None
\ No newline at end of file
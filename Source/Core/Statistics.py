@@ -0,0 +1,233 @@
+from Source.Core.Cache import ResultsCache
+
+from datetime import date, datetime, timedelta
+from os import PathLike
+import threading
+import atexit
+import os
+
+import orjson
+
+class Statistics:
+	"""Счётчики статистики бота, обновляемые по мере обработки сообщений и сохраняемые в компактный JSON-файл. Сводка строится за постоянное время независимо от количества пользователей."""
+
+	#==========================================================================================#
+	# >>>>> СВОЙСТВА <<<<< #
+	#==========================================================================================#
+
+	@property
+	def active(self) -> dict[str, int]:
+		"""Количество активных пользователей по дням в формате ISO 8601."""
+
+		with self.__Lock: return self.__Active.copy()
+
+	@property
+	def counters(self) -> dict[str, int]:
+		"""Значения счётчиков."""
+
+		with self.__Lock:
+			self.__CollectCaches()
+			return self.__Counters.copy()
+
+	#==========================================================================================#
+	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __CollectCaches(self):
+		"""Переносит в счётчики прирост попаданий и промахов подключённых кэшей. Вызывается под блокировкой."""
+
+		for Name, Cache in self.__Caches.items():
+			Hits, Misses = Cache.hits, Cache.misses
+			PreviousHits, PreviousMisses = self.__CacheMarks[Name]
+			if (Hits, Misses) == (PreviousHits, PreviousMisses): continue
+			self.__Counters[f"{Name}_hits"] = self.__Counters.get(f"{Name}_hits", 0) + Hits - PreviousHits
+			self.__Counters[f"{Name}_misses"] = self.__Counters.get(f"{Name}_misses", 0) + Misses - PreviousMisses
+			self.__CacheMarks[Name] = (Hits, Misses)
+			self.__IsChanged = True
+
+	def __GetRate(self, name: str) -> str:
+		"""
+		Возвращает долю попаданий в кэш в процентах.
+
+		:param name: Название кэша.
+		:type name: str
+		:return: Доля попаданий или прочерк при отсутствии обращений.
+		:rtype: str
+		"""
+
+		Hits = self.__Counters.get(f"{name}_hits", 0)
+		Total = Hits + self.__Counters.get(f"{name}_misses", 0)
+
+		return f"{Hits / Total:.0%}" if Total else "—"
+
+	def __Load(self):
+		"""Считывает сохранённые счётчики."""
+
+		if not os.path.exists(self.__Path): return
+
+		with open(self.__Path, "rb") as FileReader: Data: dict = orjson.loads(FileReader.read())
+		self.__Counters = Data.get("counters", dict())
+		self.__Active = Data.get("active", dict())
+
+	def __Run(self):
+		"""Периодически сохраняет счётчики до остановки."""
+
+		while not self.__Stop.wait(self.__FlushInterval):
+			try: self.flush()
+			except Exception as ExceptionData: print(ExceptionData)
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __init__(self, path: PathLike = "Data/statistics.json", flush_interval: float = 30.0, days: int = 30, autoflush: bool = True):
+		"""
+		Счётчики статистики бота.
+
+		:param path: Путь к файлу счётчиков.
+		:type path: PathLike
+		:param flush_interval: Интервал сохранения счётчиков в секундах.
+		:type flush_interval: float
+		:param days: Количество последних дней, за которые хранится число активных пользователей.
+		:type days: int
+		:param autoflush: Указывает, нужно ли сохранять счётчики в фоновом потоке и при завершении работы.
+		:type autoflush: bool
+		"""
+
+		self.__Path = path
+		self.__FlushInterval = max(flush_interval, 1.0)
+		self.__Days = max(days, 1)
+
+		self.__Lock = threading.Lock()
+		self.__Counters: dict[str, int] = dict()
+		self.__Active: dict[str, int] = dict()
+		self.__Caches: dict[str, ResultsCache] = dict()
+		self.__CacheMarks: dict[str, tuple[int, int]] = dict()
+		self.__IsChanged = False
+		self.__Stop = threading.Event()
+		self.__Load()
+
+		if autoflush:
+			self.__Thread = threading.Thread(target = self.__Run, name = "Statistics", daemon = True)
+			self.__Thread.start()
+			atexit.register(self.close)
+
+	def attach_cache(self, name: str, cache: ResultsCache | None):
+		"""
+		Подключает кэш, попадания и промахи которого учитываются в счётчиках _{name}_hits_ и _{name}_misses_.
+
+		:param name: Название кэша.
+		:type name: str
+		:param cache: Кэш результатов. При `None` ничего не подключается.
+		:type cache: ResultsCache | None
+		"""
+
+		if not cache: return
+
+		with self.__Lock:
+			self.__Caches[name] = cache
+			self.__CacheMarks[name] = (cache.hits, cache.misses)
+
+	def close(self):
+		"""Останавливает фоновое сохранение и сохраняет счётчики."""
+
+		self.__Stop.set()
+		self.flush()
+
+	def flush(self):
+		"""Сохраняет счётчики, если они изменились."""
+
+		with self.__Lock:
+			self.__CollectCaches()
+			if not self.__IsChanged: return
+			Data = orjson.dumps({"counters": self.__Counters, "active": self.__Active})
+			self.__IsChanged = False
+
+		TemporaryPath = f"{self.__Path}.tmp"
+		with open(TemporaryPath, "wb") as FileWriter: FileWriter.write(Data)
+		os.replace(TemporaryPath, self.__Path)
+
+	def increment(self, name: str, value: int = 1):
+		"""
+		Увеличивает значение счётчика.
+
+		:param name: Название счётчика.
+		:type name: str
+		:param value: Прирост.
+		:type value: int
+		"""
+
+		with self.__Lock:
+			self.__Counters[name] = self.__Counters.get(name, 0) + value
+			self.__IsChanged = True
+
+	def register_activity(self, is_new: bool, last_activity: datetime | None):
+		"""
+		Учитывает активность пользователя: новый пользователь увеличивает общее количество, а первая за день активность – количество активных за текущий день.
+
+		:param is_new: Указывает, впервые ли пользователь обратился к боту.
+		:type is_new: bool
+		:param last_activity: Предыдущие дата и время активности пользователя.
+		:type last_activity: datetime | None
+		"""
+
+		Today = date.today()
+		if not is_new and last_activity and last_activity.date() >= Today: return
+
+		with self.__Lock:
+			if is_new: self.__Counters["users"] = self.__Counters.get("users", 0) + 1
+			Key = Today.isoformat()
+
+			if Key not in self.__Active:
+				Oldest = (Today - timedelta(days = self.__Days - 1)).isoformat()
+				self.__Active = {Day: Count for Day, Count in self.__Active.items() if Day >= Oldest}
+
+			self.__Active[Key] = self.__Active.get(Key, 0) + 1
+			self.__IsChanged = True
+
+	def seed(self, name: str, value: int):
+		"""
+		Задаёт начальное значение счётчика, если он ещё не сохранялся.
+
+		:param name: Название счётчика.
+		:type name: str
+		:param value: Начальное значение.
+		:type value: int
+		"""
+
+		with self.__Lock:
+			if name in self.__Counters: return
+			self.__Counters[name] = value
+			self.__IsChanged = True
+
+	def summary(self) -> str:
+		"""
+		Возвращает текстовую сводку статистики.
+
+		:return: Сводка.
+		:rtype: str
+		"""
+
+		with self.__Lock:
+			self.__CollectCaches()
+			Today = date.today()
+			Active = self.__Active
+			Average = sum(Active.values()) / len(Active) if Active else 0
+
+			Lines = (
+				f"Пользователей: {self.__Counters.get('users', 0)}",
+				f"Активных сегодня: {Active.get(Today.isoformat(), 0)}",
+				f"Активных вчера: {Active.get((Today - timedelta(days = 1)).isoformat(), 0)}",
+				f"Активных в среднем за день: {Average:.0f}",
+				"",
+				f"Переводов на зумерский: {self.__Counters.get('translations_to', 0)}",
+				f"Переводов с зумерского: {self.__Counters.get('translations_from', 0)}",
+				f"Аудиосообщений: {self.__Counters.get('voice', 0)}",
+				f"Срабатываний чёрного списка: {self.__Counters.get('blacklisted', 0)}",
+				f"Нецензурных сообщений: {self.__Counters.get('obscene', 0)}",
+				"",
+				f"Попаданий в кэш переводов: {self.__GetRate('translation_cache')}",
+				f"Попаданий в кэш распознавания: {self.__GetRate('voice_cache')}"
+			)
+
+		return "\n".join(Lines)
@@ -0,0 +1,116 @@
+from dublib.TelebotUtils import TeleMaster, UserData
+
+from time import monotonic
+import threading
+
+class SubscriptionsChecker:
+	"""Проверка подписок пользователей с кэшированием вердиктов."""
+
+	#==========================================================================================#
+	# >>>>> СВОЙСТВА <<<<< #
+	#==========================================================================================#
+
+	@property
+	def chats(self) -> tuple[int]:
+		"""Последовательность ID чатов, подписка на которые требуется."""
+
+		return self.__Chats
+
+	@property
+	def hits(self) -> int:
+		"""Количество вердиктов, взятых из кэша."""
+
+		return self.__Hits
+
+	@property
+	def master(self) -> TeleMaster:
+		"""Мастер-бот."""
+
+		return self.__Master
+
+	@property
+	def misses(self) -> int:
+		"""Количество проверок, потребовавших запросов к Telegram."""
+
+		return self.__Misses
+
+	@property
+	def subscriptions(self) -> dict[str, dict]:
+		"""Словарь с данными необходимых подписок."""
+
+		return self.__Subscriptions.copy()
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __init__(self, master: TeleMaster, subscriptions: dict[str, dict], positive_ttl: float = 600, negative_ttl: float = 30, max_size: int = 100000):
+		"""
+		Проверка подписок пользователей с кэшированием вердиктов.
+
+		:param master: Мастер-бот.
+		:type master: TeleMaster
+		:param subscriptions: Словарь с данными необходимых подписок, где ключ – название кнопки, а в словаре-значении имеется два поля: _id_ и _link_.
+		:type subscriptions: dict[str, dict]
+		:param positive_ttl: Время хранения положительного вердикта в секундах.
+		:type positive_ttl: float
+		:param negative_ttl: Время хранения отрицательного вердикта в секундах.
+		:type negative_ttl: float
+		:param max_size: Количество хранимых вердиктов, при превышении которого удаляются устаревшие.
+		:type max_size: int
+		"""
+
+		self.__Master = master
+		self.__Subscriptions = subscriptions
+		self.__PositiveTTL = positive_ttl
+		self.__NegativeTTL = negative_ttl
+		self.__MaxSize = max_size
+
+		self.__Chats = tuple(subscriptions[Key]["id"] for Key in subscriptions.keys())
+		self.__Verdicts: dict[int, tuple[bool, float]] = dict()
+		self.__Lock = threading.Lock()
+		self.__Hits = 0
+		self.__Misses = 0
+
+	def check(self, user: UserData) -> bool:
+		"""
+		Проверяет, подписан ли пользователь на все необходимые чаты.
+
+		:param user: Данные пользователя.
+		:type user: UserData
+		:return: Возвращает `True`, если пользователь подписан на все чаты.
+		:rtype: bool
+		"""
+
+		if not self.__Chats: return True
+
+		with self.__Lock:
+			Verdict = self.__Verdicts.get(user.id)
+
+			if Verdict and Verdict[1] > monotonic():
+				self.__Hits += 1
+				return Verdict[0]
+
+			self.__Misses += 1
+
+		IsSubscribed = self.__Master.check_user_subscriptions(user, self.__Chats)
+		TTL = self.__PositiveTTL if IsSubscribed else self.__NegativeTTL
+
+		with self.__Lock:
+			if TTL > 0: self.__Verdicts[user.id] = (IsSubscribed, monotonic() + TTL)
+
+			if len(self.__Verdicts) > self.__MaxSize:
+				Now = monotonic()
+				self.__Verdicts = {UserID: Value for UserID, Value in self.__Verdicts.items() if Value[1] > Now}
+
+		return IsSubscribed
+
+	def invalidate(self, user_id: int):
+		"""
+		Удаляет кэшированный вердикт пользователя.
+
+		:param user_id: ID пользователя.
+		:type user_id: int
+		"""
+
+		with self.__Lock: self.__Verdicts.pop(user_id, None)
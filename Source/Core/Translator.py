@@ -1,10 +1,20 @@
 from Source.NeuroHub.Connection.API import Options, Requestor
+from Source.Core.Batcher import Batcher
+from Source.Core.Cache import ResultsCache
 
 from dublib.Engine.Bus import ExecutionStatus
 
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError
 from dataclasses import dataclass
-from typing import Literal
+from typing import Iterator, Literal
+from time import monotonic
+import threading
+import asyncio
+import queue
 import enum
+import re
+
+BATCH_MARKER = re.compile(r"^\s*\[\[(\d+)\]\]\s*$", re.MULTILINE)
 
 #==========================================================================================#
 # >>>>> ДОПОЛНИТЕЛЬНЫЕ СТРУКТУРЫ ДАННЫХ <<<<< #
@@ -16,6 +26,9 @@ class NeuroHubOptions:
 	source: Literal["g4f", "gemini"]
 	model: str
 	force_proxy: bool
+	timeout: float
+	workers: int
+	max_in_flight: int
 
 class TranslationModes(enum.Enum):
 	"""Направленности перевода русского на зумерский."""
@@ -30,10 +43,497 @@ class TranslationModes(enum.Enum):
 class Translator:
 	"""Русско-зумерский переводчик."""
 
+	#==========================================================================================#
+	# >>>>> СВОЙСТВА <<<<< #
+	#==========================================================================================#
+
+	@property
+	def cache(self) -> ResultsCache | None:
+		"""Кэш результатов перевода."""
+
+		return self.__Cache
+
+	@property
+	def batcher(self) -> Batcher | None:
+		"""Накопитель пакетных запросов."""
+
+		return self.__Batcher
+
+	@property
+	def is_streaming_supported(self) -> bool:
+		"""Состояние: поддерживает ли клиент NeuroHub потоковую генерацию."""
+
+		return callable(getattr(self.__Requestor, "stream", None))
+
+	@property
+	def coalesced(self) -> int:
+		"""Количество переводов, дождавшихся результата уже выполняемого идентичного запроса вместо отправки собственного."""
+
+		return self.__Coalesced
+
+	@property
+	def requests(self) -> int:
+		"""Количество запросов, фактически отправленных к нейросети."""
+
+		return self.__Requests
+
 	#==========================================================================================#
 	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
 	#==========================================================================================#
 
+	def __Coalesce(self, mode: TranslationModes, text: str) -> ExecutionStatus:
+		"""
+		Выполняет запрос к нейросети, объединяя идентичные одновременные запросы: если такой же перевод уже выполняется, ожидает его результата.
+
+		:param mode: Режим перевода.
+		:type mode: TranslationModes
+		:param text: Текст для перевода.
+		:type text: str
+		:return: Контейнер результата.
+		:rtype: ExecutionStatus
+		"""
+
+		Key = (mode.value, self.__NormalizeText(text))
+
+		with self.__PendingLock:
+			Pending = self.__Pending.get(Key)
+			IsLeader = Pending is None
+
+			if IsLeader:
+				Pending = Future()
+				self.__Pending[Key] = Pending
+				self.__Requests += 1
+
+			else: self.__Coalesced += 1
+
+		if IsLeader:
+
+			try: Pending.set_result(self.__Translate(mode, text))
+			except Exception as ExceptionData: Pending.set_exception(ExceptionData)
+
+			finally:
+				with self.__PendingLock: del self.__Pending[Key]
+
+		Status = ExecutionStatus()
+		Status.merge(Pending.result())
+
+		return Status
+
+	async def __CoalesceAsync(self, mode: TranslationModes, text: str) -> ExecutionStatus:
+		"""
+		Асинхронно выполняет одиночный запрос к нейросети, объединяя его с идентичными одновременными запросами, в том числе синхронными.
+
+		:param mode: Режим перевода.
+		:type mode: TranslationModes
+		:param text: Текст для перевода.
+		:type text: str
+		:return: Контейнер результата.
+		:rtype: ExecutionStatus
+		"""
+
+		Key = (mode.value, self.__NormalizeText(text))
+
+		with self.__PendingLock:
+			Pending = self.__Pending.get(Key)
+			IsLeader = Pending is None
+
+			if IsLeader:
+				Pending = Future()
+				self.__Pending[Key] = Pending
+				self.__Requests += 1
+
+			else: self.__Coalesced += 1
+
+		if IsLeader:
+
+			try: Pending.set_result(await self.__GenerateAsync(self.__GetRequest(mode) + "\n" + text))
+			except Exception as ExceptionData: Pending.set_exception(ExceptionData)
+
+			finally:
+				if not Pending.done(): Pending.cancel()
+				with self.__PendingLock: del self.__Pending[Key]
+
+		Status = ExecutionStatus()
+		Status.merge(await asyncio.wrap_future(Pending))
+
+		return Status
+
+	def __GenerateBatch(self, mode: TranslationModes, texts: list[str]) -> list[ExecutionStatus | None] | None:
+		"""
+		Переводит несколько текстов одним запросом к нейросети. Фрагменты разделяются нумерованными маркерами.
+
+		Тексты, содержащие строки, похожие на маркеры, в пакет не включаются, чтобы их содержимое не могло подменить перевод чужого фрагмента.
+
+		:param mode: Режим перевода.
+		:type mode: TranslationModes
+		:param texts: Тексты для перевода.
+		:type texts: list[str]
+		:return: Результаты в порядке текстов или `None`, если ответ не удалось разобрать и тексты необходимо перевести по отдельности. `None` на месте результата означает необходимость одиночного перевода этого текста.
+		:rtype: list[ExecutionStatus | None] | None
+		"""
+
+		Results: list[ExecutionStatus | None] = [None] * len(texts)
+		Batched = [Index for Index, Text in enumerate(texts) if not BATCH_MARKER.search(Text)]
+		if not Batched: return Results
+
+		if len(Batched) == 1:
+			Results[Batched[0]] = self.__Generate(self.__GetRequest(mode) + "\n" + texts[Batched[0]])
+			return Results
+
+		Request = (
+			self.__GetRequest(mode),
+			"Ниже несколько независимых фрагментов, каждый начинается со строки-маркера вида [[N]].",
+			"Переведи каждый фрагмент отдельно и верни переводы в том же порядке, начиная каждый перевод с той же строки-маркера."
+		)
+		Fragments = "\n".join(f"[[{Number}]]\n{texts[Index]}" for Number, Index in enumerate(Batched, 1))
+		Response = self.__Generate(" ".join(Request) + "\n" + Fragments)
+
+		if Response.code != 200:
+			for Index in Batched: Results[Index] = Response
+			return Results
+
+		if not Response.value: return Results
+
+		Parts = BATCH_MARKER.split(Response.value)
+		Numbers = [int(Number) for Number in Parts[1::2]]
+		Translations = [Part.strip() for Part in Parts[2::2]]
+		if Numbers != list(range(1, len(Batched) + 1)) or not all(Translations): return Results
+
+		for Index, Translation in zip(Batched, Translations):
+			Status = ExecutionStatus()
+			Status.code = 200
+			Status.value = Translation
+			Results[Index] = Status
+
+		return Results
+
+	def __GetCacheKey(self, mode: TranslationModes, text: str) -> tuple[str]:
+		"""
+		Возвращает ключ кэша для перевода.
+
+		:param mode: Режим перевода.
+		:type mode: TranslationModes
+		:param text: Текст для перевода.
+		:type text: str
+		:return: Ключ кэша.
+		:rtype: tuple[str]
+		"""
+
+		return (mode.value, self.__NeuroHubOptions.source, self.__NeuroHubOptions.model, self.__NormalizeText(text))
+
+	def __Generate(self, prompt: str) -> ExecutionStatus:
+		"""
+		Отправляет запрос к нейросети через постоянный пул клиента.
+
+		:param prompt: Полный текст запроса.
+		:type prompt: str
+		:return: Контейнер результата. Код _503_ означает превышение лимита одновременных запросов, _504_ – превышение времени ожидания.
+		:rtype: ExecutionStatus
+		"""
+
+		Submitted = self.__Submit(prompt, wait = True)
+		if type(Submitted) == ExecutionStatus: return Submitted
+
+		try: Submitted.result(timeout = self.__NeuroHubOptions.timeout)
+		except TimeoutError: return self.__GetTimeoutStatus()
+		except Exception: pass
+
+		return self.__GetResponseStatus(Submitted)
+
+	async def __GenerateAsync(self, prompt: str) -> ExecutionStatus:
+		"""
+		Отправляет запрос к нейросети через постоянный пул клиента, не блокируя цикл событий на время ожидания ответа. Клиент NeuroHub синхронный, поэтому запрос на время выполнения занимает поток пула размером _workers_.
+
+		:param prompt: Полный текст запроса.
+		:type prompt: str
+		:return: Контейнер результата. Код _503_ означает превышение лимита одновременных запросов, _504_ – превышение времени ожидания.
+		:rtype: ExecutionStatus
+		"""
+
+		Submitted = self.__Submit(prompt, wait = False)
+		if type(Submitted) == ExecutionStatus: return Submitted
+
+		try: await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(Submitted)), self.__NeuroHubOptions.timeout)
+		except asyncio.TimeoutError: return self.__GetTimeoutStatus()
+		except Exception: pass
+
+		return self.__GetResponseStatus(Submitted)
+
+	def __GetResponseStatus(self, future: Future) -> ExecutionStatus:
+		"""
+		Преобразует завершённый запрос к нейросети в контейнер результата.
+
+		:param future: Завершённый запрос.
+		:type future: Future
+		:return: Контейнер результата.
+		:rtype: ExecutionStatus
+		"""
+
+		Status = ExecutionStatus()
+
+		try:
+			Response = future.result()
+			Status.code = Response.status_code
+			if Response.json: Status.value = Response.json.get("text")
+
+		except Exception as ExceptionData:
+			Status.code = 500
+			Status.push_error(str(ExceptionData))
+
+		return Status
+
+	def __GetTimeoutStatus(self) -> ExecutionStatus:
+		"""
+		Возвращает контейнер результата для превышения времени ожидания ответа.
+
+		:return: Контейнер результата с кодом _504_.
+		:rtype: ExecutionStatus
+		"""
+
+		Status = ExecutionStatus()
+		Status.code = 504
+		Status.push_error("NeuroHub response timeout.")
+
+		return Status
+
+	def __NormalizeText(self, text: str) -> str:
+		"""
+		Нормализует текст для сравнения запросов: удаляет пробельные символы по краям строк и повторяющиеся пробелы.
+
+		:param text: Исходный текст.
+		:type text: str
+		:return: Нормализованный текст.
+		:rtype: str
+		"""
+
+		return "\n".join(" ".join(Line.split()) for Line in text.strip().split("\n"))
+
+	def __Submit(self, prompt: str, wait: bool) -> Future | ExecutionStatus:
+		"""
+		Ставит запрос в пул клиента NeuroHub с учётом лимита одновременных запросов.
+
+		:param prompt: Полный текст запроса.
+		:type prompt: str
+		:param wait: Указывает, нужно ли ожидать освобождения места при достижении лимита. Иначе запрос отклоняется сразу.
+		:type wait: bool
+		:return: Выполняемый запрос или контейнер ошибки с кодом _503_ при превышении лимита либо _500_ при ошибке постановки.
+		:rtype: Future | ExecutionStatus
+		"""
+
+		Status = ExecutionStatus()
+		InFlight = self.__InFlight
+		IsAcquired = InFlight.acquire(timeout = self.__NeuroHubOptions.timeout) if wait else InFlight.acquire(blocking = False)
+
+		if not IsAcquired:
+			Status.code = 503
+			Status.push_error("Too many requests in flight.")
+			return Status
+
+		try:
+			Submitted = self.__Executor.submit(self.__Requestor.generate, prompt)
+			Submitted.add_done_callback(lambda _: InFlight.release())
+
+		except Exception as ExceptionData:
+			InFlight.release()
+			Status.code = 500
+			Status.push_error(str(ExceptionData))
+			return Status
+
+		return Submitted
+
+	def __Stream(self, prompt: str) -> Iterator[str | None]:
+		"""
+		Выполняет потоковую генерацию в пуле клиента NeuroHub с учётом лимита одновременных запросов и времени ожидания ответа.
+
+		:param prompt: Полный текст запроса.
+		:type prompt: str
+		:return: Итератор фрагментов ответа. `None` последним элементом означает ошибку генерации, превышение лимита одновременных запросов или времени ожидания.
+		:rtype: Iterator[str | None]
+		"""
+
+		InFlight = self.__InFlight
+
+		if not InFlight.acquire(timeout = self.__NeuroHubOptions.timeout):
+			yield None
+			return
+
+		Chunks = queue.Queue()
+		Stop = threading.Event()
+
+		def Produce():
+
+			try:
+				for Chunk in self.__Requestor.stream(prompt):
+					if Stop.is_set(): break
+					Chunks.put(Chunk)
+
+				Chunks.put(None)
+
+			except Exception as ExceptionData: Chunks.put(ExceptionData)
+			finally: InFlight.release()
+
+		try: self.__Executor.submit(Produce)
+
+		except Exception as ExceptionData:
+			InFlight.release()
+			print(ExceptionData)
+			yield None
+			return
+
+		Deadline = monotonic() + self.__NeuroHubOptions.timeout
+
+		try:
+
+			while True:
+
+				try: Chunk = Chunks.get(timeout = max(Deadline - monotonic(), 0))
+
+				except queue.Empty:
+					print("NeuroHub response timeout.")
+					yield None
+					return
+
+				if Chunk is None: return
+
+				if isinstance(Chunk, Exception):
+					print(Chunk)
+					yield None
+					return
+
+				yield Chunk
+
+		finally: Stop.set()
+
+	def __Translate(self, mode: TranslationModes, text: str) -> ExecutionStatus:
+		"""
+		Переводит текст пакетным запросом, если включено накопление, либо одиночным.
+
+		:param mode: Режим перевода.
+		:type mode: TranslationModes
+		:param text: Текст для перевода.
+		:type text: str
+		:return: Контейнер результата.
+		:rtype: ExecutionStatus
+		"""
+
+		Status = self.__Batcher.submit(mode, text) if self.__Batcher else None
+		if Status is not None: return Status
+
+		return self.__Generate(self.__GetRequest(mode) + "\n" + text)
+
+	def __SplitText(self, text: str) -> list[tuple[str, str]]:
+		"""
+		Разбивает текст на фрагменты не длиннее заданного размера по границам абзацев, а при необходимости – предложений и слов.
+
+		:param text: Исходный текст.
+		:type text: str
+		:return: Список фрагментов, где каждый фрагмент представлен содержимым и следующим за ним разделителем из оригинала.
+		:rtype: list[tuple[str, str]]
+		"""
+
+		Size = self.__ChunkSize
+		Units: list[tuple[str, str]] = list()
+		Paragraphs = re.split(r"(\n\s*\n)", text)
+
+		for Index in range(0, len(Paragraphs), 2):
+			Paragraph = Paragraphs[Index]
+			Separator = Paragraphs[Index + 1] if Index + 1 < len(Paragraphs) else ""
+
+			if len(Paragraph) <= Size:
+				Units.append((Paragraph, Separator))
+				continue
+
+			Sentences = re.split(r"(?<=[.!?…])(\s+)", Paragraph)
+
+			for SentenceIndex in range(0, len(Sentences), 2):
+				Sentence = Sentences[SentenceIndex]
+				SentenceSeparator = Sentences[SentenceIndex + 1] if SentenceIndex + 1 < len(Sentences) else Separator
+
+				while len(Sentence) > Size:
+					Border = Sentence.rfind(" ", 0, Size)
+					if Border <= 0: Border = Size
+					Units.append((Sentence[:Border], Sentence[Border:Border + 1] if Sentence[Border] == " " else ""))
+					Sentence = Sentence[Border + 1:] if Sentence[Border] == " " else Sentence[Border:]
+
+				Units.append((Sentence, SentenceSeparator))
+
+		Chunks: list[tuple[str, str]] = list()
+
+		for Content, Separator in Units:
+
+			if Chunks and len(Chunks[-1][0]) + len(Chunks[-1][1]) + len(Content) <= Size:
+				Chunks[-1] = (Chunks[-1][0] + Chunks[-1][1] + Content, Separator)
+
+			else: Chunks.append((Content, Separator))
+
+		return Chunks
+
+	def __TranslateChunk(self, mode: TranslationModes, text: str) -> ExecutionStatus:
+		"""
+		Переводит фрагмент длинного текста, повторяя попытку при ошибке.
+
+		:param mode: Режим перевода.
+		:type mode: TranslationModes
+		:param text: Фрагмент текста.
+		:type text: str
+		:return: Контейнер результата.
+		:rtype: ExecutionStatus
+		"""
+
+		if not text.strip():
+			Status = ExecutionStatus()
+			Status.code = 200
+			Status.value = text
+			return Status
+
+		for Try in range(self.__ChunkRetries + 1):
+			Status = self.__Coalesce(mode, text)
+			if Status: break
+
+		return Status
+
+	def __IterateChunks(self, mode: TranslationModes, text: str) -> Iterator[ExecutionStatus]:
+		"""
+		Параллельно переводит фрагменты длинного текста и возвращает накопленный в исходном порядке результат по мере готовности.
+
+		:param mode: Режим перевода.
+		:type mode: TranslationModes
+		:param text: Текст для перевода.
+		:type text: str
+		:return: Итератор контейнеров результата с накопленным переводом. При ошибке фрагмента последним возвращается контейнер ошибки.
+		:rtype: Iterator[ExecutionStatus]
+		"""
+
+		Chunks = self.__SplitText(text)
+		Futures = [self.__ChunksExecutor.submit(self.__TranslateChunk, mode, Content) for Content, _ in Chunks]
+		Text = str()
+
+		for Index in range(len(Chunks)):
+			ChunkStatus = Futures[Index].result()
+
+			if not ChunkStatus:
+				for Pending in Futures: Pending.cancel()
+				yield ChunkStatus
+				return
+
+			Text += ChunkStatus.value + Chunks[Index][1]
+			Status = ExecutionStatus()
+			Status.code = 200
+			Status.value = Text
+			yield Status
+
+	def __IsLong(self, text: str) -> bool:
+		"""
+		Проверяет, требуется ли разбиение текста на фрагменты.
+
+		:param text: Текст для перевода.
+		:type text: str
+		:return: Возвращает `True`, если текст необходимо переводить по фрагментам.
+		:rtype: bool
+		"""
+
+		return bool(self.__ChunksExecutor) and len(text) > self.__ChunkSize
+
 	def __GetRequest(self, mode: TranslationModes) -> str:
 		"""
 		Возвращает текст запроса к нейросети в зависимости от режима перевода.
@@ -67,10 +567,82 @@ class Translator:
 		"""Русско-зумерский переводчик."""
 
 		self.__NeuroHubOptions = None
+		self.__Requestor = None
+		self.__Executor = None
+		self.__InFlight = None
+		self.__Batcher = None
+		self.__Cache = None
+
+		self.__ChunksExecutor = None
+		self.__ChunkSize = 0
+		self.__ChunkRetries = 0
+
+		self.__Pending: dict[tuple[str, str], Future] = dict()
+		self.__PendingLock = threading.Lock()
+		self.__Coalesced = 0
+		self.__Requests = 0
+
+	def close(self):
+		"""Останавливает пул клиента NeuroHub."""
 
-	def set_neurohub_options(self, port: int, source: Literal["g4f", "gemini"], model: str, force_proxy: bool):
+		if self.__Executor: self.__Executor.shutdown(wait = False, cancel_futures = True)
+		if self.__ChunksExecutor: self.__ChunksExecutor.shutdown(wait = False, cancel_futures = True)
+		self.__Executor = None
+		self.__ChunksExecutor = None
+
+	def set_batching(self, window: float | None, size: int = 8, characters: int = 4000):
+		"""
+		Включает накопление запросов одного режима перевода в пакеты, отправляемые одним запросом к нейросети.
+
+		:param window: Время накопления пакета в секундах. `None` отключает накопление.
+		:type window: float | None
+		:param size: Максимальное количество текстов в пакете.
+		:type size: int
+		:param characters: Максимальная суммарная длина текстов пакета. Более длинные тексты переводятся одиночными запросами.
+		:type characters: int
 		"""
-		Задаёт опции [NeuroHub](https://github.com/DUB1401/NeuroHub).
+
+		self.__Batcher = Batcher(self.__GenerateBatch, window, size, characters) if window else None
+
+	def set_chunking(self, size: int, parallelism: int = 4, retries: int = 1):
+		"""
+		Включает разбиение длинных текстов на фрагменты, переводимые параллельно.
+
+		:param size: Максимальная длина фрагмента в символах. `0` отключает разбиение.
+		:type size: int
+		:param parallelism: Количество одновременно переводимых фрагментов.
+		:type parallelism: int
+		:param retries: Количество повторных попыток перевода фрагмента при ошибке.
+		:type retries: int
+		"""
+
+		if self.__ChunksExecutor: self.__ChunksExecutor.shutdown(wait = False)
+		self.__ChunksExecutor = ThreadPoolExecutor(max_workers = max(parallelism, 1), thread_name_prefix = "Chunks") if size > 0 else None
+		self.__ChunkSize = size
+		self.__ChunkRetries = max(retries, 0)
+
+	def set_cache(self, cache: ResultsCache | None):
+		"""
+		Задаёт кэш результатов перевода.
+
+		:param cache: Кэш результатов или `None` для отключения кэширования.
+		:type cache: ResultsCache | None
+		"""
+
+		self.__Cache = cache
+
+	def set_neurohub_options(
+			self,
+			port: int,
+			source: Literal["g4f", "gemini"],
+			model: str,
+			force_proxy: bool,
+			timeout: float = 60.0,
+			workers: int = 4,
+			max_in_flight: int = 32
+		):
+		"""
+		Задаёт опции [NeuroHub](https://github.com/DUB1401/NeuroHub) и создаёт постоянный клиент, переиспользуемый всеми переводами.
 
 		:param port: Порт общения.
 		:type port: int
@@ -80,11 +652,26 @@ class Translator:
 		:type model: str
 		:param force_proxy: Указывает, нужно ли обязательно использовать прокси для запросов к нейросети.
 		:type force_proxy: bool
+		:param timeout: Время ожидания ответа на один запрос в секундах.
+		:type timeout: float
+		:param workers: Количество потоков пула соединений. Рекомендуется задавать равным количеству потоков бота.
+		:type workers: int
+		:param max_in_flight: Максимальное количество одновременно выполняемых и ожидающих запросов.
+		:type max_in_flight: int
 		"""
 
-		self.__NeuroHubOptions = NeuroHubOptions(port, source, model, force_proxy)
+		self.close()
+		self.__NeuroHubOptions = NeuroHubOptions(port, source, model, force_proxy, timeout, workers, max_in_flight)
+
+		Settings = Options()
+		Settings.select_source(source)
+		Settings.set_model(model)
+		Settings.set_force_proxy(force_proxy)
+		self.__Requestor = Requestor(Settings, port = port)
+		self.__Executor = ThreadPoolExecutor(max_workers = max(workers, 1), thread_name_prefix = "NeuroHub")
+		self.__InFlight = threading.BoundedSemaphore(max(max_in_flight, 1))
 
-	def translate(self, mode: TranslationModes, text: str) -> ExecutionStatus:
+	def translate(self, mode: TranslationModes, text: str, use_cache: bool = True) -> ExecutionStatus:
 		"""
 		Переводит текст в выбранном режиме.
 
@@ -92,19 +679,119 @@ class Translator:
 		:type mode: TranslationModes
 		:param text: Текст для перевода.
 		:type text: str
-		:return: Контейнер результата.
+		:param use_cache: Указывает, нужно ли использовать кэш результатов.
+		:type use_cache: bool
+		:return: Контейнер результата. Под ключом _cached_ находится состояние: получен ли результат из кэша.
 		:rtype: ExecutionStatus
 		"""
 
-		Settings = Options()
-		Settings.select_source(self.__NeuroHubOptions.source)
-		Settings.set_model(self.__NeuroHubOptions.model)
-		Settings.set_force_proxy(self.__NeuroHubOptions.force_proxy)
-		Master = Requestor(Settings, port = self.__NeuroHubOptions.port)
-		Response = Master.generate(self.__GetRequest(mode) + "\n" + text)
+		Cache = self.__Cache if use_cache else None
+		Key = self.__GetCacheKey(mode, text) if Cache else None
+		Status = ExecutionStatus()
+		Status["cached"] = False
+
+		if Cache:
+			Value = Cache.get(Key)
+
+			if Value:
+				Status.code = 200
+				Status.value = Value
+				Status["cached"] = True
+				return Status
+
+		if self.__IsLong(text):
+			for Result in self.__IterateChunks(mode, text): pass
+			Status.merge(Result)
+
+		else: Status.merge(self.__Coalesce(mode, text))
+
+		if Cache and Status.code == 200 and Status.value: Cache.put(Key, Status.value)
 
+		return Status
+
+	async def translate_async(self, mode: TranslationModes, text: str, use_cache: bool = True) -> ExecutionStatus:
+		"""
+		Переводит текст в выбранном режиме, не занимая поток на время ожидания ответа нейросети. Вызывается из цикла событий.
+
+		Одиночные запросы ожидают ответа клиента NeuroHub как сопрограммы и не занимают потоки цикла событий. Однако клиент NeuroHub синхронный, поэтому одновременно к нейросети выполняется не более _workers_ запросов (пул потоков клиента), а остальные ожидают в его очереди; всего в работе и в очереди находится не более _max_in_flight_ переводов, сверх которых перевод сразу завершается с кодом _503_. Длинные тексты и пакетный режим выполняются синхронным переводом в пуле потоков цикла событий.
+
+		:param mode: Режим перевода.
+		:type mode: TranslationModes
+		:param text: Текст для перевода.
+		:type text: str
+		:param use_cache: Указывает, нужно ли использовать кэш результатов.
+		:type use_cache: bool
+		:return: Контейнер результата. Под ключом _cached_ находится состояние: получен ли результат из кэша.
+		:rtype: ExecutionStatus
+		"""
+
+		if self.__Batcher or self.__IsLong(text): return await asyncio.to_thread(self.translate, mode, text, use_cache)
+
+		Cache = self.__Cache if use_cache else None
+		Key = self.__GetCacheKey(mode, text) if Cache else None
 		Status = ExecutionStatus()
-		Status.code = Response.status_code
-		if Response.json: Status.value = Response.json.get("text")
+		Status["cached"] = False
+
+		if Cache:
+			Value = Cache.get(Key)
+
+			if Value:
+				Status.code = 200
+				Status.value = Value
+				Status["cached"] = True
+				return Status
+
+		Status.merge(await self.__CoalesceAsync(mode, text))
+		if Cache and Status.code == 200 and Status.value: Cache.put(Key, Status.value)
+
+		return Status
+
+	def translate_stream(self, mode: TranslationModes, text: str, use_cache: bool = True) -> Iterator[str | None]:
+		"""
+		Переводит текст в выбранном режиме, возвращая промежуточные результаты по мере генерации.
+
+		Если клиент NeuroHub не поддерживает потоковую генерацию, выполняется обычный перевод, результат которого возвращается одним фрагментом.
+
+		:param mode: Режим перевода.
+		:type mode: TranslationModes
+		:param text: Текст для перевода.
+		:type text: str
+		:param use_cache: Указывает, нужно ли использовать кэш результатов.
+		:type use_cache: bool
+		:return: Итератор накопленного к текущему моменту текста перевода. `None` последним элементом означает ошибку перевода, в том числе после части уже возвращённого текста.
+		:rtype: Iterator[str | None]
+		"""
+
+		Cache = self.__Cache if use_cache else None
+		Key = self.__GetCacheKey(mode, text) if Cache else None
+		Value = Cache.get(Key) if Cache else None
+
+		if Value:
+			yield Value
+			return
+
+		if self.__IsLong(text):
+			Result = None
+
+			for Result in self.__IterateChunks(mode, text): yield Result.value if Result else None
+			if Cache and Result: Cache.put(Key, Result.value)
+			return
+
+		if not self.is_streaming_supported:
+			Status = self.translate(mode, text, use_cache)
+			yield Status.value if Status else None
+			return
+
+		Text = str()
+
+		for Chunk in self.__Stream(self.__GetRequest(mode) + "\n" + text):
+
+			if Chunk is None:
+				yield None
+				return
+
+			if Chunk:
+				Text += Chunk
+				yield Text
 
-		return Status
\ No newline at end of file
+		if Cache and Text: Cache.put(Key, Text)
\ No newline at end of file
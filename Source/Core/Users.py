@@ -0,0 +1,304 @@
+from Source.Core.Statistics import Statistics
+from Source.Core.Metrics import METRICS
+
+from dublib.TelebotUtils import UserData, UsersManager
+from dublib.Methods.Filesystem import ListDir, ReadJSON
+
+from datetime import datetime
+from os import PathLike
+from typing import Any, Literal
+import threading
+import atexit
+import os
+
+from telebot import types
+import dateparser
+import orjson
+
+#==========================================================================================#
+# >>>>> ПРОВЕРКА СОВМЕСТИМОСТИ <<<<< #
+#==========================================================================================#
+
+# Менеджер с отложенной записью переопределяет загрузку пользователей и использует закрытые поля UsersManager и UserData из dublib 0.23.9.
+if not {"_UsersManager__Users", "_UsersManager__LoadUsers"} <= set(UsersManager.__init__.__code__.co_names) or "_UserData__Data" not in UserData.__init__.__code__.co_names:
+	raise ImportError("CachedUsersManager requires dublib==0.23.9: UsersManager or UserData internals have changed.")
+
+#==========================================================================================#
+# >>>>> ДОПОЛНИТЕЛЬНЫЕ СТРУКТУРЫ ДАННЫХ <<<<< #
+#==========================================================================================#
+
+class CachedUserData(UserData):
+	"""Данные пользователя, изменения которых записываются менеджером отложенно."""
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __init__(self, manager: "CachedUsersManager", user_id: int, data: dict | None = None):
+		"""
+		Данные пользователя с отложенной записью.
+
+		:param manager: Менеджер пользователей.
+		:type manager: CachedUsersManager
+		:param user_id: ID пользователя.
+		:type user_id: int
+		:param data: Сохранённые данные пользователя. При `None` данные считываются из файла пользователя, если он существует.
+		:type data: dict | None
+		"""
+
+		self.__Manager = manager
+		self.__IsLoading = data is not None
+		super().__init__(manager, user_id)
+		self.__IsLoading = False
+		if data is not None: self.load(data)
+
+	def dump(self) -> dict[str, Any]:
+		"""
+		Возвращает сериализуемую копию данных пользователя.
+
+		:return: Данные пользователя.
+		:rtype: dict[str, Any]
+		"""
+
+		Data = self._UserData__Data.copy()
+		Data["last_activity"] = str(Data["last_activity"]) if Data["last_activity"] else None
+
+		return Data
+
+	def load(self, data: dict[str, Any]):
+		"""
+		Заменяет данные пользователя сохранёнными, дополняя отсутствующие поля.
+
+		:param data: Сохранённые данные пользователя.
+		:type data: dict[str, Any]
+		"""
+
+		Defaults: dict = self._UserData__Data
+
+		for Key in Defaults.keys():
+			if Key not in data.keys(): data[Key] = Defaults[Key]
+
+		if data.get("last_activity"):
+			try: data["last_activity"] = datetime.fromisoformat(data["last_activity"])
+			except ValueError: data["last_activity"] = dateparser.parse(data["last_activity"]).replace(tzinfo = None)
+
+		self._UserData__Data = data
+
+	def refresh(self):
+		"""Считывает данные из файла пользователя и дополняет отсутствующие поля."""
+
+		if not self.__IsLoading: self.load(ReadJSON(self.path))
+
+	def save(self):
+		"""Помечает данные пользователя для записи при ближайшем сбросе изменений менеджером."""
+
+		if not self.__IsLoading: self.__Manager.mark_dirty(self.id)
+
+	def write(self):
+		"""Немедленно записывает данные пользователя в локальный файл."""
+
+		super().save()
+
+#==========================================================================================#
+# >>>>> ОСНОВНОЙ КЛАСС <<<<< #
+#==========================================================================================#
+
+class CachedUsersManager(UsersManager):
+	"""Менеджер пользователей с отложенной пакетной записью изменений в файлы пользователей или в единый журнал."""
+
+	#==========================================================================================#
+	# >>>>> СВОЙСТВА <<<<< #
+	#==========================================================================================#
+
+	@property
+	def dirty(self) -> int:
+		"""Количество пользователей с незаписанными изменениями."""
+
+		with self.__Lock: return len(self.__Dirty)
+
+	@property
+	def writes(self) -> int:
+		"""Количество выполненных записей данных пользователей."""
+
+		return self.__Writes
+
+	#==========================================================================================#
+	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def _UsersManager__LoadUsers(self):
+		"""Загружает данные пользователей из файлов или журнала."""
+
+		Users: dict[int, UserData] = self._UsersManager__Users
+		Files = [File for File in ListDir(self.storage_directory) if File.endswith(".json")]
+
+		if self.__Storage == "log" and os.path.exists(self.__LogPath):
+
+			with open(self.__LogPath, "rb") as FileReader:
+
+				for Line in FileReader:
+					if not Line.strip(): continue
+					Entry = orjson.loads(Line)
+					self.__Entries += 1
+
+					if Entry.get("deleted"): Users.pop(Entry["id"], None)
+					else: Users[Entry["id"]] = Entry["data"]
+
+			for UserID, Data in Users.items(): Users[UserID] = CachedUserData(self, UserID, Data)
+
+		else:
+			for File in Files:
+				UserID = int(File[:-5])
+				Users[UserID] = CachedUserData(self, UserID)
+
+			if self.__Storage == "log": self.__Dirty.update(Users.keys())
+
+	def __Compact(self):
+		"""Перезаписывает журнал текущими данными всех пользователей."""
+
+		Users: dict[int, CachedUserData] = self._UsersManager__Users
+		TemporaryPath = self.__LogPath + ".tmp"
+
+		with open(TemporaryPath, "wb") as FileWriter:
+			for UserID, User in tuple(Users.items()): FileWriter.write(orjson.dumps({"id": UserID, "data": User.dump()}) + b"\n")
+
+		os.replace(TemporaryPath, self.__LogPath)
+		self.__Entries = len(Users)
+
+	def __Run(self):
+		"""Периодически сбрасывает изменения до остановки менеджера."""
+
+		while not self.__Stop.wait(self.__FlushInterval):
+			try: self.flush()
+			except Exception as ExceptionData: print(ExceptionData)
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __init__(self, storage_directory: PathLike, flush_interval: float = 5.0, storage: Literal["files", "log"] = "files", statistics: Statistics | None = None):
+		"""
+		Менеджер пользователей с отложенной записью изменений.
+
+		Изменения данных пользователей накапливаются в памяти и записываются фоновым потоком раз в _flush_interval_ секунд, а также при завершении работы. Повторные изменения одного пользователя между сбросами приводят к одной записи.
+
+		:param storage_directory: Путь к каталогу файлов пользователей. Директория создаётся автоматически.
+		:type storage_directory: PathLike
+		:param flush_interval: Интервал сброса изменений в секундах.
+		:type flush_interval: float
+		:param storage: Способ хранения: _files_ – файл на каждого пользователя, _log_ – единый журнал _users.log_ в каталоге пользователей, дополняемый изменёнными записями и периодически сжимаемый. При первом запуске с журналом в него переносятся существующие файлы пользователей.
+		:type storage: Literal["files", "log"]
+		:param statistics: Счётчики статистики, в которых учитываются новые и активные пользователи.
+		:type statistics: Statistics | None
+		"""
+
+		self.__FlushInterval = max(flush_interval, 0.1)
+		self.__Storage = storage
+		self.__LogPath = os.path.join(storage_directory, "users.log")
+		self.__Dirty: set[int] = set()
+		self.__Lock = threading.Lock()
+		self.__FlushLock = threading.Lock()
+		self.__Entries = 0
+		self.__Writes = 0
+		self.__Statistics = statistics
+
+		super().__init__(storage_directory)
+		if statistics: statistics.seed("users", len(self._UsersManager__Users))
+
+		self.__Stop = threading.Event()
+		self.__Thread = threading.Thread(target = self.__Run, name = "UsersFlusher", daemon = True)
+		self.__Thread.start()
+		atexit.register(self.close)
+
+	def auth(self, user: types.User, update_activity: bool = True) -> UserData:
+		"""
+		Выполняет авторизацию пользователя в системе. Изменения данных записываются отложенно.
+
+		:param user: Структуры данных пользователя Telegram.
+		:type user: types.User
+		:param update_activity: Указывает, нужно ли обновить дату и время последней активности пользователя.
+		:type update_activity: bool
+		:raises ValueError: Выбрасывается при передаче неверного типа структуры данных пользователя.
+		:return: Данные пользователя.
+		:rtype: UserData
+		"""
+
+		Users: dict[int, UserData] = self._UsersManager__Users
+		if type(user) != types.User: return super().auth(user, update_activity)
+
+		with METRICS.timer("auth"):
+			IsNew = user.id not in Users
+			LastActivity = None if IsNew else Users[user.id].last_activity
+			if IsNew: Users[user.id] = CachedUserData(self, user.id)
+			CurrentUser = super().auth(user, update_activity)
+			if self.__Statistics and update_activity: self.__Statistics.register_activity(IsNew, LastActivity)
+
+		return CurrentUser
+
+	def close(self):
+		"""Останавливает фоновый поток и записывает накопленные изменения."""
+
+		self.__Stop.set()
+		self.flush()
+
+	def delete_user(self, user_id: int):
+		"""
+		Удаляет данные пользователя.
+
+		:param user_id: ID пользователя.
+		:type user_id: int
+		:raises KeyError: Выбрасывается при отсутствии пользователя с переданным ID.
+		"""
+
+		with self.__FlushLock:
+			with self.__Lock: self.__Dirty.discard(user_id)
+
+			if self.__Storage == "log":
+				del self._UsersManager__Users[user_id]
+				with open(self.__LogPath, "ab") as FileWriter: FileWriter.write(orjson.dumps({"id": user_id, "deleted": True}) + b"\n")
+				self.__Entries += 1
+
+			else:
+				User: CachedUserData = self._UsersManager__Users[user_id]
+				if not os.path.exists(User.path): User.write()
+				super().delete_user(user_id)
+
+		if self.__Statistics: self.__Statistics.increment("users", -1)
+
+	def flush(self):
+		"""Записывает накопленные изменения данных пользователей."""
+
+		with self.__FlushLock:
+
+			with self.__Lock:
+				Dirty = self.__Dirty
+				self.__Dirty = set()
+
+			Users: dict[int, CachedUserData] = self._UsersManager__Users
+			Dirty = [Users[UserID] for UserID in Dirty if UserID in Users]
+			if not Dirty: return
+
+			if self.__Storage == "log":
+
+				if self.__Entries + len(Dirty) > 2 * len(Users) + 1000: self.__Compact()
+
+				else:
+					with open(self.__LogPath, "ab") as FileWriter:
+						FileWriter.write(b"".join(orjson.dumps({"id": User.id, "data": User.dump()}) + b"\n" for User in Dirty))
+
+					self.__Entries += len(Dirty)
+
+			else:
+				for User in Dirty: User.write()
+
+			self.__Writes += len(Dirty)
+
+	def mark_dirty(self, user_id: int):
+		"""
+		Помечает данные пользователя для записи при ближайшем сбросе изменений.
+
+		:param user_id: ID пользователя.
+		:type user_id: int
+		"""
+
+		with self.__Lock: self.__Dirty.add(user_id)
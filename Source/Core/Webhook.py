@@ -0,0 +1,181 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+import hmac
+
+from telebot import TeleBot, types
+
+#==========================================================================================#
+# >>>>> ДОПОЛНИТЕЛЬНЫЕ СТРУКТУРЫ ДАННЫХ <<<<< #
+#==========================================================================================#
+
+class WebhookRequestHandler(BaseHTTPRequestHandler):
+	"""Обработчик HTTP-запросов с обновлениями Telegram."""
+
+	def do_POST(self):
+		"""Принимает обновление, подтверждает его получение и передаёт боту."""
+
+		Webhook: "WebhookServer" = self.server.webhook
+
+		if not Webhook.check(self.path, self.headers.get("X-Telegram-Bot-Api-Secret-Token")):
+			self.__Respond(403)
+			return
+
+		try: Length = int(self.headers.get("Content-Length", 0))
+		except ValueError: Length = -1
+
+		if Length < 0 or Length > Webhook.max_body_size:
+			self.__Respond(413)
+			return
+
+		Update = Webhook.parse(self.rfile.read(Length))
+		self.__Respond(200 if Update else 400)
+		if Update: Webhook.dispatch(Update)
+
+	def log_message(self, format: str, *args):
+		"""Отключает вывод журнала запросов."""
+
+		pass
+
+	def __Respond(self, code: int):
+		"""
+		Отправляет пустой ответ.
+
+		:param code: Код ответа.
+		:type code: int
+		"""
+
+		self.send_response(code)
+		self.send_header("Content-Length", "0")
+		self.end_headers()
+
+#==========================================================================================#
+# >>>>> ОСНОВНОЙ КЛАСС <<<<< #
+#==========================================================================================#
+
+class WebhookServer:
+	"""Локальный HTTP-сервер, принимающий обновления Telegram вместо их опроса."""
+
+	#==========================================================================================#
+	# >>>>> СВОЙСТВА <<<<< #
+	#==========================================================================================#
+
+	@property
+	def address(self) -> tuple[str, int]:
+		"""Адрес и порт, на которых принимаются обновления."""
+
+		return self.__Server.server_address[:2]
+
+	@property
+	def max_body_size(self) -> int:
+		"""Максимальный размер тела запроса в байтах."""
+
+		return self.__MaxBodySize
+
+	@property
+	def metrics(self) -> dict[str, int]:
+		"""Метрики сервера: _received_ – принято обновлений, _rejected_ – отклонено запросов с неверным путём или секретным токеном, _invalid_ – отклонено некорректных обновлений."""
+
+		with self.__Lock:
+			return {
+				"received": self.__Received,
+				"rejected": self.__Rejected,
+				"invalid": self.__Invalid
+			}
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __init__(self, bot: TeleBot, host: str = "127.0.0.1", port: int = 8443, path: str = "/", secret_token: str | None = None, max_body_size: int = 1048576):
+		"""
+		Локальный HTTP-сервер, принимающий обновления Telegram.
+
+		:param bot: Бот Telegram, обработчикам которого передаются обновления.
+		:type bot: TeleBot
+		:param host: Адрес для прослушивания.
+		:type host: str
+		:param port: Порт для прослушивания.
+		:type port: int
+		:param path: Путь, по которому принимаются обновления.
+		:type path: str
+		:param secret_token: Секретный токен, который Telegram передаёт в заголовке _X-Telegram-Bot-Api-Secret-Token_. При `None` заголовок не проверяется.
+		:type secret_token: str | None
+		:param max_body_size: Максимальный размер тела запроса в байтах.
+		:type max_body_size: int
+		"""
+
+		self.__Bot = bot
+		self.__Path = path
+		self.__SecretToken = secret_token or None
+		self.__MaxBodySize = max_body_size
+
+		self.__Lock = threading.Lock()
+		self.__Received = 0
+		self.__Rejected = 0
+		self.__Invalid = 0
+
+		self.__Server = ThreadingHTTPServer((host, port), WebhookRequestHandler)
+		self.__Server.daemon_threads = True
+		self.__Server.webhook = self
+
+	def check(self, path: str, secret_token: str | None) -> bool:
+		"""
+		Проверяет путь запроса и секретный токен.
+
+		:param path: Путь запроса.
+		:type path: str
+		:param secret_token: Переданный секретный токен.
+		:type secret_token: str | None
+		:return: Возвращает `True`, если запрос адресован серверу и подписан верным токеном.
+		:rtype: bool
+		"""
+
+		IsValid = path == self.__Path
+
+		if IsValid and self.__SecretToken:
+			IsValid = bool(secret_token) and hmac.compare_digest(secret_token.encode(), self.__SecretToken.encode())
+
+		if not IsValid:
+			with self.__Lock: self.__Rejected += 1
+
+		return IsValid
+
+	def close(self):
+		"""Останавливает сервер."""
+
+		self.__Server.shutdown()
+		self.__Server.server_close()
+
+	def dispatch(self, update: types.Update):
+		"""
+		Передаёт обновление обработчикам бота. При многопоточном боте обработчики выполняются в его пуле потоков.
+
+		:param update: Обновление Telegram.
+		:type update: types.Update
+		"""
+
+		with self.__Lock: self.__Received += 1
+
+		try: self.__Bot.process_new_updates([update])
+		except Exception as ExceptionData: print(ExceptionData)
+
+	def parse(self, body: bytes) -> types.Update | None:
+		"""
+		Разбирает тело запроса в обновление Telegram.
+
+		:param body: Тело запроса.
+		:type body: bytes
+		:return: Обновление или `None`, если тело запроса некорректно.
+		:rtype: types.Update | None
+		"""
+
+		try: return types.Update.de_json(body.decode("utf-8"))
+
+		except Exception:
+			with self.__Lock: self.__Invalid += 1
+			return None
+
+	def serve(self):
+		"""Принимает обновления до остановки сервера. Блокирует вызывающий поток."""
+
+		self.__Server.serve_forever()
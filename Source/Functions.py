@@ -1,24 +1,35 @@
 from Source.Core.Translator import TranslationModes, Translator
+from Source.Core.Moderator import ModerationVerdicts, Moderator
+from Source.Core.Subscriptions import SubscriptionsChecker
+from Source.Core.Recognition import RecognitionRejected
+from Source.Core.Cache import ResultsCache
+from Source.Core.Delayer import Delayer
+from Source.Core.Metrics import METRICS
 from Source.UI.Keyboards import InlineKeyboards
 
-from dublib.TelebotUtils import TeleCache, TeleMaster, UserData
-from dublib.Methods.Filesystem import ReadTextFile
+from dublib.TelebotUtils import TeleCache, UserData
 from dublib.Engine.Bus import ExecutionStatus
 
 from os import PathLike
-from time import sleep
+from functools import partial
+from time import monotonic
 
-from telebot import TeleBot, types
+from telebot import TeleBot, apihelper, types
 import requests
+import asyncio
 
-def AnswerToObscene(bot: TeleBot, user: UserData):
+SESSION = requests.Session()
+
+def AnswerToObscene(bot: TeleBot, user: UserData, delayer: Delayer):
 	"""
-	Отправляет ответ на нецензурные выражения.
+	Отправляет ответ на нецензурные выражения. Сообщения отправляются с паузами планировщиком, не занимая поток обработчика.
 
 	:param bot: Бот Telegram.
 	:type bot: TeleBot
 	:param user: Данные пользователя.
 	:type user: UserData
+	:param delayer: Планировщик отложенных вызовов.
+	:type delayer: Delayer
 	"""
 
 	Delay = 0.75
@@ -28,14 +39,14 @@ def AnswerToObscene(bot: TeleBot, user: UserData):
 		"Капец, ты инцел!"
 	)
 
-	for Index in range(len(Messages)):
-		bot.send_message(user.id, Messages[Index])
-		if Index < len(Messages) - 1: sleep(Delay)
+	delayer.chain(Delay, (partial(bot.send_message, user.id, Text) for Text in Messages))
 
-def CheckBlacklist(message: str, bot: TeleBot, cacher: TeleCache, user: UserData, autosend: bool = True) -> ExecutionStatus:
+def CheckBlacklist(message: str, bot: TeleBot, cacher: TeleCache, user: UserData, moderator: Moderator, autosend: bool = True) -> ExecutionStatus:
 	"""
 	Проверяет, соответствует ли текст сообщения строке из чёрного списка. Если соответствует, автоматически отправляет соответствующее сообщение.
 
+	За тот же проход модератор проверяет текст на нецензурную лексику, результат чего доступен в вердикте.
+
 	:param message: Текст сообщения.
 	:type message: str
 	:param bot: Бот Telegram.
@@ -44,20 +55,19 @@ def CheckBlacklist(message: str, bot: TeleBot, cacher: TeleCache, user: UserData
 	:type cacher: TeleCache
 	:param user: Данные пользователя.
 	:type user: User
+	:param moderator: Модератор текста.
+	:type moderator: Moderator
 	:param autosend: Указывает, нужно ли отправлять сообщение с требованием подписки.
 	:type autosend: bool
-	:return: Состояние: соответствует ли текст строке из чёрного списка. Под ключом _sended_ находится состояние отправки сообщения.
+	:return: Состояние: соответствует ли текст строке из чёрного списка. Под ключом _sended_ находится состояние отправки сообщения, а под ключом _verdict_ – вердикт модерации.
 	:rtype: ExecutionStatus
 	"""
 
-	Blacklist = ReadTextFile("Data/Materials/Text/blacklist_strings.txt", split = True, strip = True)
 	Status = ExecutionStatus()
-	Status.value = False
+	Status["verdict"] = moderator.check(message)
+	Status.value = Status["verdict"] == ModerationVerdicts.Blacklisted
 	Status["sended"] = False
 
-	for String in message.split("\n"):
-		if String in Blacklist: Status.value = True
-
 	if Status and autosend:
 		bot.send_animation(
 			chat_id = user.id,
@@ -70,18 +80,16 @@ def CheckBlacklist(message: str, bot: TeleBot, cacher: TeleCache, user: UserData
 
 	return Status
 
-def CheckSubscription(master: TeleMaster, cacher: TeleCache, user: UserData, subscriptions: dict[str, dict], autosend: bool = True) -> ExecutionStatus:
+def CheckSubscription(checker: SubscriptionsChecker, cacher: TeleCache, user: UserData, autosend: bool = True) -> ExecutionStatus:
 	"""
 	Проверяет, выполнил ли пользователь условия подписки.
 
-	:param master: Мастер-бот.
-	:type master: MasterBot
+	:param checker: Проверка подписок.
+	:type checker: SubscriptionsChecker
 	:param cacher: Менеджер кэша.
 	:type cacher: TeleCache
 	:param user: Данные пользователя.
 	:type user: User
-	:param subscriptions: Словарь с данными необходимых подписок, где ключ – название кнопки, а в словаре-значении имеется два поля: _id_ и _link_.
-	:type subscriptions: dict[str, dict]
 	:param autosend: Указывает, нужно ли отправлять сообщение с требованием подписки.
 	:type autosend: bool
 	:return: Состояние: выполнены ли условия подписки. Под ключом _sended_ находится состояние отправки сообщения.
@@ -89,7 +97,7 @@ def CheckSubscription(master: TeleMaster, cacher: TeleCache, user: UserData, sub
 	"""
 
 	Status = ExecutionStatus()
-	Status.value = master.check_user_subscriptions(user, tuple(subscriptions[Key]["id"] for Key in subscriptions.keys()))
+	with METRICS.timer("subscription"): Status.value = checker.check(user)
 	Status["sended"] = False
 
 	Caption = (
@@ -98,12 +106,12 @@ def CheckSubscription(master: TeleMaster, cacher: TeleCache, user: UserData, sub
 	)
 
 	if not Status and autosend:
-		master.bot.send_animation(
+		checker.master.bot.send_animation(
 			chat_id = user.id,
 			animation = cacher.get_real_cached_file("Data/Materials/Animation/subscribe.mp4", autoupload_type = types.InputMediaAnimation).file_id,
 			caption = "\n".join(Caption),
 			parse_mode = "HTML",
-			reply_markup = InlineKeyboards.Subscribe(subscriptions)
+			reply_markup = InlineKeyboards.Subscribe(checker.subscriptions)
 		)
 		Status["sended"] = True
 		
@@ -128,6 +136,185 @@ def DownloadFile(url: str, path: PathLike) -> bool:
 	
 	except: return False
 
+def DownloadBytes(url: str, chunk_size: int = 65536) -> bytes | None:
+	"""
+	Скачивает файл по ссылке в память, используя постоянное соединение.
+
+	:param url: Ссылка на файл.
+	:type url: str
+	:param chunk_size: Размер считываемого блока в байтах.
+	:type chunk_size: int
+	:return: Содержимое файла или `None` в случае ошибки.
+	:rtype: bytes | None
+	"""
+
+	try:
+		Buffer = bytearray()
+
+		with SESSION.get(url, stream = True, timeout = 30) as Response:
+			Response.raise_for_status()
+			for Chunk in Response.iter_content(chunk_size): Buffer += Chunk
+
+		return bytes(Buffer)
+	
+	except Exception as ExceptionData:
+		print(ExceptionData)
+		return None
+
+def GetFileURL(bot: TeleBot, file_path: str) -> str:
+	"""
+	Возвращает ссылку для скачивания файла Telegram с учётом переопределённого адреса сервера Bot API (`telebot.apihelper.FILE_URL`).
+
+	:param bot: Бот Telegram.
+	:type bot: TeleBot
+	:param file_path: Путь к файлу на сервере Telegram.
+	:type file_path: str
+	:return: Ссылка для скачивания файла.
+	:rtype: str
+	"""
+
+	return (apihelper.FILE_URL or "https://api.telegram.org/file/bot{0}/{1}").format(bot.token, file_path)
+
+def GetTranslationOutcome(result: ExecutionStatus) -> str:
+	"""
+	Возвращает исход перевода для метрик.
+
+	:param result: Контейнер результата перевода.
+	:type result: ExecutionStatus
+	:return: Исход: _cached_, _ok_, _busy_, _timeout_ или _error_.
+	:rtype: str
+	"""
+
+	if result: return "cached" if result["cached"] else "ok"
+
+	return {503: "busy", 504: "timeout"}.get(result.code, "error")
+
+def RecognizeVoice(bot: TeleBot, speecher: "Speecher", voice: types.Voice, cache: ResultsCache | None = None) -> str | None:
+	"""
+	Распознаёт речь в аудиосообщении. Результаты кэшируются по уникальному ID файла, поэтому пересланные аудиосообщения не скачиваются и не распознаются повторно.
+
+	:param bot: Бот Telegram.
+	:type bot: TeleBot
+	:param speecher: Преобразователь голоса в речь.
+	:type speecher: Speecher
+	:param voice: Данные аудиосообщения.
+	:type voice: types.Voice
+	:param cache: Кэш результатов распознавания.
+	:type cache: ResultsCache | None
+	:return: Распознанный текст или `None` в случае ошибки или отсутствия таковой.
+	:rtype: str | None
+	:raises RecognitionRejected: Выбрасывается при переполнении очереди распознавания.
+	"""
+
+	Key = (voice.file_unique_id,)
+	Text = cache.get(Key) if cache else None
+	if Text: return Text
+
+	with METRICS.timer("voice"):
+		FileInfo = bot.get_file(voice.file_id)
+		FileURL = GetFileURL(bot, FileInfo.file_path)
+		Text = speecher.recognize_url(FileURL, voice.duration)
+
+	METRICS.increment("voices", outcome = "ok" if Text else "empty")
+	if cache and Text: cache.put(Key, Text)
+
+	return Text
+
+async def RecognizeVoiceAsync(bot: TeleBot, speecher: "Speecher", voice: types.Voice, cache: ResultsCache | None = None) -> str | None:
+	"""
+	Распознаёт речь в аудиосообщении, не блокируя цикл событий. Результаты кэшируются по уникальному ID файла.
+
+	:param bot: Бот Telegram.
+	:type bot: TeleBot
+	:param speecher: Преобразователь голоса в речь.
+	:type speecher: Speecher
+	:param voice: Данные аудиосообщения.
+	:type voice: types.Voice
+	:param cache: Кэш результатов распознавания.
+	:type cache: ResultsCache | None
+	:return: Распознанный текст или `None` в случае ошибки или отсутствия таковой.
+	:rtype: str | None
+	:raises RecognitionRejected: Выбрасывается при переполнении очереди распознавания.
+	"""
+
+	Key = (voice.file_unique_id,)
+	Text = cache.get(Key) if cache else None
+	if Text: return Text
+
+	with METRICS.timer("voice"):
+		FileInfo = await asyncio.to_thread(bot.get_file, voice.file_id)
+		FileURL = GetFileURL(bot, FileInfo.file_path)
+		Text = await speecher.recognize_url_async(FileURL, voice.duration)
+
+	METRICS.increment("voices", outcome = "ok" if Text else "empty")
+	if cache and Text: cache.put(Key, Text)
+
+	return Text
+
+def ReplyVoice(bot: TeleBot, user: UserData, speecher: "Speecher", message: types.Message, cache: ResultsCache | None = None):
+	"""
+	Распознаёт аудиосообщение и отвечает на него распознанным текстом, а при переполнении очереди распознавания – сообщением о загруженности.
+
+	:param bot: Бот Telegram.
+	:type bot: TeleBot
+	:param user: Данные пользователя.
+	:type user: UserData
+	:param speecher: Преобразователь голоса в речь.
+	:type speecher: Speecher
+	:param message: Сообщение с аудиосообщением.
+	:type message: types.Message
+	:param cache: Кэш результатов распознавания.
+	:type cache: ResultsCache | None
+	"""
+
+	try: SendRecognizedText(bot, user, message, RecognizeVoice(bot, speecher, message.voice, cache))
+
+	except RecognitionRejected:
+		METRICS.increment("voices", outcome = "busy")
+		SendBusyMessage(bot, user)
+
+	except Exception as ExceptionData: print(ExceptionData)
+
+async def ReplyVoiceAsync(bot: TeleBot, user: UserData, speecher: "Speecher", message: types.Message, cache: ResultsCache | None = None):
+	"""
+	Распознаёт аудиосообщение и отвечает на него распознанным текстом, не блокируя цикл событий. При переполнении очереди распознавания отвечает сообщением о загруженности.
+
+	:param bot: Бот Telegram.
+	:type bot: TeleBot
+	:param user: Данные пользователя.
+	:type user: UserData
+	:param speecher: Преобразователь голоса в речь.
+	:type speecher: Speecher
+	:param message: Сообщение с аудиосообщением.
+	:type message: types.Message
+	:param cache: Кэш результатов распознавания.
+	:type cache: ResultsCache | None
+	"""
+
+	try: Text = await RecognizeVoiceAsync(bot, speecher, message.voice, cache)
+
+	except RecognitionRejected:
+		METRICS.increment("voices", outcome = "busy")
+		await asyncio.to_thread(SendBusyMessage, bot, user)
+		return
+
+	await asyncio.to_thread(SendRecognizedText, bot, user, message, Text)
+
+def SendBusyMessage(bot: TeleBot, user: UserData):
+	"""
+	Отправляет сообщение о перегрузке бота.
+
+	:param bot: Бот Telegram.
+	:type bot: TeleBot
+	:param user: Данные пользователя.
+	:type user: UserData
+	"""
+
+	bot.send_message(
+		chat_id = user.id,
+		text = "Бро, я сейчас загружен по полной. Попробуй чуть позже!"
+	)
+
 def SendModeSwitcher(bot: TeleBot, user: UserData):
 	"""
 	Отправляет переключатель режима перевода.
@@ -144,6 +331,28 @@ def SendModeSwitcher(bot: TeleBot, user: UserData):
 		reply_markup = InlineKeyboards.Switcher(user)
 	)
 
+def SendRecognizedText(bot: TeleBot, user: UserData, message: types.Message, text: str | None):
+	"""
+	Отправляет распознанный текст аудиосообщения в ответ на него.
+
+	:param bot: Бот Telegram.
+	:type bot: TeleBot
+	:param user: Данные пользователя.
+	:type user: UserData
+	:param message: Сообщение с аудиосообщением.
+	:type message: types.Message
+	:param text: Распознанный текст или `None`, если распознать его не удалось.
+	:type text: str | None
+	"""
+
+	bot.send_message(
+		chat_id = user.id,
+		text = text or "<i>Не удалось распознать текст.</i>",
+		parse_mode = "HTML",
+		reply_to_message_id = message.id,
+		reply_markup = InlineKeyboards.Translate()
+	)
+
 def SendShareMessage(bot: TeleBot, cacher: TeleCache, user: UserData):
 	"""
 	Отправляет сообщение для рекламной пересылки.
@@ -172,7 +381,7 @@ def SendShareMessage(bot: TeleBot, cacher: TeleCache, user: UserData):
 		reply_markup = InlineKeyboards.Share(Username)
 	)
 
-def TranslateText(bot: TeleBot, user: UserData, translator: "Translator", text: str):
+def TranslateText(bot: TeleBot, user: UserData, translator: "Translator", text: str, streaming: bool = False, edit_interval: float = 1.5):
 	"""
 	Обрабатывает перевод текста.
 
@@ -182,10 +391,79 @@ def TranslateText(bot: TeleBot, user: UserData, translator: "Translator", text:
 	:type user: UserData
 	:param text: Текст для перевода.
 	:type text: str
+	:param streaming: Указывает, нужно ли отправлять перевод по мере генерации, редактируя одно сообщение.
+	:type streaming: bool
+	:param edit_interval: Минимальный интервал между редактированиями сообщения в секундах.
+	:type edit_interval: float
 	"""
 
-	Result = translator.translate(mode = TranslationModes(user.get_property("mode")), text = text)
+	if streaming and translator.is_streaming_supported:
+		TranslateTextStreaming(bot, user, translator, text, edit_interval)
+		return
+
+	with METRICS.timer("translate"): Result = translator.translate(mode = TranslationModes(user.get_property("mode")), text = text)
+	METRICS.increment("translations", outcome = GetTranslationOutcome(Result))
 	bot.send_message(
 		chat_id = user.id,
 		text = Result.value if Result else "Ууупс… Не удалось выполнить перевод."
-	)
\ No newline at end of file
+	)
+
+async def TranslateTextAsync(bot: TeleBot, user: UserData, translator: "Translator", text: str):
+	"""
+	Обрабатывает перевод текста, не блокируя цикл событий на время ожидания ответа нейросети.
+
+	:param bot: Бот Telegram.
+	:type bot: TeleBot
+	:param user: Данные пользователя.
+	:type user: UserData
+	:param text: Текст для перевода.
+	:type text: str
+	"""
+
+	with METRICS.timer("translate"): Result = await translator.translate_async(mode = TranslationModes(user.get_property("mode")), text = text)
+	METRICS.increment("translations", outcome = GetTranslationOutcome(Result))
+	await asyncio.to_thread(
+		bot.send_message,
+		chat_id = user.id,
+		text = Result.value if Result else "Ууупс… Не удалось выполнить перевод."
+	)
+
+def TranslateTextStreaming(bot: TeleBot, user: UserData, translator: "Translator", text: str, edit_interval: float = 1.5):
+	"""
+	Обрабатывает потоковый перевод текста: отправляет первый фрагмент и дополняет сообщение редактированием не чаще заданного интервала. При ошибке перевода сообщение заменяется текстом об ошибке.
+
+	:param bot: Бот Telegram.
+	:type bot: TeleBot
+	:param user: Данные пользователя.
+	:type user: UserData
+	:param text: Текст для перевода.
+	:type text: str
+	:param edit_interval: Минимальный интервал между редактированиями сообщения в секундах.
+	:type edit_interval: float
+	"""
+
+	FailureText = "Ууупс… Не удалось выполнить перевод."
+	Message = None
+	SendedText = None
+	Partial = None
+	LastEdit = 0.0
+
+	for Partial in translator.translate_stream(mode = TranslationModes(user.get_property("mode")), text = text):
+
+		if Partial is None:
+			if Message: bot.edit_message_text(FailureText, user.id, Message.id)
+			else: bot.send_message(chat_id = user.id, text = FailureText)
+			return
+
+		if not Message:
+			Message = bot.send_message(chat_id = user.id, text = Partial)
+			SendedText = Partial
+			LastEdit = monotonic()
+
+		elif monotonic() - LastEdit >= edit_interval:
+			bot.edit_message_text(Partial, user.id, Message.id)
+			SendedText = Partial
+			LastEdit = monotonic()
+
+	if not Message: bot.send_message(chat_id = user.id, text = FailureText)
+	elif Partial != SendedText: bot.edit_message_text(Partial, user.id, Message.id)
\ No newline at end of file
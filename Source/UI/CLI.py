@@ -1,4 +1,4 @@
-from dublib.CLI.Terminalyzer import Command
+from dublib.CLI.Terminalyzer import Command, ParametersTypes
 
 COMMANDS: list[Command] = list()
 
@@ -12,6 +12,14 @@ ComPos = Com.create_position("MODE", "Режим перевода.", important =
 ComPos.add_flag("from", "С зумерского на нормальный.")
 ComPos.add_flag("to", "С нормального на зумерский.")
 Com.base.add_flag("json", "Prints result as JSON string.")
+Com.base.add_flag("no-cache", "Отключает использование кэша переводов.")
+COMMANDS.append(Com)
+
+Com = Command("profile", "Запускает профилирование работающего бота.")
+Com.base.add_key("seconds", ParametersTypes.Number, "Длительность профилирования в секундах (по умолчанию 30).")
+COMMANDS.append(Com)
+
+Com = Command("stats", "Выводит сводку статистики бота.")
 COMMANDS.append(Com)
 
 Com = Command("validate", "Проводит проверку наличия материалов.")
@@ -1,23 +1,36 @@
-from Source.UI.Keyboards import InlineKeyboards, ReplyKeyboards
+from Source.UI.Keyboards import ReplyKeyboards
 from Source.Core.Translator import TranslationModes, Translator
+from Source.Core.Moderator import ModerationVerdicts, Moderator
+from Source.Core.Subscriptions import SubscriptionsChecker
 from Source.Core.Materials import MaterialsValidator
+from Source.Core.Webhook import WebhookServer
+from Source.Core.Runtime import AsyncRuntime
+from Source.Core.Dispatcher import Dispatcher
+from Source.Core.Scheduler import JobKinds, Scheduler
+from Source.Core.Delayer import Delayer
+from Source.Core.Decoder import DecoderBackends
+from Source.Core.Segmenter import Segmenter
+from Source.Core.Cache import ResultsCache
+from Source.Core.Users import CachedUsersManager
+from Source.Core.Statistics import Statistics
+from Source.Core.Metrics import METRICS, MetricsServer
+from Source.Core.Profiler import SamplingProfiler
 from Source.TeleBotAdminPanel import Panel, Modules
 from Source.TeleBotAdminPanel import Panel
 from Source.Core.Speecher import Speecher
 from Source.UI.CLI import COMMANDS
 from Source import Functions
 
-from dublib.TelebotUtils import TeleCache, TeleMaster, UsersManager
+from dublib.TelebotUtils import TeleCache, TeleMaster, UserData
 from dublib.Methods.System import CheckPythonMinimalVersion, Clear
 from dublib.Methods.Filesystem import MakeRootDirectories
 from dublib.CLI.Terminalyzer import Terminalyzer
 from dublib.Engine.Configurator import Config
 
-import shutil
-import os
-
 from badwords import ProfanityFilter
 from telebot import types
+import multiprocessing
+import requests
 import telebot
 import orjson
 
@@ -26,10 +39,12 @@ import orjson
 #==========================================================================================#
 
 Directories = (
+	"Data/Cache",
 	"Data/Materials",
 	"Data/Materials/Animation",
 	"Data/Materials/Photo",
 	"Data/Materials/Text",
+	"Data/Profiles",
 )
 
 Clear()
@@ -45,9 +60,34 @@ TranslatorObject.set_neurohub_options(
 	port = NeuroHubOptions["port"],
 	source = NeuroHubOptions["source"],
 	model = NeuroHubOptions["model"],
-	force_proxy = NeuroHubOptions["force_proxy"]
+	force_proxy = NeuroHubOptions["force_proxy"],
+	timeout = NeuroHubOptions["timeout"],
+	workers = Settings["threads"],
+	max_in_flight = NeuroHubOptions["max_in_flight"]
+)
+
+TranslatorObject.set_chunking(
+	size = NeuroHubOptions["chunking"]["size"],
+	parallelism = NeuroHubOptions["chunking"]["parallelism"],
+	retries = NeuroHubOptions["chunking"]["retries"]
 )
 
+if NeuroHubOptions["batching"]["enabled"]: TranslatorObject.set_batching(
+	window = NeuroHubOptions["batching"]["window"],
+	size = NeuroHubOptions["batching"]["size"],
+	characters = NeuroHubOptions["batching"]["characters"]
+)
+
+TranslationCacheOptions: dict = Settings["translation_cache"]
+
+if TranslationCacheOptions["enabled"]:
+	TranslatorObject.set_cache(ResultsCache(
+		memory_size = TranslationCacheOptions["memory_size"],
+		ttl = TranslationCacheOptions["ttl"],
+		path = "Data/Cache/translations.sqlite" if TranslationCacheOptions["persistent"] else None,
+		storage_size = TranslationCacheOptions["storage_size"]
+	))
+
 #==========================================================================================#
 # >>>>> ОБРАБОТКА АРГУМЕНТОВ ЗАПУСКА <<<<< #
 #==========================================================================================#
@@ -69,9 +109,22 @@ if CommandData and CommandData.name:
 			MaterialsValidator().validate()
 			Cased = True
 
+		case "profile":
+			MetricsOptions: dict = Settings["metrics"]
+			Duration = CommandData.get_key_value("seconds") or 30
+
+			try: print(requests.post(f"http://{MetricsOptions['host']}:{MetricsOptions['port']}/profile", params = {"duration": Duration}, timeout = 5).text.strip())
+			except requests.RequestException: print("Не удалось связаться с ботом. Убедитесь, что он запущен, а профилировщик включён.")
+
+			Cased = True
+
+		case "stats":
+			print(Statistics(autoflush = False).summary())
+			Cased = True
+
 		case "translate":
 			Mode = TranslationModes.From if CommandData.check_key("from") else TranslationModes.To
-			Result = TranslatorObject.translate(Mode, CommandData.arguments[0])
+			Result = TranslatorObject.translate(Mode, CommandData.arguments[0], use_cache = not CommandData.check_flag("no-cache"))
 			Result = {
 				"code": Result.code,
 				"text": Result.value,
@@ -83,22 +136,110 @@ if CommandData and CommandData.name:
 
 		case _: Cased = False
 
-	if Cased: exit(0)
+	if Cased:
+		TranslatorObject.close()
+		exit(0)
 
 #==========================================================================================#
 # >>>>> ИНИЦИАЛИЗАЦИЯ ОБЪЕКТОВ <<<<< #
 #==========================================================================================#
 
-Bot = telebot.TeleBot(Settings["bot_token"])
-Master = TeleMaster(Bot)
-UsersManagerObject = UsersManager("Data/Users")
+RecognitionOptions: dict = Settings["recognition"]
+SegmentationOptions: dict = RecognitionOptions["segmentation"]
+DecoderOptions: dict = Settings["decoder"]
+ProfilerOptions: dict = Settings["profiler"]
+ProfilerObject = SamplingProfiler(
+	interval = ProfilerOptions["interval"],
+	max_duration = ProfilerOptions["max_duration"],
+	event = multiprocessing.get_context("fork").Event()
+) if ProfilerOptions["enabled"] else None
+SpeecherObject = Speecher(
+	Settings["vosk_model"],
+	use_ffmpeg = Settings["use_ffmpeg"],
+	workers = RecognitionOptions["workers"],
+	queue_size = RecognitionOptions["queue_size"],
+	timeout = RecognitionOptions["timeout"],
+	segmenter = Segmenter(SegmentationOptions["segment"], SegmentationOptions["overlap"]) if SegmentationOptions["segment"] else None,
+	parallelism = SegmentationOptions["parallelism"],
+	recognizers = RecognitionOptions["recognizers"],
+	warmup = RecognitionOptions["warmup"],
+	decoder = DecoderBackends(DecoderOptions["backend"]) if DecoderOptions["backend"] else None,
+	tempo = DecoderOptions["tempo"],
+	profiler = ProfilerObject
+)
+VoiceCacheOptions: dict = Settings["voice_cache"]
+VoiceCache = ResultsCache(
+	memory_size = VoiceCacheOptions["memory_size"],
+	path = "Data/Cache/voice.sqlite",
+	storage_size = VoiceCacheOptions["storage_size"],
+	namespace = Settings["vosk_model"]
+) if VoiceCacheOptions["enabled"] else None
+Bot = telebot.TeleBot(Settings["bot_token"], num_threads = Settings["threads"])
+OutboundOptions: dict = Settings["outbound"]
+Outbound = Dispatcher(
+	Bot,
+	rate = OutboundOptions["rate"],
+	chat_rate = OutboundOptions["chat_rate"],
+	chat_burst = OutboundOptions["chat_burst"],
+	workers = OutboundOptions["workers"],
+	retries = OutboundOptions["retries"]
+)
+DelayerObject = Delayer()
+Master = TeleMaster(Outbound)
+SubscriptionsCacheOptions: dict = Settings["subscriptions_cache"]
+Subscriptions = SubscriptionsChecker(
+	Master,
+	Settings["subscriptions"],
+	positive_ttl = SubscriptionsCacheOptions["positive_ttl"],
+	negative_ttl = SubscriptionsCacheOptions["negative_ttl"]
+)
+StatisticsOptions: dict = Settings["statistics"]
+StatisticsObject = Statistics(flush_interval = StatisticsOptions["flush_interval"], days = StatisticsOptions["days"])
+StatisticsObject.attach_cache("translation_cache", TranslatorObject.cache)
+StatisticsObject.attach_cache("voice_cache", VoiceCache)
+UsersOptions: dict = Settings["users"]
+UsersManagerObject = CachedUsersManager(
+	"Data/Users",
+	flush_interval = UsersOptions["flush_interval"],
+	storage = UsersOptions["storage"],
+	statistics = StatisticsObject
+)
 Cacher = TeleCache()
 Cacher.set_bot(Bot)
 Cacher.set_chat_id(Settings["cache_chat_id"])
 ProfanityFilterObject = ProfanityFilter()
 ProfanityFilterObject.init(["ru", "en"])
+ModeratorObject = Moderator("Data/Materials/Text/blacklist_strings.txt", ProfanityFilterObject)
 AdminPanel = Panel(Bot, UsersManagerObject, Settings["password"])
-SpeecherObject = Speecher(Settings["vosk_model"])
+SchedulerOptions: dict = Settings["scheduler"]
+SchedulerObject = Scheduler(
+	workers = SchedulerOptions["workers"],
+	user_limit = SchedulerOptions["user_limit"],
+	user_queue_size = SchedulerOptions["user_queue_size"],
+	queue_size = SchedulerOptions["queue_size"],
+	text_weight = SchedulerOptions["text_weight"]
+)
+AsyncRuntimeOptions: dict = Settings["async_runtime"]
+Runtime = AsyncRuntime(AsyncRuntimeOptions["workers"]) if AsyncRuntimeOptions["enabled"] and not Settings["streaming"]["enabled"] else None
+
+#==========================================================================================#
+# >>>>> ИНИЦИАЛИЗАЦИЯ МЕТРИК <<<<< #
+#==========================================================================================#
+
+MetricsOptions: dict = Settings["metrics"]
+
+if MetricsOptions["enabled"]:
+	METRICS.enable()
+	METRICS.gauge("scheduler_queued", lambda: SchedulerObject.metrics["queued"])
+	METRICS.gauge("scheduler_running", lambda: SchedulerObject.metrics["running"])
+	METRICS.gauge("outbound_queued", lambda: Outbound.metrics["queued"])
+	METRICS.gauge("delayer_pending", lambda: DelayerObject.pending)
+	METRICS.gauge("users_dirty", lambda: UsersManagerObject.dirty)
+	if SpeecherObject.pool: METRICS.gauge("recognition_queued", lambda: SpeecherObject.pool.metrics["queued"])
+	if SpeecherObject.pool: METRICS.gauge("recognition_stalled", lambda: SpeecherObject.pool.metrics["stalled"])
+	if Runtime: METRICS.gauge("runtime_in_flight", lambda: Runtime.metrics["in_flight"])
+
+if MetricsOptions["enabled"] or ProfilerObject: MetricsServerObject = MetricsServer(METRICS, MetricsOptions["host"], MetricsOptions["port"], ProfilerObject)
 
 #==========================================================================================#
 # >>>>> ИНИЦИАЛИЗАЦИЯ ПАНЕЛИ УПРАВЛЕНИЯ <<<<< #
@@ -106,8 +247,54 @@ SpeecherObject = Speecher(Settings["vosk_model"])
 
 AdminPanel = Panel(Bot, UsersManagerObject, Settings["password"])
 
+def GetPanelChatID(args: tuple) -> int | None:
+	"""
+	Определяет чат администратора по сообщению, запросу обратного вызова или данным пользователя среди аргументов вызова модуля панели управления.
+
+	:param args: Аргументы вызова модуля.
+	:type args: tuple
+	:return: ID чата или `None`, если он не найден.
+	:rtype: int | None
+	"""
+
+	for Argument in args:
+		if isinstance(Argument, types.CallbackQuery): Argument = Argument.message
+		if isinstance(Argument, types.Message): return Argument.chat.id
+		if isinstance(Argument, UserData): return Argument.id
+
+	return None
+
+def SM_Metrics(*args):
+	"""Отправляет администратору сводку длительностей этапов обработки и ошибок."""
+
+	ChatID = GetPanelChatID(args)
+	if ChatID is not None: Outbound.send_message(chat_id = ChatID, text = METRICS.summary())
+
+def SM_Profiling(*args):
+	"""Запускает профилирование на _panel_duration_ секунд и по завершении отправляет администратору путь к файлу профиля."""
+
+	ChatID = GetPanelChatID(args)
+	if ChatID is None: return
+
+	if not ProfilerObject:
+		Outbound.send_message(chat_id = ChatID, text = "Профилировщик отключён.")
+		return
+
+	Duration = ProfilerOptions["panel_duration"]
+	Report = lambda Path: Outbound.send_message(chat_id = ChatID, text = f"Профиль сохранён: {Path}" if Path else "Не удалось сохранить профиль.")
+	if ProfilerObject.start(Duration, Report): Outbound.send_message(chat_id = ChatID, text = f"Профилирование запущено на {min(Duration, ProfilerOptions['max_duration']):g} с.")
+	else: Outbound.send_message(chat_id = ChatID, text = "Профилирование уже выполняется.")
+
+def SM_Statistics(*args):
+	"""Отправляет администратору сводку статистики из счётчиков без перебора хранилища пользователей."""
+
+	ChatID = GetPanelChatID(args)
+	if ChatID is not None: Outbound.send_message(chat_id = ChatID, text = StatisticsObject.summary())
+
 TBAP_TREE = {
-	"📊 Статистика": Modules.SM_Statistics,
+	"📊 Статистика": SM_Statistics,
+	"📈 Метрики": SM_Metrics,
+	"⏱ Профилирование": SM_Profiling,
 	"❌ Закрыть": Modules.SM_Close
 }
 
@@ -136,7 +323,7 @@ def Command(Message: types.Message):
 		"<i>" + "Поддерживает голосовой ввод" + "</i>"
 	)
 
-	Bot.send_animation(
+	Outbound.send_animation(
 		chat_id = User.id,
 		animation = Cacher.get_real_cached_file("Data/Materials/Animation/start.mp4", autoupload_type = types.InputMediaAnimation).file_id,
 		caption = "\n".join(Caption),
@@ -152,14 +339,16 @@ def Command(Message: types.Message):
 def Text(Message: types.Message):
 	User = UsersManagerObject.auth(Message.from_user)
 	if AdminPanel.procedures.text(Message): return
-	Functions.CheckSubscription(Master, Cacher, User, Settings["subscriptions"])
+	Functions.CheckSubscription(Subscriptions, Cacher, User)
 
 	#---> Проверка чёрного списка и нецензурной лексики.
 	#==========================================================================================#
-	if Functions.CheckBlacklist(Message.text, Bot, Cacher, User): return
+	Moderation = Functions.CheckBlacklist(Message.text, Outbound, Cacher, User, ModeratorObject)
+	if Moderation["verdict"] != ModerationVerdicts.Clean: StatisticsObject.increment(Moderation["verdict"].value)
+	if Moderation: return
 
-	if ProfanityFilterObject.filter_text(Message.text):
-		Functions.AnswerToObscene(Bot, User)
+	if Moderation["verdict"] == ModerationVerdicts.Obscene:
+		Functions.AnswerToObscene(Outbound, User, DelayerObject)
 		return
 	
 	#---> Обработка Reply-кнопок.
@@ -167,14 +356,25 @@ def Text(Message: types.Message):
 	CaseBuffer = Message.text[2:] if len(Message.text) > 2 else None
 
 	match CaseBuffer:
-		case "Поделиться с друзьям": Functions.SendShareMessage(Bot, Cacher, User)
-		case "Переключить режим": Functions.SendModeSwitcher(Bot, User)
+		case "Поделиться с друзьям": Functions.SendShareMessage(Outbound, Cacher, User)
+		case "Переключить режим": Functions.SendModeSwitcher(Outbound, User)
 
 		#---> Перевод.
 		#==========================================================================================#
 		case _:
-			Bot.send_chat_action(User.id, "typing")
-			Functions.TranslateText(Bot, User, TranslatorObject, Message.text)
+			Outbound.send_chat_action(User.id, "typing")
+			if Runtime: IsAccepted = SchedulerObject.submit(User.id, JobKinds.Text, Runtime.call, Functions.TranslateTextAsync, Outbound, User, TranslatorObject, Message.text)
+			else: IsAccepted = SchedulerObject.submit(User.id, JobKinds.Text, Functions.TranslateText, Outbound, User, TranslatorObject, Message.text, Settings["streaming"]["enabled"], Settings["streaming"]["edit_interval"])
+			if IsAccepted: StatisticsObject.increment("translations_" + User.get_property("mode"))
+			else: Functions.SendBusyMessage(Outbound, User)
+
+#==========================================================================================#
+# >>>>> ОБРАБОТКА ИЗМЕНЕНИЙ УЧАСТНИКОВ ЧАТОВ <<<<< #
+#==========================================================================================#
+
+@Bot.chat_member_handler()
+def ChatMember(Update: types.ChatMemberUpdated):
+	if Update.chat.id in Subscriptions.chats: Subscriptions.invalidate(Update.new_chat_member.user.id)
 
 #==========================================================================================#
 # >>>>> ОБРАБОТКА INLINE-КНОПОК <<<<< #
@@ -186,10 +386,11 @@ AdminPanel.decorators.inline_keyboards()
 def InlineButton(Call: types.CallbackQuery):
 	User = UsersManagerObject.auth(Call.from_user)
 	Bot.answer_callback_query(Call.id)
-	if not Functions.CheckSubscription(Master, Cacher, User, Settings["subscriptions"], autosend = False): return
+	Subscriptions.invalidate(User.id)
+	if not Functions.CheckSubscription(Subscriptions, Cacher, User, autosend = False): return
 	Master.safely_delete_messages(User.id, Call.message.id)
 
-	Bot.send_animation(
+	Outbound.send_animation(
 		chat_id = User.id,
 		animation = Cacher.get_real_cached_file("Data/Materials/Animation/after_subscribe.mp4", autoupload_type = types.InputMediaAnimation).file_id,
 		caption = "<b><i>" + "- Ну все, удачки в пользовании!)" + "</i></b>",
@@ -210,8 +411,11 @@ def InlineButton(Call: types.CallbackQuery):
 def InlineButton(Call: types.CallbackQuery):
 	User = UsersManagerObject.auth(Call.from_user)
 	Bot.answer_callback_query(Call.id)
-	Bot.send_chat_action(User.id, "typing")
-	Functions.TranslateText(Bot, User, TranslatorObject, Call.message.text)
+	Outbound.send_chat_action(User.id, "typing")
+	if Runtime: IsAccepted = SchedulerObject.submit(User.id, JobKinds.Text, Runtime.call, Functions.TranslateTextAsync, Outbound, User, TranslatorObject, Call.message.text)
+	else: IsAccepted = SchedulerObject.submit(User.id, JobKinds.Text, Functions.TranslateText, Outbound, User, TranslatorObject, Call.message.text, Settings["streaming"]["enabled"], Settings["streaming"]["edit_interval"])
+	if IsAccepted: StatisticsObject.increment("translations_" + User.get_property("mode"))
+	else: Functions.SendBusyMessage(Outbound, User)
 
 #==========================================================================================#
 # >>>>> ОБРАБОТКА МЕДИА-ВЛОЖЕНИЙ <<<<< #
@@ -222,25 +426,38 @@ def File(Message: types.Message):
 	User = UsersManagerObject.auth(Message.from_user)
 
 	if Message.voice:
+		if Runtime: IsAccepted = SchedulerObject.submit(User.id, JobKinds.Voice, Runtime.call, Functions.ReplyVoiceAsync, Outbound, User, SpeecherObject, Message, VoiceCache)
+		else: IsAccepted = SchedulerObject.submit(User.id, JobKinds.Voice, Functions.ReplyVoice, Outbound, User, SpeecherObject, Message, VoiceCache)
+		if IsAccepted: StatisticsObject.increment("voice")
+		else: Functions.SendBusyMessage(Outbound, User)
+
+#==========================================================================================#
+# >>>>> ЗАПУСК <<<<< #
+#==========================================================================================#
+
+AllowedUpdates = ["message", "callback_query", "chat_member"]
+
+match Settings["run_mode"]:
+
+	case "webhook":
+		WebhookOptions: dict = Settings["webhook"]
+
+		if WebhookOptions["url"]: Bot.set_webhook(
+			url = WebhookOptions["url"],
+			allowed_updates = AllowedUpdates,
+			secret_token = WebhookOptions["secret_token"] or None,
+			max_connections = WebhookOptions["max_connections"]
+		)
+
+		WebhookServerObject = WebhookServer(
+			Bot,
+			host = WebhookOptions["host"],
+			port = WebhookOptions["port"],
+			path = WebhookOptions["path"],
+			secret_token = WebhookOptions["secret_token"]
+		)
+		WebhookServerObject.serve()
 
-		try:
-			FileInfo = Bot.get_file(Message.voice.file_id)
-			FileURL = "https://api.telegram.org/file/bot" + Settings["bot_token"] + f"/{FileInfo.file_path}"
-			UserTempDirectory = f"Data/Temp/{User.id}"
-			if not os.path.exists(UserTempDirectory): os.makedirs(UserTempDirectory)
-			VoicePath = f"Data/Temp/{User.id}/{FileInfo.file_id}.ogg"
-			Functions.DownloadFile(FileURL, VoicePath)
-			if SpeecherObject.ogg_to_wav(VoicePath): VoicePath = VoicePath[:-4] + ".wav"
-
-			Bot.send_message(
-				chat_id = User.id,
-				text = SpeecherObject.recognize_speech(VoicePath) or "<i>Не удалось распознать текст.</i>",
-				parse_mode = "HTML",
-				reply_to_message_id = Message.id,
-				reply_markup = InlineKeyboards.Translate()
-			)
-		except Exception as ExceptionData: print(ExceptionData)
-
-		if os.path.exists(UserTempDirectory): shutil.rmtree(UserTempDirectory)
-
-Bot.infinity_polling()
\ No newline at end of file
+	case _:
+		Bot.remove_webhook()
+		Bot.infinity_polling(allowed_updates = AllowedUpdates)
\ No newline at end of file